@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark: random patch access, .syx bank dumps vs. memory-mapped bank files
+
+Writes the same banks (built from the captured patches) once as .syx dumps
+of 100 read responses and once as BankFiles in a temporary directory, then
+reads one random patch name from a random bank: by scanning the .syx dump
+for that patch's read response, and by opening the BankFile and reading the
+slot.
+
+Usage:
+    python benchmarks/bench_bankfile.py
+"""
+
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from common import load_capture_patches, report
+
+from zoomg9 import BankFile, PatchBank, PatchView, iter_patches
+
+BANKS = 400
+LOOKUPS = 2000
+
+
+def syx_lookup(path: Path, patch_num: int) -> str:
+    with open(path, "rb") as f:
+        for num, data in iter_patches(f):
+            if num == patch_num:
+                return PatchView(data).name
+    raise KeyError(patch_num)
+
+
+def bankfile_lookup(path: Path, patch_num: int) -> str:
+    with BankFile(path) as bank:
+        return bank.name(patch_num)
+
+
+def timed(func, lookups) -> float:
+    """Lookups per second."""
+    start = time.perf_counter()
+    for path, patch_num in lookups:
+        func(path, patch_num)
+    return len(lookups) / (time.perf_counter() - start)
+
+
+def main():
+    patches = load_capture_patches()
+    rnd = random.Random(1)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        for n in range(BANKS):
+            bank = PatchBank.from_patches(rnd.sample(patches, 100))
+            with BankFile.create(directory / f"bank_{n}.g9b", bank) as bank_file:
+                bank_file.to_syx(directory / f"bank_{n}.syx")
+
+        lookups = [(rnd.randrange(BANKS), rnd.randrange(100)) for _ in range(LOOKUPS)]
+        syx = [(directory / f"bank_{b}.syx", p) for b, p in lookups]
+        g9b = [(directory / f"bank_{b}.g9b", p) for b, p in lookups]
+        for a, b in zip(syx[:50], g9b[:50]):
+            assert syx_lookup(*a) == bankfile_lookup(*b)
+
+        before = timed(syx_lookup, syx)
+        after = timed(bankfile_lookup, g9b)
+
+    print(f"Random patch name lookup ({BANKS} banks)")
+    report(".syx scan -> BankFile", before, after, "lookups/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Benchmark: batch nibble / 7-bit codecs vs. per-patch calls
+
+Decodes and encodes whole 100-patch banks, comparing a loop over the
+single-patch functions with the *_batch variants.
+
+Usage:
+    python benchmarks/bench_batch_codecs.py
+"""
+
+from common import load_capture_patches, rate, report
+
+from zoomg9 import encoding
+from zoomg9.constants import PATCH_COUNT
+
+
+def per_patch(func, size):
+    """Wrap a single-patch codec to process a whole bank buffer."""
+    def run(bank):
+        return b"".join(func(bank[i:i + size]) for i in range(0, len(bank), size))
+    return run
+
+
+def main():
+    patches = load_capture_patches()
+    raw = b"".join(patches[i % len(patches)] for i in range(PATCH_COUNT))
+    nibbles = encoding.encode_nibbles_batch(raw)
+    seven = encoding.encode_7bit_batch(raw)
+    backend = "NumPy" if encoding.np is not None else "pure Python"
+
+    print(f"Batch codec benchmark (100-patch banks, {backend} backend)")
+    cases = [
+        ("decode_nibbles", encoding.decode_nibbles, encoding.decode_nibbles_batch, nibbles, 256),
+        ("encode_nibbles", encoding.encode_nibbles, encoding.encode_nibbles_batch, raw, 128),
+        ("decode_7bit", encoding.decode_7bit, encoding.decode_7bit_batch, seven, 147),
+        ("encode_7bit", encoding.encode_7bit, encoding.encode_7bit_batch, raw, 128),
+    ]
+    for label, single, batch, bank, size in cases:
+        loop = per_patch(single, size)
+        assert loop(bank) == batch(bank)
+        before = rate(loop, [bank]) * PATCH_COUNT
+        after = rate(batch, [bank]) * PATCH_COUNT
+        report(label, before, after)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark: compiled BIT_TBL codec vs. the original per-bit loops
+
+Measures patches per second for unpack/pack of the bit-packed area and for
+full Patch.from_bytes / to_bytes round trips, single-field reads
+through Patch.from_bytes vs. a lazy PatchView, and batch edits serialized
+by a full repack vs. the incremental to_bytes(). The original loop-based
+implementation is kept here as the reference, and results are checked for
+equality before timing.
+
+Usage:
+    python benchmarks/bench_bitfields.py
+"""
+
+from common import load_capture_patches, rate, report
+
+from zoomg9 import Patch, PatchView, pack_bits, unpack_bits
+from zoomg9.constants import BIT_TBL
+
+
+def legacy_unpack_bits(packed_data: bytes) -> list:
+    """Original cell-by-cell implementation (reference)."""
+    matrix = [[0] * 8 for _ in range(12)]
+    bit_pos = 0
+    for row in range(12):
+        for col in range(8):
+            num_bits = BIT_TBL[row][col]
+            if num_bits == 0:
+                continue
+            byte_idx = bit_pos // 8
+            bit_offset = bit_pos % 8
+            value = 0
+            bits_read = 0
+            while bits_read < num_bits:
+                if byte_idx >= len(packed_data):
+                    break
+                bits_to_read = min(8 - bit_offset, num_bits - bits_read)
+                mask = ((1 << bits_to_read) - 1) << bit_offset
+                value |= ((packed_data[byte_idx] & mask) >> bit_offset) << bits_read
+                bits_read += bits_to_read
+                byte_idx += 1
+                bit_offset = 0
+            matrix[row][col] = value
+            bit_pos += num_bits
+    return matrix
+
+
+def legacy_pack_bits(matrix: list) -> bytes:
+    """Original cell-by-cell implementation (reference)."""
+    total_bits = sum(sum(row) for row in BIT_TBL)
+    packed = bytearray((total_bits + 7) // 8)
+    bit_pos = 0
+    for row in range(12):
+        for col in range(8):
+            num_bits = BIT_TBL[row][col]
+            if num_bits == 0:
+                continue
+            value = matrix[row][col]
+            bits_written = 0
+            while bits_written < num_bits:
+                byte_idx = bit_pos // 8
+                bit_offset = bit_pos % 8
+                bits_to_write = min(8 - bit_offset, num_bits - bits_written)
+                bits_val = (value >> bits_written) & ((1 << bits_to_write) - 1)
+                packed[byte_idx] |= bits_val << bit_offset
+                bits_written += bits_to_write
+                bit_pos += bits_to_write
+    return bytes(packed)
+
+
+def rename_full(patch: Patch) -> bytes:
+    patch.name = "Renamed"
+    return patch._pack()
+
+
+def rename(patch: Patch) -> bytes:
+    patch.name = "Renamed"
+    return patch.to_bytes()
+
+
+def bump_level_full(patch: Patch) -> bytes:
+    patch.level = (patch.level + 1) % 101
+    return patch._pack()
+
+
+def bump_level(patch: Patch) -> bytes:
+    patch.level = (patch.level + 1) % 101
+    return patch.to_bytes()
+
+
+def main():
+    patches = load_capture_patches()
+    matrices = [unpack_bits(p) for p in patches]
+    objects = [Patch.from_bytes(p) for p in patches]
+
+    for data, matrix in zip(patches, matrices):
+        assert legacy_unpack_bits(data) == matrix
+        assert legacy_pack_bits(matrix) == pack_bits(matrix)
+
+    print(f"BIT_TBL codec benchmark ({len(patches)} captured patches)")
+    report("unpack_bits", rate(legacy_unpack_bits, patches), rate(unpack_bits, patches))
+    report("pack_bits", rate(legacy_pack_bits, matrices), rate(pack_bits, matrices))
+    print(f"  {'Patch.from_bytes':<28} {rate(Patch.from_bytes, patches):>12,.0f} patches/s")
+    print(f"  {'Patch.to_bytes':<28} {rate(Patch.to_bytes, objects):>12,.0f} patches/s")
+
+    print("Single field, eager Patch vs. PatchView")
+    report("name",
+           rate(lambda p: Patch.from_bytes(p).name, patches),
+           rate(lambda p: PatchView(p).name, patches))
+    report("amp_a.type",
+           rate(lambda p: Patch.from_bytes(p).amp_a.type, patches),
+           rate(lambda p: PatchView(p).amp_a.type, patches))
+
+    print("Edit + serialize, full repack vs. incremental to_bytes")
+    report("unchanged", rate(Patch._pack, objects), rate(Patch.to_bytes, objects))
+    report("rename", rate(rename_full, objects), rate(rename, objects))
+    report("level + 1", rate(bump_level_full, objects), rate(bump_level, objects))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark: one .syx file per message vs. an append-only capture log
+
+Writes a long session (the captured messages repeated, 20,000 by
+default) the way the capture tools used to, one small file per message,
+and through CaptureWriter; then reads every 0x21 response back, by
+opening each file and through the CaptureLog index.
+
+Usage:
+    python benchmarks/bench_capture.py [messages]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from common import load_capture_messages, report
+
+from zoomg9 import CaptureLog, CaptureWriter, DIR_RX
+
+
+def write_files(directory: Path, messages: list):
+    for count, message in enumerate(messages, 1):
+        (directory / f"{count:06d}_rx_{message[4]:02X}.syx").write_bytes(message)
+
+
+def read_files(directory: Path) -> list:
+    found = []
+    for path in sorted(directory.glob("*.syx")):
+        data = path.read_bytes()
+        if data[4] == 0x21:
+            found.append(data)
+    return found
+
+
+def write_log(path: Path, messages: list):
+    with CaptureWriter(path) as log:
+        for message in messages:
+            log.write(message, DIR_RX, "UM-ONE")
+
+
+def read_log(path: Path) -> list:
+    with CaptureLog(path) as log:
+        return [record.data for record in log.find(cmd=0x21)]
+
+
+def timed(func, *args) -> float:
+    """Wall time of func(*args) in seconds."""
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    captured = load_capture_messages()
+    messages = [captured[i % len(captured)] for i in range(count)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        files = Path(tmp) / "files"
+        files.mkdir()
+        log = Path(tmp) / "session.g9cap"
+
+        write_before = timed(write_files, files, messages)
+        write_after = timed(write_log, log, messages)
+        read_before = timed(read_files, files)
+        read_after = timed(read_log, log)
+        assert read_files(files) == read_log(log)
+
+    print(f"Capture session ({count} messages)")
+    report("write", count / write_before, count / write_after, "msgs/s")
+    report("read 0x21 back", count / read_before, count / read_after, "msgs/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark: G9Device / AsyncG9Device against the VirtualG9 emulator
+
+Runs full-bank transfers against in-process pedals (no hardware needed):
+read_all() with several latency/drop settings, bulk write_all(), and
+AsyncG9Device.read_all() on several pedals from one event loop. With
+--soak, repeats read_all() for the given number of seconds and checks
+every bank read back against the emulator's bank.
+
+Usage:
+    python benchmarks/bench_device.py
+    python benchmarks/bench_device.py --soak 60
+"""
+
+import argparse
+import asyncio
+import time
+
+from common import load_capture_patches
+
+from zoomg9 import AsyncG9Device, G9Device, Patch
+from zoomg9.constants import PATCH_COUNT
+from zoomg9.emulator import VirtualG9
+
+# (label, latency, jitter, drop_rate)
+LINKS = [
+    ("ideal", 0.0, 0.0, 0.0),
+    ("1 ms +-0.5 ms", 0.001, 0.0005, 0.0),
+    ("1 ms, 2% drops", 0.001, 0.0, 0.02),
+]
+
+
+def make_bank() -> list:
+    patches = load_capture_patches()
+    return [patches[i % len(patches)] for i in range(PATCH_COUNT)]
+
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def bench_read_all(bank: list):
+    print("read_all() (100 patches)")
+    for label, latency, jitter, drop_rate in LINKS:
+        pedal = VirtualG9(bank, latency=latency, jitter=jitter, drop_rate=drop_rate, seed=1)
+        with G9Device(transport=pedal) as device:
+            elapsed = timed(lambda: device.read_all(timeout=0.05))
+        print(f"  {label:<16} {elapsed * 1000:>8.1f} ms  {PATCH_COUNT / elapsed:>8,.0f} patches/s"
+              f"  ({pedal.dropped} dropped)")
+
+
+def bench_write_all(bank: list):
+    print("write_all() bulk (100 patches)")
+    patches = [Patch.from_bytes(data) for data in bank]
+    pedal = VirtualG9(seed=1)
+    with G9Device(transport=pedal) as device:
+        pedal.bulk_rx()
+        elapsed = timed(lambda: device.write_all(patches, timeout=0.5))
+    assert pedal.bank == [p.to_bytes() for p in patches]
+    print(f"  {'ideal':<16} {elapsed * 1000:>8.1f} ms  {PATCH_COUNT / elapsed:>8,.0f} patches/s")
+
+
+def bench_async(bank: list, pedal_count: int = 4):
+    print(f"AsyncG9Device.read_all() on {pedal_count} pedals, one event loop")
+
+    async def run() -> float:
+        devices = [
+            AsyncG9Device(transport=VirtualG9(bank, latency=0.001, seed=i))
+            for i in range(pedal_count)
+        ]
+        for device in devices:
+            await device.connect()
+        start = time.perf_counter()
+        await asyncio.gather(*(device.read_all() for device in devices))
+        elapsed = time.perf_counter() - start
+        for device in devices:
+            await device.disconnect()
+        return elapsed
+
+    elapsed = asyncio.run(run())
+    total = PATCH_COUNT * pedal_count
+    print(f"  {'1 ms':<16} {elapsed * 1000:>8.1f} ms  {total / elapsed:>8,.0f} patches/s")
+
+
+def soak(bank: list, seconds: float):
+    print(f"Soak: read_all() for {seconds:.0f} s (1 ms +-1 ms, 1% drops)")
+    pedal = VirtualG9(bank, latency=0.001, jitter=0.001, drop_rate=0.01)
+    rounds = 0
+    deadline = time.monotonic() + seconds
+    with G9Device(transport=pedal) as device:
+        while time.monotonic() < deadline:
+            patches = device.read_all(timeout=0.05)
+            assert [p.to_bytes() for p in patches] == [
+                Patch.from_bytes(data).to_bytes() for data in bank
+            ]
+            rounds += 1
+    print(f"  {rounds} banks read, {pedal.sent:,} replies, {pedal.dropped:,} dropped, all verified")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--soak", type=float, metavar="SECONDS", help="run a soak test")
+    args = parser.parse_args()
+
+    bank = make_bank()
+    if args.soak:
+        soak(bank, args.soak)
+        return
+
+    bench_read_all(bank)
+    bench_write_all(bank)
+    bench_async(bank)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Benchmark: SysexFramer vs. the byte-by-byte extract_messages() scanner
+
+Frames synthetic capture logs (captured messages repeated to ~50 MB) and
+reports MB/s: once with back-to-back SysEx, once with 32 bytes of
+non-SysEx traffic (active sensing, clock) between messages as in a proxy
+log.
+
+Usage:
+    python benchmarks/bench_framer.py
+"""
+
+import io
+import time
+
+from common import load_capture_messages
+
+from zoomg9.protocol import iter_sysex
+
+
+def legacy_extract_messages(data: bytes) -> list:
+    """Byte-by-byte scanner from tools/sysex_analyzer.py (reference)."""
+    messages = []
+    i = 0
+    while i < len(data):
+        if data[i] == 0xF0:
+            try:
+                end = data.index(0xF7, i) + 1
+                messages.append(data[i:end])
+                i = end
+            except ValueError:
+                messages.append(data[i:])
+                break
+        else:
+            i += 1
+    return messages
+
+
+def throughput(func, data: bytes) -> float:
+    start = time.perf_counter()
+    func(data)
+    return len(data) / (time.perf_counter() - start) / 1e6
+
+
+def run(label: str, log: bytes):
+    framed = sum(1 for _ in iter_sysex(io.BytesIO(log)))
+    assert framed == len(legacy_extract_messages(log))
+
+    before = throughput(legacy_extract_messages, log)
+    after = throughput(lambda d: sum(1 for _ in iter_sysex(io.BytesIO(d))), log)
+    print(f"  {label:<22} {before:>8,.1f} -> {after:>8,.1f} MB/s ({after / before:.1f}x)"
+          f"  [{framed:,} messages]")
+
+
+def main():
+    messages = load_capture_messages()
+    print("SysEx framing, extract_messages -> SysexFramer (~50 MB logs)")
+    for label, gap in [("back-to-back SysEx", b""), ("with MIDI traffic", b"\xfe\xf8" * 16)]:
+        unit = b"".join(gap + m for m in messages)
+        run(label, unit * (50_000_000 // len(unit)))
+
+
+if __name__ == "__main__":
+    main()
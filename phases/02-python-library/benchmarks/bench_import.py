@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Benchmark: bulk .syx import, one process vs. a worker pool
+
+Writes a tree of .syx bank dumps (100 read responses each, built from the
+captured messages) to a temporary directory and imports it into an
+in-memory PatchLibrary, decoding in this process and with one worker per
+core. Both imports must add the same patches.
+
+Usage:
+    python benchmarks/bench_import.py [files]
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+from common import load_capture_messages
+
+from zoomg9 import PatchLibrary, import_syx
+
+
+def write_tree(directory: Path, files: int):
+    messages = load_capture_messages()
+    for n in range(files):
+        session = directory / f"session_{n // 50:03d}"
+        session.mkdir(exist_ok=True)
+        dump = b"".join(messages[(n + i) % len(messages)] for i in range(100))
+        (session / f"bank_{n:04d}.syx").write_bytes(dump)
+
+
+def main():
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    workers = os.cpu_count() or 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        write_tree(Path(tmp), files)
+        serial = import_syx([tmp], PatchLibrary(), workers=1)
+        parallel = import_syx([tmp], PatchLibrary(), workers=workers)
+
+    assert serial.patches == parallel.patches and serial.new == parallel.new
+    assert not serial.errors and not parallel.errors
+
+    print(f"Bulk import ({serial.files} files, {serial.patches} patches, {serial.new} distinct)")
+    print(f"  {'1 process':<28} {serial.patches / serial.elapsed:>12,.0f} patches/s")
+    print(f"  {f'{workers} workers':<28} {parallel.patches / parallel.elapsed:>12,.0f} patches/s  "
+          f"({serial.elapsed / parallel.elapsed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark: decode scan vs. indexed PatchLibrary query
+
+Fills an in-memory PatchLibrary with ~30,000 patches (the captured patches
+with one random bit of the packed area flipped each, so they are all
+distinct) and answers "Fender amp with delay on" by decoding every patch
+with Patch.from_bytes and by an indexed SQL query. Both must return the
+same patches.
+
+Usage:
+    python benchmarks/bench_library.py
+"""
+
+import random
+import time
+
+from common import load_capture_patches
+
+from zoomg9 import AMP_TYPES, Patch, PatchLibrary
+from zoomg9.encoding import PACKED_SIZE
+
+COUNT = 30000
+FENDER = [amp_type for amp_type, name in AMP_TYPES.items() if "Fender" in name]
+
+
+def variants(patches: list, count: int) -> list:
+    rnd = random.Random(1)
+    result = []
+    for i in range(count):
+        data = bytearray(rnd.choice(patches))
+        data[rnd.randrange(PACKED_SIZE)] ^= 1 << rnd.randrange(8)
+        data[-1] = i & 0x7F  # Unmapped byte: keeps variants distinct
+        data[-2] = i >> 7
+        result.append(bytes(data))
+    return result
+
+
+def scan(data: list) -> set:
+    found = set()
+    for raw in data:
+        patch = Patch.from_bytes(raw)
+        if patch.amp.type in FENDER and patch.delay.on:
+            found.add(raw)
+    return found
+
+
+def main():
+    data = variants(load_capture_patches(), COUNT)
+    lib = PatchLibrary()
+
+    start = time.perf_counter()
+    lib.add_many(enumerate(data))
+    insert_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = scan(data)
+    scan_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    hits = lib.find(amp_type=FENDER, delay_on=True)
+    query_ms = (time.perf_counter() - start) * 1000
+
+    assert {lib.raw(hit.id) for hit in hits} == expected
+
+    print(f"Fender amp + delay on ({len(lib)} patches, {len(hits)} matches)")
+    print(f"  {'import (add_many)':<28} {len(data) / insert_s:>10,.0f} patches/s")
+    print(f"  {'decode scan':<28} {scan_ms:>10.1f} ms")
+    print(f"  {'indexed query':<28} {query_ms:>10.1f} ms  ({scan_ms / query_ms:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark: memory per bank, list of Patch objects vs. PatchBank
+
+Measures traced allocations (tracemalloc) for keeping many banks of real
+captured patches resident: as lists of 100 decoded Patch objects (with the
+dict-based layout used before __slots__ as the reference), as independent
+PatchBanks, and as copy-on-write snapshots of one PatchBank.
+
+Usage:
+    python benchmarks/bench_memory.py
+"""
+
+import tracemalloc
+
+from common import load_capture_patches
+
+from zoomg9 import Patch, PatchBank
+from zoomg9.constants import PATCH_COUNT
+from zoomg9.effects import EffectModule
+
+BANKS = 50
+
+
+def _slots(cls) -> list:
+    """Slot names of a class, base classes first (= __init__ order)."""
+    return [name for klass in reversed(cls.__mro__) for name in getattr(klass, "__slots__", ())]
+
+
+# Plain classes with an instance __dict__, one per slotted class
+_LEGACY_CLASSES = {}
+
+# Serialization state added after the switch to __slots__
+_NOT_LEGACY = {"_source", "_slot", "_dirty", "_checksum"}
+
+
+def _legacy(obj):
+    """Copy a slotted object into its dict-based equivalent."""
+    cls = type(obj)
+    legacy_cls = _LEGACY_CLASSES.setdefault(cls, type(f"Legacy{cls.__name__}", (), {}))
+    legacy = legacy_cls()
+    for name in _slots(cls):
+        if name in _NOT_LEGACY:
+            continue
+        setattr(legacy, name, getattr(obj, name))
+        if name == "_type" and isinstance(obj, EffectModule):
+            legacy._params = {}  # Unused dict every module carried
+    return legacy
+
+
+def legacy_patch(data: bytes):
+    """Patch as laid out before __slots__ (reference)."""
+    patch = _legacy(Patch.from_bytes(data))
+    for name, value in vars(patch).items():
+        if isinstance(value, EffectModule):
+            setattr(patch, name, _legacy(value))
+    return patch
+
+
+def traced(build) -> int:
+    """Bytes still allocated after build() (result kept alive)."""
+    tracemalloc.start()
+    kept = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return size
+
+
+def main():
+    patches = load_capture_patches()
+    raw = [patches[i % len(patches)] for i in range(PATCH_COUNT)]
+    data = b"".join(raw)
+
+    def snapshots():
+        bank = PatchBank(bytearray(data))
+        return [bank.snapshot() for _ in range(BANKS)]
+
+    cases = [
+        ("100 Patch, no __slots__", lambda: [[legacy_patch(p) for p in raw] for _ in range(BANKS)]),
+        ("list of 100 Patch", lambda: [[Patch.from_bytes(p) for p in raw] for _ in range(BANKS)]),
+        ("PatchBank", lambda: [PatchBank(bytearray(data)) for _ in range(BANKS)]),
+        ("PatchBank snapshots", snapshots),
+    ]
+
+    print(f"Memory for {BANKS} banks of {PATCH_COUNT} patches (tracemalloc)")
+    baseline = None
+    for label, build in cases:
+        per_bank = traced(build) / BANKS
+        baseline = baseline or per_bank
+        print(f"  {label:<24} {per_bank:>10,.0f} B/bank  {per_bank / PATCH_COUNT:>7,.0f} B/patch"
+              f"  ({baseline / per_bank:.1f}x smaller)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Benchmark: typed message objects vs. dict-returning parse_sysex()
+
+Decodes every message of the bulk-write capture session (repeated) and
+reports messages per second and retained memory per decoded message.
+
+Usage:
+    python benchmarks/bench_messages.py
+"""
+
+import time
+import tracemalloc
+
+from common import CAPTURE_DIRS
+
+from zoomg9.messages import decode_message
+from zoomg9.protocol import parse_sysex
+
+REPEAT = 2000
+
+
+def measure(func, messages) -> tuple:
+    start = time.perf_counter()
+    for msg in messages:
+        func(msg)
+    per_sec = len(messages) / (time.perf_counter() - start)
+
+    tracemalloc.start()
+    kept = [func(msg) for msg in messages[:10_000]]
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return per_sec, retained / len(kept)
+
+
+def main():
+    session = [p.read_bytes() for p in sorted(CAPTURE_DIRS[1].glob("*.syx"))]
+    messages = session * REPEAT
+
+    print(f"Message decoding ({len(messages):,} captured messages)")
+    for label, func in [("parse_sysex (dict)", parse_sysex), ("decode_message", decode_message)]:
+        per_sec, per_msg = measure(func, messages)
+        print(f"  {label:<20} {per_sec:>12,.0f} msg/s  {per_msg:>6,.0f} B retained/msg")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark: 0x31 message construction, fresh bytes vs. preallocated template
+
+Compares the per-message work of the old send path (build_param_change()
+plus F0/F7 stripping and list conversion for mido) with filling a
+SysexTemplate in place and handing the buffer to the backend as-is.
+Also compares name resolution: the dict literals set_parameter() used to
+build on every call vs. a precomputed ParamHandle.
+
+Usage:
+    python benchmarks/bench_send_path.py
+"""
+
+import time
+import tracemalloc
+
+import common  # noqa: F401  (sets up sys.path)
+
+from zoomg9.addressing import resolve
+from zoomg9.constants import CMD_PARAM_CHANGE, PARAM_RANGES
+from zoomg9.protocol import SysexTemplate, build_param_change
+
+COUNT = 200_000
+
+
+def legacy_send(value):
+    data = build_param_change(0x05, 0x02, value)
+    if data[0] == 0xF0:
+        data = data[1:]
+    if data[-1] == 0xF7:
+        data = data[:-1]
+    return list(data)
+
+
+def legacy_resolve(effect: str, param: str, value: int):
+    """Per-call lookup from the original set_parameter() (reference)."""
+    effect_map = {
+        "top": 0x00,
+        "cmp": 0x01, "comp": 0x01, "compressor": 0x01,
+        "wah": 0x02,
+        "ext": 0x03,
+        "znr": 0x04,
+        "amp": 0x05,
+        "eq": 0x06,
+        "cab": 0x07,
+        "mod": 0x08,
+        "dly": 0x09, "delay": 0x09,
+        "rev": 0x0A, "reverb": 0x0A,
+    }
+    effect_id = effect_map[effect.lower()]
+    param_map = {
+        "on": 0x00, "onoff": 0x00,
+        "type": 0x01,
+        "gain": 0x02, "sense": 0x02, "depth": 0x02, "time": 0x02, "decay": 0x02,
+        "send": 0x02, "band1": 0x02,
+        "tone": 0x03, "attack": 0x03, "rate": 0x03, "feedback": 0x03,
+        "predelay": 0x03, "return": 0x03, "band2": 0x03,
+        "level": 0x04, "resonance": 0x04, "hidamp": 0x04, "dry": 0x04,
+        "band3": 0x04, "mictype": 0x03, "micpos": 0x04,
+        "mix": 0x05, "band4": 0x05,
+        "band5": 0x06, "band6": 0x07,
+    }
+    param_id = param_map[param.lower()]
+    min_val, max_val = PARAM_RANGES[effect_id][param_id]
+    if not min_val <= value <= max_val:
+        raise ValueError(value)
+    return effect_id, param_id
+
+
+def measure(func) -> tuple:
+    tracemalloc.start()
+    start = time.perf_counter()
+    for i in range(COUNT):
+        func(i & 0x7F)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return COUNT / elapsed, peak
+
+
+def main():
+    template = SysexTemplate(CMD_PARAM_CHANGE, 4)
+    cases = [
+        ("build + strip + list", legacy_send),
+        ("SysexTemplate.fill", lambda v: template.fill(0x05, 0x02, v, 0x00)),
+    ]
+    print(f"0x31 message preparation ({COUNT:,} messages, under tracemalloc)")
+    for label, func in cases:
+        per_sec, peak = measure(func)
+        print(f"  {label:<22} {per_sec:>12,.0f} msg/s  peak traced alloc {peak:>6,} B")
+
+    handle = resolve("amp.gain")
+    cases = [
+        ("dict literals", lambda v: legacy_resolve("amp", "gain", v & 0x3F)),
+        ("ParamHandle.check", lambda v: handle.check(v & 0x3F)),
+    ]
+    print(f"Parameter resolution + validation ({COUNT:,} values, under tracemalloc)")
+    for label, func in cases:
+        per_sec, peak = measure(func)
+        print(f"  {label:<22} {per_sec:>12,.0f} msg/s  peak traced alloc {peak:>6,} B")
+
+
+if __name__ == "__main__":
+    main()
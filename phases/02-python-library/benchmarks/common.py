@@ -0,0 +1,64 @@
+"""
+Shared helpers for the zoomg9 benchmarks.
+
+Benchmarks use the real patches captured during reverse engineering so the
+numbers reflect actual patch contents, not random bytes.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+LIBRARY_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(LIBRARY_DIR))
+
+from zoomg9.protocol import parse_read_response  # noqa: E402
+
+CAPTURE_DIRS = [
+    LIBRARY_DIR.parent / "01-reverse-engineering" / "03-midi-capture" / "captures" / "raw",
+    LIBRARY_DIR.parent / "01-reverse-engineering" / "captures" / "bulk_write_20260125",
+]
+
+
+def load_capture_messages() -> list:
+    """Load every captured 268-byte READ_RESP message."""
+    messages = []
+    for directory in CAPTURE_DIRS:
+        for path in sorted(directory.glob("*.syx")):
+            data = path.read_bytes()
+            if len(data) == 268 and data[4] == 0x21:
+                messages.append(data)
+    return messages
+
+
+def load_capture_patches() -> list:
+    """Load every captured patch as 128 decoded bytes."""
+    return [parse_read_response(msg)[1] for msg in load_capture_messages()]
+
+
+def rate(func, items, min_time: float = 0.5) -> float:
+    """
+    Measure how many items per second func() processes.
+
+    Args:
+        func: Callable taking one item
+        items: Items to feed through func, cycled until min_time elapses
+        min_time: Minimum measurement time in seconds
+
+    Returns:
+        Items processed per second
+    """
+    count = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < min_time:
+        for item in items:
+            func(item)
+        count += len(items)
+        elapsed = time.perf_counter() - start
+    return count / elapsed
+
+
+def report(label: str, before: float, after: float, unit: str = "patches/s"):
+    """Print a before/after line with the speedup factor."""
+    print(f"  {label:<28} {before:>12,.0f} -> {after:>12,.0f} {unit}  ({after / before:.1f}x)")
@@ -7,6 +7,7 @@ This example demonstrates how to:
 - Save patches to files
 - Load patches from files
 - Write all patches to the device
+- Keep deduplicated backups in a PatchStore file
 """
 
 import sys
@@ -14,7 +15,7 @@ import os
 import json
 sys.path.insert(0, "..")
 
-from zoomg9 import G9Device, G9DeviceError, Patch
+from zoomg9 import G9Device, G9DeviceError, Patch, PatchStore
 
 
 def progress_bar(current, total, width=40):
@@ -108,6 +109,44 @@ def cmd_restore(device, filename):
     print("Restore complete!")
 
 
+def cmd_store(device, filename, tag):
+    """Add a backup of all patches to a deduplicated store file."""
+    print(f"\nBacking up all patches to {filename} (tag {tag!r})...")
+
+    def progress(current, total):
+        progress_bar(current, total)
+
+    bank = device.read_bank(progress_callback=progress)
+    print()  # New line after progress bar
+
+    store = PatchStore(filename)
+    known = len(store)
+    store.put_bank(bank, tag=tag)
+    print(f"{len(store) - known} new patches, {len(store)} distinct patches in store")
+
+
+def cmd_restore_store(device, filename, tag):
+    """Restore the latest backup of a tag from a store file."""
+    store = PatchStore(filename)
+    try:
+        bank = store.get_bank(tag)
+    except KeyError:
+        print(f"No backup tagged {tag!r} in {filename}")
+        return
+
+    confirm = input("This will overwrite all patches. Continue? [y/N] ")
+    if confirm.lower() != "y":
+        print("Cancelled.")
+        return
+
+    def progress(current, total):
+        progress_bar(current, total)
+
+    device.write_bank(bank, progress_callback=progress)
+    print()  # New line after progress bar
+    print("Restore complete!")
+
+
 def cmd_list(device):
     """List all patch names."""
     print("\nReading patch names...")
@@ -115,13 +154,13 @@ def cmd_list(device):
     def progress(current, total):
         progress_bar(current, total)
 
-    patches = device.read_all(progress_callback=progress)
+    bank = device.read_bank(progress_callback=progress)
     print()  # New line after progress bar
 
     print("\nPatch List:")
     print("-" * 30)
-    for i, patch in enumerate(patches):
-        print(f"  {i:2d}: {patch.name}")
+    for i, name in enumerate(bank.names()):
+        print(f"  {i:2d}: {name}")
 
 
 def main():
@@ -133,6 +172,8 @@ def main():
         print("  list               List all patch names")
         print("  backup <file>      Backup all patches to JSON file")
         print("  restore <file>     Restore all patches from JSON file")
+        print("  store <file> [tag]         Add a backup to a PatchStore file")
+        print("  restore-store <file> [tag] Restore the latest backup of a tag")
         return 1
 
     command = sys.argv[1].lower()
@@ -156,6 +197,16 @@ def main():
                     return 1
                 cmd_restore(device, sys.argv[2])
 
+            elif command in ("store", "restore-store"):
+                if len(sys.argv) < 3:
+                    print(f"Usage: {command} <filename.g9s> [tag]")
+                    return 1
+                tag = sys.argv[3] if len(sys.argv) > 3 else device.port_name
+                if command == "store":
+                    cmd_store(device, sys.argv[2], tag)
+                else:
+                    cmd_restore_store(device, sys.argv[2], tag)
+
             else:
                 print(f"Unknown command: {command}")
                 return 1
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Test: Verify 14-bit parameter change encoding (0x31)
+
+No hardware needed. Checks:
+1. Values above 127 use VALUE_LO = value & 0x7F, VALUE_HI = value >> 7
+   (MAPPING_CHECKLIST.md), e.g. DLY Time 500 -> 74 03
+2. Every value of the wide parameters (DLY time 0-5022, MOD depth 0-2047)
+   survives G9Device.set_parameter() -> VirtualG9 -> ParamChange
+
+The captured 0x31 messages (bulk_write_20260125) all carry values below
+128, so the two-byte form is verified against the checklist only. The
+captures themselves are checked by tests/test_protocol.py.
+"""
+
+import sys
+from pathlib import Path
+
+LIBRARY_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(LIBRARY_DIR))
+
+from zoomg9 import G9Device, VirtualG9, ParamChange, build_param_change, resolve  # noqa: E402
+
+def check_known_values():
+    """Two-byte values from the documented formula."""
+    cases = [
+        (0x09, 0x02, 127, bytes([0x7F, 0x00])),
+        (0x09, 0x02, 128, bytes([0x00, 0x01])),
+        (0x09, 0x02, 500, bytes([0x74, 0x03])),
+        (0x09, 0x02, 5022, bytes([0x1E, 0x27])),
+        (0x08, 0x02, 2047, bytes([0x7F, 0x0F])),
+    ]
+    for effect_id, param_id, value, expected in cases:
+        msg = build_param_change(effect_id, param_id, value)
+        assert msg[7:9] == expected, f"{value}: {msg[7:9].hex(' ')} != {expected.hex(' ')}"
+        assert ParamChange(msg).value == value
+
+
+def check_device_roundtrip() -> int:
+    """Send every value of the wide parameters through the emulator."""
+    pedal = VirtualG9()
+    sent = []
+    receive = pedal.send
+
+    def record(data):
+        sent.append(bytes(data))
+        receive(data)
+
+    pedal.send = record
+    count = 0
+    with G9Device(transport=pedal) as device:
+        for name in ("dly.time", "mod.depth"):
+            handle = resolve(name)
+            for value in range(handle.min_val, handle.max_val + 1):
+                device.set_value(handle, value)
+                msg = ParamChange(sent[-1])
+                assert (msg.effect_id, msg.param_id, msg.value) == (
+                    handle.effect_id, handle.param_id, value
+                ), f"{name}={value}: {sent[-1].hex(' ')}"
+                assert pedal.params[(handle.effect_id, handle.param_id)] == value
+                count += 1
+    return count
+
+
+def main():
+    print("Test: 14-bit parameter change encoding")
+    print("=" * 50)
+    check_known_values()
+    print("1. Two-byte values (128, 500, 5022): OK")
+    print(f"2. Device -> emulator round trips:  {check_device_roundtrip()}")
+    print("All checks passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,9 +2,33 @@
 """
 Setup script for backwards compatibility.
 Modern installations should use pyproject.toml via pip.
+
+Also copies the G9ED parameter definitions of phase 03
+(reference/efx_parsed.json) into the built package, so the repository
+keeps a single copy of them.
 """
 
+import shutil
+from pathlib import Path
+
 from setuptools import setup
+from setuptools.command.build_py import build_py
+
+EFX_SOURCE = (
+    Path(__file__).resolve().parent.parent / "03-complete-mapping" / "reference" / "efx_parsed.json"
+)
+
+
+class BuildPy(build_py):
+    """build_py that adds zoomg9/data/efx_parsed.json to the build."""
+
+    def run(self):
+        super().run()
+        if EFX_SOURCE.exists() and not self.dry_run:
+            target = Path(self.build_lib) / "zoomg9" / "data"
+            target.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(EFX_SOURCE, target / "efx_parsed.json")
+
 
 if __name__ == "__main__":
-    setup()
+    setup(cmdclass={"build_py": BuildPy})
@@ -0,0 +1,93 @@
+"""
+Shared fixtures for the zoomg9 tests.
+
+Tests run against the patches captured from a real G9.2tt during reverse
+engineering (phases/01-reverse-engineering), like the benchmarks.
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+LIBRARY_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(LIBRARY_DIR))
+
+import zoomg9.device  # noqa: E402
+from zoomg9.device import G9Device  # noqa: E402
+from zoomg9.emulator import VirtualG9  # noqa: E402
+from zoomg9.protocol import parse_read_response  # noqa: E402
+
+CAPTURE_DIRS = [
+    LIBRARY_DIR.parent / "01-reverse-engineering" / "03-midi-capture" / "captures" / "raw",
+    LIBRARY_DIR.parent / "01-reverse-engineering" / "captures" / "bulk_write_20260125",
+]
+
+
+def _capture_files(command: int = 0x21, size: int = 268) -> list:
+    """Captured single-message files of one command (default: 268-byte READ_RESP)."""
+    files = []
+    for directory in CAPTURE_DIRS:
+        for path in sorted(directory.glob("*.syx")):
+            data = path.read_bytes()
+            if len(data) == size and data[4] == command:
+                files.append(path)
+    return files
+
+
+@pytest.fixture(scope="session")
+def capture_files() -> list:
+    """Paths of the captured read responses."""
+    files = _capture_files()
+    if not files:
+        pytest.skip("captured .syx files not available")
+    return files
+
+
+@pytest.fixture(scope="session")
+def param_change_files() -> list:
+    """Paths of the captured 10-byte 0x31 parameter changes."""
+    files = _capture_files(0x31, 10)
+    if not files:
+        pytest.skip("captured 0x31 messages not available")
+    return files
+
+
+@pytest.fixture(scope="session")
+def capture_messages(capture_files) -> list:
+    """Every captured read response, as bytes."""
+    return [path.read_bytes() for path in capture_files]
+
+
+@pytest.fixture(scope="session")
+def capture_patches(capture_messages) -> list:
+    """Every captured patch, as 128 decoded bytes."""
+    return [parse_read_response(msg)[1] for msg in capture_messages]
+
+
+@pytest.fixture(scope="session")
+def bank_data(capture_patches) -> list:
+    """100 captured patches (cycled if fewer were captured), one bank."""
+    return [capture_patches[i % len(capture_patches)] for i in range(100)]
+
+
+@pytest.fixture
+def pedal(bank_data):
+    """VirtualG9 holding the captured bank."""
+    return VirtualG9(bank=bank_data, seed=1)
+
+
+@pytest.fixture
+def no_delays(monkeypatch):
+    """Skip G9Device's pauses after mode switches (only in zoomg9.device)."""
+    monkeypatch.setattr(zoomg9.device, "time", SimpleNamespace(sleep=lambda seconds: None))
+
+
+@pytest.fixture
+def device(pedal, no_delays):
+    """G9Device connected to the virtual pedal, without mode-switch delays."""
+    device = G9Device(transport=pedal)
+    device.connect()
+    yield device
+    device.disconnect()
@@ -0,0 +1,81 @@
+"""Tests for parameter name resolution."""
+
+import pytest
+
+from zoomg9.addressing import (
+    EFFECT_ALIASES,
+    EFX_PATH,
+    LEGACY_PARAM_ALIASES,
+    ParamHandle,
+    parameters,
+    resolve,
+    resolve_parameter,
+)
+from zoomg9.constants import EFFECT_MOD, EFFECT_SYNC
+
+
+def test_definitions_found():
+    assert EFX_PATH.exists()
+
+
+@pytest.mark.parametrize("module", sorted(set(EFFECT_ALIASES) - {"sync", "ttl"}))
+def test_legacy_aliases_keep_addresses(module):
+    for alias, param_id in LEGACY_PARAM_ALIASES.items():
+        handle = resolve_parameter(module, alias)
+        assert handle.effect_id == EFFECT_ALIASES[module]
+        assert handle.param_id == param_id
+
+
+def test_legacy_alias_over_param_names():
+    # PARAM_NAMES has CMP Level at 0x05; the legacy name stays at 0x04
+    assert resolve("cmp.level").param_id == 0x04
+    assert resolve("cmp.level", effect_type="Compressor").param_id == 0x05
+
+
+def test_typed_names():
+    handle = resolve("mod.shift", effect_type="PitchShifter")
+    assert handle == ParamHandle(EFFECT_MOD, 0x02, 0, 25, "mod.shift")
+    assert resolve("mod.depth", effect_type="Chorus").param_id == 0x02
+    with pytest.raises(ValueError):
+        resolve("mod.depth", effect_type="PitchShifter")
+
+
+def test_type_by_number_or_name():
+    assert resolve("dly.time", effect_type=1) == resolve("dly.time", effect_type="Ping Pong Delay")
+    assert parameters("mod", 5) == parameters("mod", "PitchShifter")
+
+
+def test_type_specific_range():
+    assert resolve("mod.depth").max_val > resolve("mod.depth", effect_type="Chorus").max_val
+
+
+def test_names_are_normalized():
+    assert resolve_parameter("Delay", "Feed Back", "Delay") == resolve("dly.feedback", "delay")
+    assert resolve("rev.pre_delay", "Hall") == resolve("rev.predelay", "Hall")
+
+
+def test_sync_has_no_legacy_aliases():
+    with pytest.raises(ValueError):
+        resolve("sync.gain")
+    assert resolve("sync.arrmbpm", effect_type=0).effect_id == EFFECT_SYNC
+
+
+def test_check():
+    handle = resolve("amp.gain")
+    handle.check(handle.max_val)
+    with pytest.raises(ValueError):
+        handle.check(handle.max_val + 1)
+    with pytest.raises(ValueError):
+        handle.check(handle.min_val - 1)
+
+
+@pytest.mark.parametrize("name, effect_type", [
+    ("nope.gain", None),
+    ("amp.nope", None),
+    ("ampgain", None),
+    ("mod.depth", "NoSuchType"),
+    ("mod.depth", 99),
+])
+def test_unknown(name, effect_type):
+    with pytest.raises(ValueError):
+        resolve(name, effect_type)
@@ -0,0 +1,154 @@
+"""Tests for AsyncG9Device against the VirtualG9 emulator."""
+
+import asyncio
+
+import pytest
+
+from zoomg9.async_device import AsyncG9Device
+from zoomg9.device import G9DeviceError
+from zoomg9.emulator import VirtualG9
+from zoomg9.patch import Patch
+from zoomg9.protocol import parse_read_response
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_read_patch(pedal, bank_data):
+    async def main():
+        async with AsyncG9Device(transport=pedal) as device:
+            return await device.read_patch(42)
+
+    assert run(main()).to_bytes() == bank_data[42]
+
+
+def test_concurrent_reads_matched_by_patch(bank_data):
+    pedal = VirtualG9(bank=bank_data, latency=0.001, jitter=0.005, seed=2)
+
+    async def main():
+        async with AsyncG9Device(transport=pedal) as device:
+            return await asyncio.gather(*(device.read_patch(n) for n in range(30, 0, -1)))
+
+    patches = run(main())
+    assert [p.to_bytes() for p in patches] == bank_data[30:0:-1]
+
+
+def test_read_all_with_drops(bank_data):
+    pedal = VirtualG9(bank=bank_data, drop_rate=0.05, seed=4)
+    progress = []
+
+    async def main():
+        async with AsyncG9Device(transport=pedal) as device:
+            return await device.read_all(
+                progress_callback=lambda done, total: progress.append(done),
+                timeout=0.05, retries=10,
+            )
+
+    assert [p.to_bytes() for p in run(main())] == bank_data
+    assert progress == list(range(1, 101))
+
+
+def test_read_timeout(bank_data):
+    pedal = VirtualG9(bank=bank_data, drop_rate=1.0)
+
+    async def main():
+        async with AsyncG9Device(transport=pedal) as device:
+            await device.read_patch(0, timeout=0.02)
+
+    with pytest.raises(G9DeviceError):
+        run(main())
+
+
+def test_identity(pedal):
+    async def main():
+        async with AsyncG9Device(transport=pedal) as device:
+            return await device.identity()
+
+    info = run(main())
+    assert info["valid"] and info["firmware"] == "1.08"
+
+
+def test_reply_before_waiter_is_kept(pedal, bank_data):
+    async def main():
+        async with AsyncG9Device(transport=pedal) as device:
+            device._send_sysex(device._read_msg.fill(9))
+            await asyncio.sleep(0.05)  # Reply lands in the backlog
+            return await device._expect(lambda msg: msg[5] == 9, timeout=0.5)
+
+    assert parse_read_response(run(main())) == (9, bank_data[9])
+
+
+def test_write_patch(pedal):
+    async def main():
+        async with AsyncG9Device(transport=pedal) as device:
+            await device.write_patch(15, Patch("Async"))
+            return device._in_edit_mode
+
+    assert run(main()) is False
+    assert pedal.get_patch(15).name == "Async"
+    assert not pedal.in_edit_mode
+
+
+def test_concurrent_writes(pedal):
+    async def main():
+        async with AsyncG9Device(transport=pedal) as device:
+            await asyncio.gather(
+                device.write_patch(15, Patch("First")),
+                device.write_patch(16, Patch("Second")),
+            )
+
+    run(main())
+    assert [pedal.get_patch(n).name for n in (15, 16)] == ["First", "Second"]
+    assert not pedal.in_edit_mode
+
+
+def test_write_patch_not_connected():
+    with pytest.raises(G9DeviceError):
+        run(AsyncG9Device(transport=VirtualG9()).write_patch(0, Patch()))
+
+
+def test_write_all(pedal, bank_data):
+    patches = [Patch.from_bytes(data) for data in reversed(bank_data)]
+
+    async def main():
+        async with AsyncG9Device(transport=pedal) as device:
+            pedal.bulk_rx()
+            await device.write_all(patches)
+
+    run(main())
+    assert pedal.bank == list(reversed(bank_data))
+
+
+def test_set_parameter(pedal):
+    async def main():
+        async with AsyncG9Device(transport=pedal) as device:
+            await device.set_parameter("amp", "gain", 80)
+            return pedal.in_live_mode
+
+    assert run(main()) is True
+    assert 80 in pedal.params.values()
+    assert not pedal.in_live_mode  # Left on disconnect
+
+
+def test_mode_switch_before_connect(pedal):
+    device = AsyncG9Device(transport=pedal)
+    with pytest.raises(G9DeviceError):
+        run(device.enter_edit_mode())
+    with pytest.raises(G9DeviceError):
+        run(device.enable_live_mode())
+
+
+def test_disconnect_fails_pending_waits(bank_data):
+    pedal = VirtualG9(bank=bank_data, drop_rate=1.0)
+
+    async def main():
+        device = AsyncG9Device(transport=pedal)
+        await device.connect()
+        read = asyncio.ensure_future(device.read_patch(0, timeout=5.0))
+        await asyncio.sleep(0.01)
+        await device.disconnect()
+        await read
+
+    with pytest.raises(G9DeviceError):
+        run(main())
@@ -0,0 +1,93 @@
+"""Tests for the copy-on-write PatchBank."""
+
+import pytest
+
+from zoomg9.bank import BANK_SIZE, PatchBank
+from zoomg9.patch import Patch
+
+
+@pytest.fixture
+def bank(bank_data):
+    return PatchBank(b"".join(bank_data))
+
+
+def test_slots(bank, bank_data):
+    assert len(bank) == 100
+    assert bank.to_list() == bank_data
+    assert bank.to_bytes() == b"".join(bank_data)
+    assert bytes(bank.raw(7)) == bank_data[7]
+    assert bank[7].to_bytes() == bank_data[7]
+    assert [p.to_bytes() for p in bank] == bank_data
+
+
+def test_names(bank, bank_data):
+    # Names padded with NULs are stripped like PatchView.name
+    assert bank.names() == [Patch.from_bytes(data).name.rstrip(" \x00") for data in bank_data]
+
+
+def test_write_marks_dirty(bank, bank_data):
+    patch = bank[3]
+    patch.name = "Changed"
+    bank[3] = patch
+    bank[5] = bank_data[5]  # Same data: not dirty
+    assert bank.dirty == [3]
+    assert bank.is_dirty(3) and not bank.is_dirty(5)
+    assert bank.name(3) == "Changed"
+    bank.mark_clean()
+    assert bank.dirty == []
+
+
+def test_snapshot_copy_on_write(bank, bank_data):
+    snapshot = bank.snapshot()
+    assert snapshot == bank
+    assert snapshot._buf is bank._buf
+
+    bank[0] = Patch("New")
+    assert snapshot[0].to_bytes() == bank_data[0]
+    assert bank[0].name == "New"
+    assert snapshot.dirty == [] and bank.dirty == [0]
+
+    snapshot[1] = Patch("Other")
+    assert bank[1].to_bytes() == bank_data[1]
+
+
+def test_raw_is_read_only(bank):
+    with pytest.raises(TypeError):
+        bank.raw(0)[0] = 1
+
+
+def test_from_patches(bank_data):
+    patches = [Patch.from_bytes(data) for data in bank_data[:50]] + bank_data[50:]
+    assert PatchBank.from_patches(patches).to_list() == bank_data
+
+
+def test_default_bank():
+    assert PatchBank().to_list() == [Patch().to_bytes()] * 100
+
+
+@pytest.mark.parametrize("action", [
+    lambda: PatchBank(bytes(BANK_SIZE - 1)),
+    lambda: PatchBank.from_patches([Patch()] * 99),
+    lambda: PatchBank.from_patches([bytes(127)] * 100),
+])
+def test_invalid_sizes(action):
+    with pytest.raises(ValueError):
+        action()
+
+
+def test_slot_range(bank):
+    with pytest.raises(IndexError):
+        bank[100]
+    with pytest.raises(ValueError):
+        bank[0] = bytes(127)
+
+
+def test_device_read_and_write_bank(device, pedal, bank_data):
+    bank = device.read_bank()
+    assert bank.to_list() == bank_data
+
+    bank[9] = Patch("Banked")
+    pedal.bulk_rx()
+    device.write_bank(bank)
+    assert pedal.get_patch(9).name == "Banked"
+    assert bank.dirty == []
@@ -0,0 +1,107 @@
+"""Tests for the memory-mapped BankFile."""
+
+import pytest
+
+from zoomg9.bank import PatchBank
+from zoomg9.bankfile import FILE_SIZE, LABEL_SIZE, BankFile, _truncate_label
+from zoomg9.patch import Patch
+from zoomg9.protocol import ChecksumError
+
+
+@pytest.fixture
+def dump(capture_messages):
+    """One captured read response per patch number, in patch order."""
+    by_num = {msg[5]: msg for msg in capture_messages}
+    if len(by_num) < 100:
+        pytest.skip("captures do not cover all 100 patches")
+    return [by_num[n] for n in range(100)]
+
+
+@pytest.fixture
+def syx(tmp_path, dump):
+    path = tmp_path / "backup.syx"
+    path.write_bytes(b"".join(reversed(dump)))  # Any order is accepted
+    return path
+
+
+def test_syx_round_trip(tmp_path, syx, dump):
+    with BankFile.from_syx(syx, tmp_path / "backup.g9b") as bank:
+        assert bank.label == "backup.syx"
+        assert bank.verify() == []
+        bank.to_syx(tmp_path / "copy.syx")
+    assert (tmp_path / "backup.g9b").stat().st_size == FILE_SIZE
+    assert (tmp_path / "copy.syx").read_bytes() == b"".join(dump)
+
+
+def test_from_syx_missing_patch(tmp_path, dump):
+    path = tmp_path / "partial.syx"
+    path.write_bytes(b"".join(dump[:42] + dump[43:]))
+    with pytest.raises(ValueError, match="first: 42"):
+        BankFile.from_syx(path, tmp_path / "partial.g9b")
+
+
+def test_from_syx_bad_checksum(tmp_path, dump):
+    corrupt = bytearray(dump[7])
+    corrupt[100] ^= 0x01
+    path = tmp_path / "corrupt.syx"
+    path.write_bytes(b"".join(dump[:7] + [bytes(corrupt)] + dump[8:]))
+    with pytest.raises(ChecksumError):
+        BankFile.from_syx(path, tmp_path / "corrupt.g9b")
+
+
+def test_long_label(tmp_path, syx):
+    name = "é" * 40 + ".syx"  # 84 bytes of UTF-8
+    long_syx = syx.rename(tmp_path / name)
+    assert _truncate_label(name) == "é" * 32
+    assert len(_truncate_label("x" + name).encode("utf-8")) == LABEL_SIZE - 1
+    with BankFile.from_syx(long_syx, tmp_path / "long.g9b") as bank:
+        assert bank.label == "é" * 32
+    with pytest.raises(ValueError):
+        BankFile.create(tmp_path / "bad.g9b", label="x" * (LABEL_SIZE + 1))
+
+
+def test_reads_match_bank(tmp_path, bank_data):
+    BankFile.create(tmp_path / "bank.g9b", bank_data, label="Live").close()
+    with BankFile(tmp_path / "bank.g9b") as bank:
+        assert len(bank) == 100
+        assert [bank.raw(n) for n in range(100)] == bank_data
+        assert bank.to_bank().to_bytes() == b"".join(bank_data)
+        assert bank[73].to_bytes() == bank_data[73]
+        assert bank.view(73).to_bytes() == bank_data[73]
+        assert bank.names() == PatchBank(b"".join(bank_data)).names()
+        with pytest.raises(IndexError):
+            bank.raw(100)
+
+
+def test_write_in_place(tmp_path, bank_data):
+    path = tmp_path / "bank.g9b"
+    with BankFile.create(path, bank_data) as bank:
+        created = bank.modified
+        patch = Patch.from_bytes(bank_data[5])
+        patch.name = "Replaced"
+        bank[12] = patch
+        assert bank.modified >= created
+        assert bank.verify() == []
+    with BankFile(path) as bank:
+        assert bank.name(12) == "Replaced"
+        assert bank.raw(11) == bank_data[11]
+        with pytest.raises(TypeError):
+            bank[0] = bank_data[0]
+
+
+def test_verify_detects_corruption(tmp_path, bank_data):
+    path = tmp_path / "bank.g9b"
+    BankFile.create(path, bank_data).close()
+    data = bytearray(path.read_bytes())
+    data[128 + 128 * 9 + 3] ^= 0xFF
+    path.write_bytes(bytes(data))
+    with BankFile(path) as bank:
+        assert bank.verify() == [9]
+
+
+@pytest.mark.parametrize("content", [b"", b"G9BK" + bytes(10), bytes(FILE_SIZE)])
+def test_not_a_bank_file(tmp_path, content):
+    path = tmp_path / "bad.g9b"
+    path.write_bytes(content)
+    with pytest.raises(ValueError):
+        BankFile(path)
@@ -0,0 +1,136 @@
+"""Tests for the capture log writer and reader."""
+
+import time
+
+import pytest
+
+from zoomg9.capture import (
+    DIR_RX,
+    DIR_TX,
+    DIR_UNKNOWN,
+    MAGIC,
+    CaptureLog,
+    CaptureWriter,
+    index_path,
+)
+from zoomg9.constants import CMD_READ_RESPONSE
+from zoomg9.protocol import build_read_request
+
+_INDEX_ENTRY = 17  # offset (u64), time (u64), command (u8)
+
+
+@pytest.fixture
+def session(tmp_path, capture_messages):
+    """A log of 20 request/response pairs over two ports, plus a note."""
+    path = tmp_path / "session.g9cap"
+    with CaptureWriter(path) as log:
+        for num, message in enumerate(capture_messages[:20]):
+            log.write(build_read_request(num), DIR_TX, "UM-ONE", timestamp=num)
+            log.write(message[1:-1], DIR_RX, "G9.2tt", timestamp=num + 0.5)  # No F0/F7
+        log.write(b"\xC0\x05", port="UM-ONE", timestamp=30)
+    return path
+
+
+def test_round_trip(session, capture_messages):
+    with CaptureLog(session) as log:
+        assert len(log) == 41
+        assert log.ports == ["UM-ONE", "G9.2tt"]
+        first = log[0]
+        assert (first.time, first.direction, first.port) == (0.0, DIR_TX, "UM-ONE")
+        assert first.data == build_read_request(0)
+        assert log[1].data == capture_messages[0]
+        assert log[-1].data == b"\xC0\x05"
+        assert log[-1].direction == DIR_UNKNOWN
+        assert log[-1].command is None
+
+
+def test_find(session, capture_messages):
+    with CaptureLog(session) as log:
+        responses = log.find(cmd=CMD_READ_RESPONSE)
+        assert [r.data for r in responses] == capture_messages[:20]
+        assert all(r.port == "G9.2tt" and r.command == CMD_READ_RESPONSE for r in responses)
+        assert [r.time for r in log.find(start=5, end=7)] == [5.0, 5.5, 6.0, 6.5]
+        assert len(log.find(direction=DIR_TX)) == 20
+        assert log.find(cmd=CMD_READ_RESPONSE, direction=DIR_TX) == []
+
+
+def test_to_syx(session, tmp_path, capture_messages):
+    with CaptureLog(session) as log:
+        assert log.to_syx(tmp_path / "out.syx", cmd=CMD_READ_RESPONSE) == 20
+    assert (tmp_path / "out.syx").read_bytes() == b"".join(capture_messages[:20])
+
+
+def test_times_never_go_backwards(tmp_path):
+    path = tmp_path / "log.g9cap"
+    with CaptureWriter(path) as log:
+        log.write(b"\xC0\x01", timestamp=2.0)
+        log.write(b"\xC0\x02", timestamp=1.0)
+    with CaptureLog(path) as log:
+        assert [r.time for r in log] == [2.0, 2.0]
+
+
+def _reference(path):
+    with CaptureLog(path) as log:
+        return list(log), log.ports
+
+
+def test_missing_index(session):
+    expected = _reference(session)
+    index_path(session).unlink()
+    assert _reference(session) == expected
+
+
+@pytest.mark.parametrize("entries", [0, 1, 2, 10, 41])
+def test_partial_index(session, entries):
+    expected = _reference(session)
+    index = index_path(session)
+    index.write_bytes(index.read_bytes()[:entries * _INDEX_ENTRY + 5])  # Torn last entry
+    assert _reference(session) == expected
+
+
+@pytest.mark.parametrize("cut", [1, 4, 10, 200])
+def test_truncated_record(session, cut):
+    records, ports = _reference(session)
+    data = session.read_bytes()
+    # Drop the program change record (length, 12-byte header, 2 bytes)
+    # and cut into the response before it
+    session.write_bytes(data[:len(data) - (4 + 12 + 2) - cut])
+    with CaptureLog(session) as log:
+        assert list(log) == records[:-2]
+        assert log.ports == ports
+    index_path(session).unlink()
+    with CaptureLog(session) as log:
+        assert list(log) == records[:-2]
+
+
+def test_not_a_capture_log(tmp_path):
+    for content in (b"", MAGIC, b"G9BK" + bytes(20)):
+        path = tmp_path / "bad.g9cap"
+        path.write_bytes(content)
+        with pytest.raises(ValueError):
+            CaptureLog(path)
+
+
+def test_timed_flush(tmp_path, capture_messages):
+    path = tmp_path / "live.g9cap"
+    writer = CaptureWriter(path, flush_interval=0.02)
+    try:
+        writer.write(capture_messages[0], DIR_RX, "G9.2tt")
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            with CaptureLog(path) as log:
+                if len(log):
+                    break
+            time.sleep(0.01)
+        with CaptureLog(path) as log:
+            assert [r.data for r in log] == [capture_messages[0]]
+            assert log.ports == ["G9.2tt"]
+    finally:
+        writer.close()
+    assert writer.count == 1
+
+
+@pytest.mark.parametrize("interval", [0, -1])
+def test_invalid_flush_interval(tmp_path, interval):
+    with pytest.raises(ValueError):
+        CaptureWriter(tmp_path / "log.g9cap", flush_interval=interval)
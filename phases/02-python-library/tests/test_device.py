@@ -0,0 +1,262 @@
+"""Tests for G9Device against recording transports and the VirtualG9 emulator."""
+
+import time
+
+import pytest
+
+from zoomg9.addressing import resolve_parameter
+from zoomg9.constants import CMD_PARAM_CHANGE, CMD_READ_PATCH
+from zoomg9.device import G9Device, G9DeviceError
+from zoomg9.emulator import VirtualG9
+from zoomg9.patch import Patch
+from zoomg9.protocol import (
+    DISABLE_LIVE,
+    ENABLE_LIVE,
+    ENTER_EDIT,
+    EXIT_EDIT,
+    IDENTITY_REQUEST,
+    SysexTemplate,
+    build_disable_live,
+    build_enable_live,
+    build_enter_edit,
+    build_exit_edit,
+    build_identity_request,
+    build_param_change,
+    build_read_request,
+)
+from zoomg9.transport import MidoTransport, Transport
+
+
+class RecordingTransport(Transport):
+    """Transport that keeps a copy of every message sent and never replies."""
+
+    def __init__(self):
+        self.messages = []
+
+    def open(self, callback):
+        self.callback = callback
+
+    def close(self):
+        pass
+
+    def send(self, data):
+        self.messages.append(bytes(data))
+
+
+@pytest.fixture
+def recorded(no_delays):
+    """Connected G9Device on a RecordingTransport, without mode-switch delays."""
+    transport = RecordingTransport()
+    device = G9Device(transport=transport)
+    device.connect()
+    yield device, transport
+    device.disconnect()
+
+
+class TestSendPath:
+    def test_constant_messages(self):
+        assert build_enter_edit() is ENTER_EDIT
+        assert ENTER_EDIT == bytes([0xF0, 0x52, 0x00, 0x42, 0x12, 0xF7])
+        assert build_exit_edit() == EXIT_EDIT == bytes([0xF0, 0x52, 0x00, 0x42, 0x1F, 0xF7])
+        assert build_enable_live() == ENABLE_LIVE == bytes([0xF0, 0x52, 0x00, 0x42, 0x50, 0xF7])
+        assert build_disable_live() == DISABLE_LIVE == bytes([0xF0, 0x52, 0x00, 0x42, 0x51, 0xF7])
+        assert build_identity_request() == IDENTITY_REQUEST
+
+    def test_template_fill_in_place(self):
+        template = SysexTemplate(CMD_PARAM_CHANGE, 4)
+        first = template.fill(0x05, 0x02, 80, 0x00)
+        assert first == build_param_change(0x05, 0x02, 80)
+        second = template.fill(0x01, 0x03, 0x10, 0x01)
+        assert second is first
+        assert second == build_param_change(0x01, 0x03, 0x90)
+
+    def test_read_request_bytes(self, recorded):
+        device, transport = recorded
+        device._on_message(EXIT_EDIT)  # Not a read response: fails at once
+        with pytest.raises(G9DeviceError):
+            device.read_patch(42)
+        assert transport.messages == [build_read_request(42)]
+
+    def test_param_change_bytes(self, recorded):
+        device, transport = recorded
+        device.set_parameter("amp", "gain", 80)
+        device.set_parameter("amp", "gain", 81)
+        handle = resolve_parameter("amp", "gain")
+        assert transport.messages == [
+            ENABLE_LIVE,
+            build_param_change(handle.effect_id, handle.param_id, 80),
+            build_param_change(handle.effect_id, handle.param_id, 81),
+        ]
+
+    def test_disconnect_leaves_modes(self, recorded):
+        device, transport = recorded
+        device.enter_edit_mode()
+        device.enable_live_mode()
+        device.disconnect()
+        assert transport.messages == [ENTER_EDIT, ENABLE_LIVE, DISABLE_LIVE, EXIT_EDIT]
+
+    def test_not_connected(self):
+        device = G9Device(transport=RecordingTransport())
+        with pytest.raises(G9DeviceError):
+            device.set_parameter("amp", "gain", 80)
+
+
+class FakeOutput:
+    """mido output port without an rtmidi backend."""
+
+    def __init__(self):
+        self.sent = []
+
+    def send(self, msg):
+        self.sent.append(msg)
+
+
+class TestMidoTransport:
+    def test_sysex_without_raw_send(self):
+        transport = MidoTransport("test")
+        transport._outport = FakeOutput()
+        message = SysexTemplate(CMD_READ_PATCH, 1).fill(7)
+        transport.send(message)
+
+        sent = transport._outport.sent[0]
+        assert sent.type == "sysex"
+        assert bytes(sent.bin()) == build_read_request(7)
+
+    def test_program_change_without_raw_send(self):
+        transport = MidoTransport("test")
+        transport._outport = FakeOutput()
+        transport.send(bytes([0xC0, 12]))
+        assert transport._outport.sent[0].program == 12
+
+    def test_raw_send(self):
+        transport = MidoTransport("test")
+        sent = []
+        transport._raw_send = sent.append
+        transport.send(ENTER_EDIT)
+        assert sent == [ENTER_EDIT]
+
+
+class TestReceive:
+    def test_read_patch(self, device, bank_data):
+        for patch_num in (0, 42, 99):
+            assert device.read_patch(patch_num).to_bytes() == bank_data[patch_num]
+
+    def test_identity(self, device):
+        info = device.identity()
+        assert info["valid"] and info["firmware"] == "1.08"
+
+    def test_reply_wakes_receiver(self, device):
+        start = time.monotonic()
+        for patch_num in range(100):
+            device.read_patch(patch_num)
+        # Polling every 10 ms would take at least a second
+        assert time.monotonic() - start < 0.5
+
+    def test_stale_messages_dropped_on_connect(self, bank_data):
+        device = G9Device(transport=VirtualG9(bank=bank_data))
+        device._on_message(EXIT_EDIT)
+        device.connect()
+        try:
+            assert device.read_patch(3).to_bytes() == bank_data[3]
+        finally:
+            device.disconnect()
+
+    def test_timeout(self, recorded):
+        device, _ = recorded
+        start = time.monotonic()
+        assert device._receive_sysex(timeout=0.05) is None
+        assert time.monotonic() - start < 1.0
+
+
+class CountingPedal(VirtualG9):
+    """VirtualG9 that counts the read requests per patch."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.requests = [0] * 100
+
+    def send(self, data):
+        if bytes(data[:5]) == bytes([0xF0, 0x52, 0x00, 0x42, 0x11]):
+            self.requests[data[5]] += 1
+        super().send(data)
+
+
+class TestReadAll:
+    def test_read_all(self, device, bank_data):
+        progress = []
+        patches = device.read_all(progress_callback=lambda done, total: progress.append(done))
+        assert [p.to_bytes() for p in patches] == bank_data
+        assert progress == list(range(1, 101))
+
+    @pytest.mark.parametrize("window, max_window", [(1, 1), (4, 8), (8, 8)])
+    def test_windows(self, device, bank_data, window, max_window):
+        patches = device.read_all(window=window, max_window=max_window)
+        assert [p.to_bytes() for p in patches] == bank_data
+
+    def test_recovers_dropped_replies(self, bank_data):
+        pedal = VirtualG9(bank=bank_data, drop_rate=0.1, seed=3)
+        with G9Device(transport=pedal) as device:
+            patches = device.read_all(timeout=0.05, retries=10)
+        assert [p.to_bytes() for p in patches] == bank_data
+        assert pedal.dropped > 0
+
+    def test_gives_up_after_retries(self, bank_data):
+        pedal = CountingPedal(bank=bank_data, drop_rate=1.0)
+        with G9Device(transport=pedal) as device:
+            with pytest.raises(G9DeviceError):
+                device.read_all(timeout=0.02, retries=2)
+        assert pedal.requests[0] == 3  # retries + 1
+
+    def test_invalid_window(self, device):
+        with pytest.raises(ValueError):
+            device.read_all(window=0)
+        with pytest.raises(ValueError):
+            device.read_all(window=4, max_window=2)
+
+
+class TestWritePatch:
+    def test_direct_write(self, bank_data, no_delays):
+        pedal = CountingPedal(bank=bank_data)
+        patch = Patch.from_bytes(bank_data[5])
+        patch.name = "Direct"
+        with G9Device(transport=pedal) as device:
+            device.write_patch(12, patch)
+            assert not device._in_edit_mode
+        assert pedal.get_patch(12).name == "Direct"
+        assert pedal.bank[11] == bank_data[11]
+        assert sum(pedal.requests) == 0
+        assert not pedal.in_edit_mode
+
+    def test_keeps_edit_mode(self, device, pedal):
+        device.enter_edit_mode()
+        device.write_patch(3, Patch("Edit"))
+        assert device._in_edit_mode and pedal.in_edit_mode
+        assert pedal.get_patch(3).name == "Edit"
+
+    def test_cached_bank_reads_missing_slots(self, bank_data, no_delays):
+        pedal = CountingPedal(bank=bank_data)
+        with G9Device(transport=pedal) as device:
+            device.read_patch(7)
+            device.write_patch(8, Patch("Cached"))
+            bank = device.cached_bank()
+            assert bank[8] == Patch("Cached").to_bytes()
+            assert bank[:8] == bank_data[:8] and bank[9:] == bank_data[9:]
+            assert pedal.requests[7] == 1 and pedal.requests[8] == 0
+            assert sum(pedal.requests) == 99
+
+            device.cached_bank()
+            assert sum(pedal.requests) == 99
+            device.invalidate_cache()
+            device.cached_bank()
+            assert sum(pedal.requests) == 199
+
+    def test_bulk_write(self, device, pedal, bank_data):
+        pedal.bulk_rx()
+        device.write_patch(20, Patch("Bulk"), bulk=True)
+        assert pedal.get_patch(20).name == "Bulk"
+        assert pedal.bank[:20] == bank_data[:20]
+        assert pedal.bank[21:] == bank_data[21:]
+
+    def test_patch_number_range(self, device):
+        with pytest.raises(ValueError):
+            device.write_patch(100, Patch())
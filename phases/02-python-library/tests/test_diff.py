@@ -0,0 +1,128 @@
+"""Tests for patch diffs and the update planner."""
+
+import pytest
+
+from zoomg9.bank import PatchBank
+from zoomg9.diff import (
+    FULL_WRITE_COST,
+    FieldChange,
+    _UNMAPPED,
+    diff_banks,
+    diff_patches,
+    plan_update,
+)
+from zoomg9.patch import Patch
+from zoomg9.protocol import build_param_change
+from zoomg9.view import PatchView
+
+
+@pytest.fixture
+def patch_a(capture_patches):
+    """A captured patch on amp channel A."""
+    data = next(d for d in capture_patches if PatchView(d).amp_sel == 0)
+    return bytes(data)
+
+
+def _edit(data: bytes, **fields) -> bytes:
+    """Copy of data with "module__field" values set through PatchView."""
+    buf = bytearray(data)
+    view = PatchView(buf)
+    for key, value in fields.items():
+        module, _, field = key.partition("__")
+        setattr(getattr(view, module) if field else view, field or module, value)
+    return bytes(buf)
+
+
+class TestDiff:
+    def test_identical(self, capture_patches):
+        for data in capture_patches[:10]:
+            assert diff_patches(data, Patch.from_bytes(data)) == []
+
+    def test_fields(self, patch_a):
+        old = PatchView(patch_a)
+        new = _edit(patch_a, amp_a__gain=(old.amp_a.gain + 1) % 100, delay__on=not old.delay.on)
+        changes = diff_patches(patch_a, new)
+        assert [c.field for c in changes] == ["amp_a.gain", "delay.on"]
+        assert changes[0] == FieldChange("amp_a.gain", old.amp_a.gain, PatchView(new).amp_a.gain,
+                                         (0x05, 0x02))
+
+    def test_name_and_unmapped_bytes(self, patch_a):
+        new = bytearray(_edit(patch_a, name="Other"))
+        new[_UNMAPPED[0]] ^= 0x01
+        fields = [c.field for c in diff_patches(patch_a, new)]
+        assert fields == ["name", f"raw[0x{_UNMAPPED[0]:02X}]"]
+
+    def test_diff_banks(self, bank_data):
+        old = PatchBank(b"".join(bank_data))
+        new = old.snapshot()
+        new[4] = _edit(bank_data[4], tempo=200 if PatchView(bank_data[4]).tempo != 200 else 201)
+        result = diff_banks(old, new)
+        assert list(result) == [4]
+        assert [c.field for c in result[4]] == ["tempo"]
+        assert diff_banks(old.to_list(), new.to_list()) == result
+        with pytest.raises(ValueError):
+            diff_banks(bank_data, bank_data[:99])
+
+
+class TestPlan:
+    def test_no_changes(self, patch_a):
+        plan = plan_update(patch_a, patch_a)
+        assert not plan.full_write and plan.messages == [] and plan.cost == 0
+
+    def test_param_changes_toggles_first(self, patch_a):
+        old = PatchView(patch_a)
+        new = _edit(patch_a, mod__rate=(old.mod.rate + 1) % 50, comp__on=not old.comp.on)
+        plan = plan_update(patch_a, new)
+        assert not plan.full_write
+        assert plan.messages == [
+            build_param_change(0x01, 0x00, int(not old.comp.on)),
+            build_param_change(0x08, 0x03, (old.mod.rate + 1) % 50),
+        ]
+        assert plan.cost == 20
+        assert plan.data == new
+
+    def test_type_change_resends_module(self, patch_a):
+        old = PatchView(patch_a)
+        new_view = PatchView(_edit(patch_a, delay__type=(old.delay.type + 1) % 3,
+                                   delay__mix=(old.delay.mix + 1) % 50))
+        plan = plan_update(patch_a, new_view.to_bytes())
+        assert not plan.full_write
+        assert [c.field for c in plan.changes] == ["delay.type", "delay.mix"]
+        delay = new_view.delay
+        assert plan.messages == [
+            build_param_change(0x09, 0x01, delay.type),
+            build_param_change(0x09, 0x02, delay.time),
+            build_param_change(0x09, 0x03, delay.feedback),
+            build_param_change(0x09, 0x04, delay.hidamp),
+            build_param_change(0x09, 0x05, delay.mix),
+        ]
+        assert plan_update(patch_a, new_view.to_bytes(), max_params=4).full_write
+
+    def test_full_write_for_name(self, patch_a):
+        plan = plan_update(patch_a, _edit(patch_a, name="Renamed"))
+        assert plan.full_write and plan.cost == FULL_WRITE_COST
+
+    def test_full_write_for_other_channel(self, patch_a):
+        old = PatchView(patch_a)
+        plan = plan_update(patch_a, _edit(patch_a, amp_b__gain=(old.amp_b.gain + 1) % 100))
+        assert plan.full_write
+
+    def test_full_write_when_cheaper(self, patch_a):
+        old = PatchView(patch_a)
+        new = _edit(patch_a, mod__rate=(old.mod.rate + 1) % 50,
+                    delay__mix=(old.delay.mix + 1) % 50)
+        assert not plan_update(patch_a, new).full_write
+        assert plan_update(patch_a, new, max_params=1).full_write
+
+    def test_apply_live(self, device, pedal, patch_a):
+        old = PatchView(patch_a)
+        new = _edit(patch_a, mod__rate=(old.mod.rate + 1) % 50)
+        device.apply_update(plan_update(patch_a, new))
+        assert pedal.params[(0x08, 0x03)] == (old.mod.rate + 1) % 50
+
+    def test_apply_full_write(self, device, pedal, patch_a):
+        plan = plan_update(patch_a, _edit(patch_a, name="Planned"))
+        with pytest.raises(ValueError):
+            device.apply_update(plan)
+        device.apply_update(plan, patch_num=6)
+        assert pedal.bank[6] == plan.data
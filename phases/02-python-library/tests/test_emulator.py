@@ -0,0 +1,137 @@
+"""Tests for the VirtualG9 emulator."""
+
+import queue
+
+import pytest
+
+from zoomg9.emulator import IDENTITY_RESPONSE, VirtualG9
+from zoomg9.messages import EditExit, ReadRequest, decode_message
+from zoomg9.patch import Patch
+from zoomg9.protocol import (
+    ENTER_EDIT,
+    EXIT_EDIT,
+    IDENTITY_REQUEST,
+    build_param_change,
+    build_patch_select,
+    build_read_request,
+    build_read_response,
+    build_write_data,
+    parse_read_response,
+)
+
+
+@pytest.fixture
+def opened(pedal):
+    """The pedal, opened, and a queue of its replies."""
+    replies = queue.Queue()
+    pedal.open(replies.put)
+    yield pedal, replies
+    pedal.close()
+
+
+def test_read_request(opened, bank_data):
+    pedal, replies = opened
+    for patch_num in (0, 50, 99):
+        pedal.send(build_read_request(patch_num))
+    for patch_num in (0, 50, 99):
+        assert parse_read_response(replies.get(timeout=1)) == (patch_num, bank_data[patch_num])
+
+
+def test_replies_keep_order(bank_data):
+    pedal = VirtualG9(bank=bank_data, latency=0.001, jitter=0.01, seed=5)
+    replies = queue.Queue()
+    pedal.open(replies.put)
+    try:
+        for patch_num in range(20):
+            pedal.send(build_read_request(patch_num))
+        assert [replies.get(timeout=1)[5] for _ in range(20)] == list(range(20))
+    finally:
+        pedal.close()
+
+
+def test_identity(opened):
+    pedal, replies = opened
+    pedal.send(IDENTITY_REQUEST)
+    assert replies.get(timeout=1) == IDENTITY_RESPONSE
+
+
+def test_drop_rate(bank_data):
+    pedal = VirtualG9(bank=bank_data, drop_rate=0.5, seed=6)
+    replies = queue.Queue()
+    pedal.open(replies.put)
+    try:
+        for patch_num in range(100):
+            pedal.send(build_read_request(patch_num))
+        while pedal.sent + pedal.dropped < 100:
+            replies.get(timeout=1)
+        assert 20 < pedal.dropped < 80
+        assert pedal.received == 100
+    finally:
+        pedal.close()
+
+
+def test_write_needs_confirm(opened, bank_data):
+    pedal, _ = opened
+    data = Patch("Pending").to_bytes()
+    pedal.send(ENTER_EDIT)
+    pedal.send(build_patch_select(4, 0x02))
+    pedal.send(build_write_data(data))
+    assert pedal.bank[4] == bank_data[4]
+    pedal.send(build_patch_select(4, 0x09))
+    assert pedal.bank[4] == data
+    pedal.send(EXIT_EDIT)
+    assert not pedal.in_edit_mode
+
+
+def test_param_change_and_program_change(opened):
+    pedal, _ = opened
+    pedal.send(build_param_change(0x05, 0x02, 300))
+    pedal.send(bytes([0xC0, 17]))
+    assert pedal.params[(0x05, 0x02)] == 300
+    assert pedal.current_patch == 17
+
+
+def test_bulk_receive(opened, bank_data):
+    pedal, replies = opened
+    pedal.bulk_rx()
+    pedal.send(ENTER_EDIT)
+
+    new_bank = list(reversed(bank_data))
+    requests = []
+    while True:
+        msg = decode_message(replies.get(timeout=1))
+        if isinstance(msg, EditExit):
+            break
+        assert isinstance(msg, ReadRequest)
+        requests.append(msg.patch_num)
+        response = bytearray(build_read_response(msg.patch_num, new_bank[msg.patch_num]))
+        if requests == list(range(11)):
+            response[100] ^= 0x01  # Corrupt patch 10 once: the pedal asks again
+        pedal.send(response)
+
+    assert requests == list(range(11)) + list(range(10, 100))
+    assert pedal.bank == new_bank
+    assert not pedal.in_edit_mode
+
+
+def test_invalid_arguments(bank_data):
+    with pytest.raises(ValueError):
+        VirtualG9(bank=bank_data[:99])
+    with pytest.raises(ValueError):
+        VirtualG9(drop_rate=1.5)
+
+
+def test_close_discards_replies(bank_data):
+    pedal = VirtualG9(bank=bank_data, latency=0.05)
+    replies = queue.Queue()
+    pedal.open(replies.put)
+    pedal.send(build_read_request(0))
+    pedal.close()
+    with pytest.raises(queue.Empty):
+        replies.get(timeout=0.1)
+
+
+def test_open_twice(opened):
+    pedal, replies = opened
+    with pytest.raises(RuntimeError):
+        pedal.open(replies.put)
@@ -0,0 +1,128 @@
+"""Tests for the bit-packed field codec and the nibble / 7-bit codecs."""
+
+import pytest
+
+from zoomg9 import encoding
+from zoomg9.constants import BIT_TBL
+from zoomg9.encoding import (
+    BIT_FIELDS,
+    PACKED_SIZE,
+    decode_7bit,
+    decode_7bit_batch,
+    decode_nibbles,
+    decode_nibbles_batch,
+    encode_7bit,
+    encode_7bit_batch,
+    encode_nibbles,
+    encode_nibbles_batch,
+    pack_bits,
+    pack_fields,
+    unpack_bits,
+    unpack_fields,
+    update_fields,
+)
+
+
+def _reference_unpack(data: bytes) -> list:
+    """Bit-by-bit reading of BIT_TBL, LSB first (the original algorithm)."""
+    matrix = [[0] * 8 for _ in range(12)]
+    bit_pos = 0
+    for row in range(12):
+        for col in range(8):
+            value = 0
+            for i in range(BIT_TBL[row][col]):
+                if data[(bit_pos + i) // 8] >> ((bit_pos + i) % 8) & 1:
+                    value |= 1 << i
+            matrix[row][col] = value
+            bit_pos += BIT_TBL[row][col]
+    return matrix
+
+
+class TestBitFields:
+    def test_layout_covers_bit_table(self):
+        widths = [w for row in BIT_TBL for w in row if w]
+        assert len(BIT_FIELDS) == len(widths)
+        assert PACKED_SIZE == (sum(widths) + 7) // 8
+
+    def test_unpack_matches_reference(self, capture_patches):
+        for data in capture_patches:
+            assert unpack_bits(data) == _reference_unpack(data)
+
+    def test_round_trip_captured_patches(self, capture_patches):
+        for data in capture_patches:
+            assert pack_bits(unpack_bits(data)) == data[:PACKED_SIZE]
+            assert pack_fields(unpack_fields(data)) == data[:PACKED_SIZE]
+
+    def test_pack_truncates_to_field_width(self):
+        values = [0xFFFF] * len(BIT_FIELDS)
+        assert unpack_fields(pack_fields(values)) == [f[4] for f in BIT_FIELDS]
+
+    def test_pack_rejects_wrong_length(self):
+        with pytest.raises(ValueError):
+            pack_fields([0] * (len(BIT_FIELDS) - 1))
+
+    def test_update_keeps_other_fields(self, capture_patches):
+        data = bytearray(capture_patches[0])
+        before = unpack_fields(data)
+        update_fields(data, 3, [0, None, 1])
+
+        after = unpack_fields(data)
+        assert after[3] == 0 and after[5] == 1
+        assert after[:3] == before[:3]
+        assert after[4] == before[4]
+        assert after[6:] == before[6:]
+        assert data[PACKED_SIZE:] == capture_patches[0][PACKED_SIZE:]
+
+    def test_update_rejects_out_of_range(self):
+        with pytest.raises(ValueError):
+            update_fields(bytearray(128), len(BIT_FIELDS) - 1, [0, 0])
+
+
+@pytest.fixture(params=["numpy", "pure"])
+def batch_backend(request, monkeypatch):
+    """Run the batch codec tests with and without NumPy."""
+    if request.param == "numpy":
+        if encoding.np is None:
+            pytest.skip("numpy not installed")
+    else:
+        monkeypatch.setattr(encoding, "np", None)
+    return request.param
+
+
+class TestBatchCodecs:
+    def test_nibbles_match_single(self, batch_backend, bank_data):
+        raw = b"".join(bank_data)
+        nibbles = encode_nibbles_batch(raw)
+        assert nibbles == b"".join(encode_nibbles(p) for p in bank_data)
+        assert decode_nibbles_batch(nibbles) == raw
+        assert decode_nibbles_batch(nibbles) == b"".join(
+            decode_nibbles(nibbles[i:i + 256]) for i in range(0, len(nibbles), 256)
+        )
+
+    def test_7bit_match_single(self, batch_backend, bank_data):
+        raw = b"".join(bank_data)
+        encoded = encode_7bit_batch(raw)
+        assert encoded == b"".join(encode_7bit(p) for p in bank_data)
+        assert decode_7bit_batch(encoded) == raw
+        assert decode_7bit_batch(encoded) == b"".join(
+            decode_7bit(encoded[i:i + 147]) for i in range(0, len(encoded), 147)
+        )
+
+    def test_7bit_round_trip_high_bits(self, batch_backend):
+        raw = bytes(range(128, 256)) + bytes(range(128))
+        assert decode_7bit_batch(encode_7bit_batch(raw)) == raw
+        assert max(encode_7bit_batch(raw)) < 0x80
+
+    def test_accepts_memoryview(self, batch_backend, bank_data):
+        raw = b"".join(bank_data[:3])
+        assert decode_7bit_batch(memoryview(encode_7bit_batch(raw))) == raw
+
+    def test_empty_batch(self, batch_backend):
+        assert encode_nibbles_batch(b"") == b""
+        assert decode_7bit_batch(b"") == b""
+
+    def test_rejects_partial_patch(self, batch_backend):
+        with pytest.raises(ValueError):
+            decode_nibbles_batch(bytes(255))
+        with pytest.raises(ValueError):
+            encode_7bit_batch(bytes(129))
@@ -0,0 +1,98 @@
+"""Tests for the bulk .syx importer."""
+
+import pytest
+
+from zoomg9.capture import DIR_RX, DIR_TX, CaptureWriter
+from zoomg9.importer import FileResult, decode_file, find_syx, import_syx
+from zoomg9.library import PatchLibrary
+from zoomg9.protocol import build_read_request
+from zoomg9.store import PatchStore, patch_key
+
+
+@pytest.fixture
+def tree(tmp_path, capture_messages):
+    """Captures split over nested files, one corrupt message, one stray file."""
+    corrupt = bytearray(capture_messages[0])
+    corrupt[100] ^= 0x01
+    (tmp_path / "a").mkdir()
+    (tmp_path / "a" / "b").mkdir()
+    (tmp_path / "one.syx").write_bytes(b"".join(capture_messages[:40]))
+    (tmp_path / "a" / "two.syx").write_bytes(bytes(corrupt) + b"".join(capture_messages[40:80]))
+    (tmp_path / "a" / "b" / "three.syx").write_bytes(b"".join(capture_messages[80:]))
+    (tmp_path / "a" / "notes.txt").write_text("not a capture")
+    return tmp_path
+
+
+def _distinct(patches) -> int:
+    return len({patch_key(data) for data in patches})
+
+
+def test_find_syx(tree):
+    files = find_syx([tree, tree / "one.syx"])
+    assert [f.relative_to(tree).as_posix() for f in files] == [
+        "a/b/three.syx", "a/two.syx", "one.syx",
+    ]
+
+
+def test_decode_file(tree, capture_patches):
+    result = decode_file(str(tree / "a" / "two.syx"))
+    assert [data for _, data in result.patches] == capture_patches[40:80]
+    assert len(result.errors) == 1
+
+    rows = decode_file(str(tree / "one.syx"), rows=True).patches
+    assert rows == [PatchLibrary.row(data, str(tree / "one.syx"), num)
+                    for num, data in decode_file(str(tree / "one.syx")).patches]
+
+
+def test_decode_file_unverified(tree):
+    assert len(decode_file(str(tree / "a" / "two.syx"), verify=False).patches) == 41
+
+
+def test_decode_missing_file(tmp_path):
+    result = decode_file(str(tmp_path / "gone.syx"))
+    assert result.patches == [] and len(result.errors) == 1
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_import_into_store(tree, tmp_path, capture_patches, workers):
+    progress = []
+    store = PatchStore(tmp_path / "patches.g9s")
+    report = import_syx([tree], store, workers=workers, batch_size=16,
+                        progress_callback=lambda done, total: progress.append((done, total)))
+    assert len(PatchStore(tmp_path / "patches.g9s")) == _distinct(capture_patches)
+    assert report.files == 3
+    assert report.patches == len(capture_patches)
+    assert report.new == _distinct(capture_patches)
+    assert list(report.errors) == [str(tree / "a" / "two.syx")]
+    assert progress == [(1, 3), (2, 3), (3, 3)]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_import_into_library(tree, capture_patches, workers):
+    with PatchLibrary() as lib:
+        report = import_syx([tree], lib, workers=workers)
+        assert len(lib) == report.new == _distinct(capture_patches)
+        again = import_syx([tree], lib, workers=workers)
+        assert again.new == 0 and again.patches == report.patches
+
+
+def test_import_into_callable(tree, capture_patches):
+    results = []
+    report = import_syx([tree], results.append, workers=1)
+    assert all(isinstance(result, FileResult) for result in results)
+    assert sum(len(result.patches) for result in results) == len(capture_patches)
+    assert report.new == report.patches
+
+
+def test_import_capture_log(tmp_path, capture_messages, capture_patches):
+    path = tmp_path / "session.g9cap"
+    with CaptureWriter(path) as log:
+        for num, message in enumerate(capture_messages[:10]):
+            log.write(build_read_request(num), DIR_TX, "UM-ONE")
+            log.write(message, DIR_RX, "UM-ONE")
+    with PatchLibrary() as lib:
+        report = import_syx([tmp_path], lib, workers=1)
+    assert report.files == 1
+    assert report.patches == 10
+    assert report.new == _distinct(capture_patches[:10])
+    assert not report.errors
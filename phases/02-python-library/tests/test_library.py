@@ -0,0 +1,112 @@
+"""Tests for the SQLite PatchLibrary."""
+
+import pytest
+
+from zoomg9.bank import PatchBank
+from zoomg9.library import COLUMNS, LibraryEntry, PatchLibrary
+from zoomg9.protocol import parse_read_response
+from zoomg9.store import patch_key
+from zoomg9.view import PatchView
+
+
+def _distinct(patches):
+    """Patches in first-seen order, without repeated bytes."""
+    seen = {}
+    for data in patches:
+        seen.setdefault(patch_key(data), data)
+    return list(seen.values())
+
+
+@pytest.fixture
+def library(capture_patches):
+    lib = PatchLibrary()
+    lib.add_many(enumerate(capture_patches), source="captures")
+    yield lib
+    lib.close()
+
+
+def test_deduplicates(library, capture_patches):
+    distinct = _distinct(capture_patches)
+    assert len(library) == len(distinct)
+    assert library.add_many(enumerate(capture_patches)) == 0
+    assert [library.raw(entry.id) for entry in library.find()] == distinct
+
+
+def test_find_matches_views(library, capture_patches):
+    distinct = [PatchView(d) for d in _distinct(capture_patches)]
+
+    hits = library.find(delay_on=True)
+    assert [library.raw(e.id) for e in hits] == [v.to_bytes() for v in distinct if v.delay.on]
+
+    types = sorted({v.amp.type for v in distinct})[:2]
+    hits = library.find(amp_type=types, reverb_on=False)
+    assert [library.raw(e.id) for e in hits] == [
+        v.to_bytes() for v in distinct if v.amp.type in types and not v.reverb.on
+    ]
+
+    hits = library.find("delay_time > ?", (1000,), mod_on=True)
+    assert [library.raw(e.id) for e in hits] == [
+        v.to_bytes() for v in distinct if v.delay.time > 1000 and v.mod.on
+    ]
+
+
+def test_count_and_limit(library):
+    assert library.count() == len(library)
+    assert library.count(delay_on=True) == len(library.find(delay_on=True))
+    assert len(library.find(limit=3)) == 3
+
+
+def test_name_search(library, capture_patches):
+    name = PatchView(capture_patches[0]).name
+    hits = library.find(name=name)
+    assert hits and all(e.name == name for e in hits)
+    assert hits[0] == LibraryEntry(1, name, "captures", 0)
+
+
+def test_selected_channel_columns(library):
+    for entry in library.find():
+        view = library.view(entry.id)
+        row = library._conn.execute(
+            "SELECT amp_gain, eq_band2 FROM patches WHERE id = ?", (entry.id,)
+        ).fetchone()
+        assert row == (view.amp.gain, view.eq.band2)
+
+
+def test_add_and_get(capture_patches):
+    with PatchLibrary() as lib:
+        patch_id = lib.add(capture_patches[0], source="x", slot=4)
+        assert lib.add(capture_patches[0]) == patch_id
+        assert lib.get(patch_id).to_bytes() == capture_patches[0]
+        with pytest.raises(KeyError):
+            lib.raw(patch_id + 1)
+
+
+def test_add_bank(bank_data):
+    with PatchLibrary() as lib:
+        lib.add_bank(PatchBank(b"".join(bank_data)), source="pedal")
+        entry = lib.find(limit=1)[0]
+        assert (entry.source, entry.slot) == ("pedal", 0)
+
+
+def test_import_dir(tmp_path, capture_messages):
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "a.syx").write_bytes(b"".join(capture_messages[:3]))
+    (tmp_path / "sub" / "b.syx").write_bytes(b"".join(capture_messages[3:6]))
+    with PatchLibrary(tmp_path / "lib.db") as lib:
+        assert lib.import_dir(tmp_path) == len(_distinct(
+            parse_read_response(m)[1] for m in capture_messages[:6]
+        ))
+    with PatchLibrary(tmp_path / "lib.db") as lib:
+        sources = {e.source for e in lib.find()}
+    assert sources <= {str(tmp_path / "a.syx"), str(tmp_path / "sub" / "b.syx")}
+
+
+def test_unknown_column(library):
+    assert "delay_time" in COLUMNS
+    with pytest.raises(ValueError):
+        library.find(no_such_column=1)
+
+
+def test_row_size():
+    with pytest.raises(ValueError):
+        PatchLibrary.row(bytes(127))
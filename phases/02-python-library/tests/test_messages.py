@@ -0,0 +1,98 @@
+"""Tests for the typed SysEx message classes."""
+
+import pytest
+
+from zoomg9.emulator import IDENTITY_RESPONSE
+from zoomg9.messages import (
+    EditEnter,
+    EditExit,
+    Identity,
+    IdentityRequest,
+    LiveDisable,
+    LiveEnable,
+    ParamChange,
+    ReadRequest,
+    ReadResponse,
+    UnknownMessage,
+    WriteData,
+    decode_message,
+)
+from zoomg9.protocol import (
+    DISABLE_LIVE,
+    ENABLE_LIVE,
+    ENTER_EDIT,
+    EXIT_EDIT,
+    IDENTITY_REQUEST,
+    SysexFramer,
+    build_param_change,
+    build_read_request,
+    build_write_data,
+    parse_read_response,
+)
+
+
+@pytest.mark.parametrize("raw, cls", [
+    (build_read_request(7), ReadRequest),
+    (ENTER_EDIT, EditEnter),
+    (EXIT_EDIT, EditExit),
+    (build_write_data(bytes(128)), WriteData),
+    (build_param_change(0x05, 0x02, 80), ParamChange),
+    (ENABLE_LIVE, LiveEnable),
+    (DISABLE_LIVE, LiveDisable),
+    (IDENTITY_REQUEST, IdentityRequest),
+    (IDENTITY_RESPONSE, Identity),
+])
+def test_message_types(raw, cls):
+    assert type(decode_message(raw)) is cls
+
+
+def test_read_response(capture_messages):
+    for raw in capture_messages:
+        msg = decode_message(raw)
+        assert isinstance(msg, ReadResponse)
+        assert msg.verify()
+        assert (msg.patch_num, msg.decode()) == parse_read_response(raw)
+
+
+def test_read_response_corrupted(capture_messages):
+    raw = bytearray(capture_messages[0])
+    raw[100] ^= 0x01
+    assert not decode_message(raw).verify()
+
+
+def test_fields():
+    assert decode_message(build_read_request(42)).patch_num == 42
+
+    msg = decode_message(build_param_change(0x05, 0x02, 300))
+    assert (msg.effect_id, msg.param_id, msg.value) == (0x05, 0x02, 300)
+
+    data = bytes(range(128))
+    assert decode_message(build_write_data(data)).decode() == data
+
+    identity = decode_message(IDENTITY_RESPONSE)
+    assert identity.valid and identity.firmware == "1.08"
+
+
+def test_unknown_messages():
+    # Known command with the wrong size, and an unknown command
+    assert type(decode_message(build_read_request(7)[:-2] + b"\xF7")) is UnknownMessage
+    msg = decode_message(bytes([0xF0, 0x52, 0x00, 0x42, 0x7A, 0xF7]))
+    assert type(msg) is UnknownMessage and msg.command == 0x7A
+
+
+@pytest.mark.parametrize("raw", [
+    b"",
+    bytes([0xF0, 0x52, 0x00, 0x42, 0xF7]),
+    bytes([0xF0, 0x52, 0x00, 0x58, 0x12, 0xF7]),  # Another Zoom model
+    bytes([0xF0, 0x43, 0x00, 0x42, 0x12, 0xF7]),  # Another manufacturer
+    bytes([0x90, 0x52, 0x00, 0x42, 0x12, 0xF7]),
+])
+def test_not_g9_messages(raw):
+    assert decode_message(raw) is None
+
+
+def test_references_buffer(capture_messages):
+    view = SysexFramer().feed(capture_messages[0])[0]
+    msg = decode_message(view)
+    assert msg.raw is view
+    assert msg.nibbles.obj is view.obj
@@ -0,0 +1,111 @@
+"""Tests for Patch and the effect modules."""
+
+import pytest
+
+from zoomg9.effects import (
+    AmpModule,
+    CabModule,
+    CmpModule,
+    DlyModule,
+    EffectModule,
+    EqModule,
+    ExtModule,
+    ModModule,
+    RevModule,
+    WahModule,
+    ZnrModule,
+)
+from zoomg9.encoding import calculate_checksum
+from zoomg9.patch import Patch
+from zoomg9.view import PatchView
+
+MODULE_CLASSES = [AmpModule, CabModule, CmpModule, DlyModule, EqModule, ExtModule,
+                  ModModule, RevModule, WahModule, ZnrModule]
+
+
+class TestSlots:
+    @pytest.mark.parametrize("cls", MODULE_CLASSES + [Patch])
+    def test_no_instance_dict(self, cls):
+        assert not hasattr(cls(), "__dict__")
+
+    def test_misspelled_attribute_fails(self):
+        patch = Patch()
+        with pytest.raises(AttributeError):
+            patch.nmae = "Typo"
+        with pytest.raises(AttributeError):
+            patch.amp_a.gian = 80
+
+    def test_modules_share_base_slots(self):
+        assert "_on" in EffectModule.__slots__
+        for cls in MODULE_CLASSES:
+            assert "_on" not in cls.__slots__
+
+
+class TestIncrementalSerialization:
+    def test_round_trip_is_exact(self, capture_patches):
+        for data in capture_patches:
+            patch = Patch.from_bytes(data)
+            assert not patch.modified
+            assert patch.to_bytes() == data
+
+    def test_unmodified_returns_source(self, capture_patches):
+        patch = Patch.from_bytes(capture_patches[0])
+        assert patch.to_bytes() is patch.to_bytes()
+
+    def test_keeps_unknown_bytes(self, capture_patches):
+        for data in capture_patches[:20]:
+            patch = Patch.from_bytes(data)
+            patch.amp_a.gain = 7
+            patch.delay.time = 1234
+            patch.amp_b.level = 9
+            patch.tempo = 133
+
+            # Same edits through PatchView, which only touches those fields
+            expected = bytearray(data)
+            view = PatchView(expected)
+            view.amp_a.gain = 7
+            view.delay.time = 1234
+            view.amp_b.level = 9
+            view.tempo = 133
+
+            assert patch.modified
+            assert patch.to_bytes() == bytes(expected)
+            assert not patch.modified
+
+    def test_eq_band_change(self, capture_patches):
+        patch = Patch.from_bytes(capture_patches[0])
+        patch.eq_b.set_band(3, 31)
+        assert Patch.from_bytes(patch.to_bytes()).eq_b.get_band(3) == 31
+
+    def test_swapped_modules_are_written(self, capture_patches):
+        data = capture_patches[0]
+        patch = Patch.from_bytes(data)
+        patch.amp_a, patch.amp_b = patch.amp_b, patch.amp_a
+        assert patch.modified
+
+        swapped = Patch.from_bytes(patch.to_bytes())
+        original = Patch.from_bytes(data)
+        assert swapped.amp_a.gain == original.amp_b.gain
+        assert swapped.amp_b.type == original.amp_a.type
+
+    def test_module_from_another_patch(self, capture_patches):
+        first = Patch.from_bytes(capture_patches[0])
+        second = Patch.from_bytes(capture_patches[1])
+        first.mod = second.mod
+        result = Patch.from_bytes(first.to_bytes())
+        assert result.mod.depth == second.mod.depth
+        assert result.delay.time == Patch.from_bytes(capture_patches[0]).delay.time
+
+    def test_new_patch(self):
+        patch = Patch("Fresh")
+        assert Patch.from_bytes(patch.to_bytes()).name == "Fresh"
+
+    def test_checksum_cached_until_modified(self, capture_messages, capture_patches):
+        patch = Patch.from_bytes(capture_patches[0])
+        checksum = patch.checksum()
+        assert checksum == capture_messages[0][262:267]
+        assert patch.checksum() is checksum
+
+        patch.name = "Renamed"
+        assert patch.checksum() != checksum
+        assert patch.checksum() == calculate_checksum(patch.to_bytes())
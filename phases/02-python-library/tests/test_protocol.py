@@ -0,0 +1,210 @@
+"""Tests for SysEx message building, parsing and framing."""
+
+import io
+
+import pytest
+
+from zoomg9.encoding import _calculate_crc32, calculate_checksum, verify_checksum
+from zoomg9.messages import ParamChange
+from zoomg9.protocol import (
+    ChecksumError,
+    SysexFramer,
+    build_param_change,
+    build_read_response,
+    iter_patches,
+    iter_sysex,
+    parse_read_response,
+    verify_bank,
+)
+
+
+def _reference_crc32(data: bytes) -> int:
+    """Bitwise CRC-32 without the final XOR, as in G9ED.exe."""
+    crc = 0xFFFFFFFF
+    for byte in data:
+        crc ^= byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xEDB88320 if crc & 1 else crc >> 1
+    return crc
+
+
+def _corrupt(message: bytes, index: int = 100) -> bytes:
+    """Flip one nibble of a read response."""
+    data = bytearray(message)
+    data[index] ^= 0x01
+    return bytes(data)
+
+
+class TestChecksum:
+    def test_crc_matches_reference(self, capture_patches):
+        for data in capture_patches[:10]:
+            assert _calculate_crc32(data) == _reference_crc32(data)
+
+    def test_captured_checksums(self, capture_messages, capture_patches):
+        for message, data in zip(capture_messages, capture_patches):
+            assert message[262:267] == calculate_checksum(data)
+            assert verify_checksum(data, message[262:267])
+
+    def test_build_read_response_round_trip(self, capture_messages):
+        for message in capture_messages:
+            patch_num, data = parse_read_response(message)
+            assert build_read_response(patch_num, data) == message
+
+    def test_parse_detects_corruption(self, capture_messages):
+        with pytest.raises(ChecksumError) as info:
+            parse_read_response(_corrupt(capture_messages[0]))
+        assert info.value.patch_num == capture_messages[0][5]
+
+    def test_parse_without_verify(self, capture_messages):
+        patch_num, data = parse_read_response(_corrupt(capture_messages[0]), verify=False)
+        assert patch_num == capture_messages[0][5]
+        assert len(data) == 128
+
+    def test_verify_bank(self, capture_messages):
+        messages = list(capture_messages[:20])
+        assert verify_bank(messages) == []
+
+        messages[3] = _corrupt(messages[3])
+        messages[11] = messages[11][:-2] + b"\xF7"
+        messages[17] = _corrupt(messages[17], 264)
+        assert verify_bank(messages) == [3, 11, 17]
+
+    def test_iter_patches_verifies(self, capture_messages):
+        stream = io.BytesIO(capture_messages[0] + _corrupt(capture_messages[1]))
+        patches = iter_patches(stream)
+        assert next(patches)[0] == capture_messages[0][5]
+        with pytest.raises(ChecksumError):
+            next(patches)
+
+
+class TestSysexFramer:
+    def test_single_chunk(self, capture_messages):
+        stream = b"".join(capture_messages[:5])
+        framer = SysexFramer()
+        found = framer.feed(stream)
+        assert [bytes(m) for m in found] == capture_messages[:5]
+        assert framer.messages == 5 and framer.truncated == 0
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 100, 268, 1000])
+    def test_split_chunks(self, capture_messages, chunk_size):
+        stream = b"".join(capture_messages[:5])
+        framer = SysexFramer()
+        found = []
+        for i in range(0, len(stream), chunk_size):
+            found.extend(bytes(m) for m in framer.feed(stream[i:i + chunk_size]))
+        assert found == capture_messages[:5]
+
+    def test_skips_bytes_between_messages(self, capture_messages):
+        stream = b"\x90\x40\x7F" + capture_messages[0] + b"\xB0\x07\x64" + capture_messages[1]
+        found = SysexFramer().feed(stream)
+        assert [bytes(m) for m in found] == capture_messages[:2]
+
+    def test_strips_realtime_bytes(self, capture_messages):
+        message = capture_messages[0]
+        noisy = message[:50] + b"\xF8" + message[50:200] + b"\xFE\xF8" + message[200:]
+        framer = SysexFramer()
+        found = framer.feed(noisy[:120]) + framer.feed(noisy[120:])
+        assert [bytes(m) for m in found] == [message]
+        assert framer.truncated == 0
+
+    def test_drops_interrupted_message(self, capture_messages):
+        stream = capture_messages[0][:100] + capture_messages[1]
+        framer = SysexFramer()
+        assert [bytes(m) for m in framer.feed(stream)] == [capture_messages[1]]
+        assert framer.truncated == 1
+
+    def test_drops_interrupted_message_across_chunks(self, capture_messages):
+        framer = SysexFramer()
+        assert framer.feed(capture_messages[0][:100]) == []
+        found = framer.feed(capture_messages[1])
+        assert [bytes(m) for m in found] == [capture_messages[1]]
+        assert framer.truncated == 1
+
+    def test_drops_message_with_status_byte(self, capture_messages):
+        message = capture_messages[0]
+        broken = message[:50] + b"\x90" + message[50:]
+        framer = SysexFramer()
+        assert framer.feed(broken + capture_messages[1]) == [capture_messages[1]]
+        assert framer.truncated == 1
+
+    def test_max_size(self, capture_messages):
+        framer = SysexFramer(max_size=200)
+        message = capture_messages[0]
+        assert framer.feed(message[:150]) == []
+        assert framer.feed(message[150:]) == []
+        assert framer.truncated == 1
+
+    def test_max_size_single_chunk(self, capture_messages):
+        short = bytes([0xF0, 0x01, 0x02, 0xF7])
+        framer = SysexFramer(max_size=4)
+        found = framer.feed(bytes([0xF0, 1, 2, 3, 4, 5, 0xF7]) + short)
+        assert [bytes(m) for m in found] == [short]
+        assert framer.truncated == 1
+
+    def test_max_size_resumes_after_long_message(self, capture_messages):
+        framer = SysexFramer(max_size=268)
+        message = capture_messages[0]
+        assert framer.feed(message[:100]) == []
+        found = framer.feed(message[100:-1] + b"\x01\xF7" + capture_messages[1])
+        assert [bytes(m) for m in found] == [capture_messages[1]]
+        assert framer.truncated == 1
+
+    @pytest.mark.parametrize("chunk_size", [7, 268, 1000])
+    def test_memoryview_chunks(self, capture_messages, chunk_size):
+        noisy = capture_messages[0][:50] + b"\xF8" + capture_messages[0][50:]
+        stream = bytearray(noisy + b"".join(capture_messages[1:5]))
+        view = memoryview(stream)
+        framer = SysexFramer()
+        found = []
+        for i in range(0, len(stream), chunk_size):
+            found.extend(framer.feed(view[i:i + chunk_size]))
+        assert [bytes(m) for m in found] == capture_messages[:5]
+        if chunk_size == 1000:
+            assert found[1].obj is stream  # Sliced from the caller's buffer
+
+    def test_views_reference_chunk(self, capture_messages):
+        stream = b"".join(capture_messages[:2])
+        found = SysexFramer().feed(stream)
+        assert all(isinstance(m, memoryview) for m in found)
+        assert found[1].obj is stream
+
+    def test_iter_sysex(self, capture_messages):
+        stream = io.BytesIO(b"".join(capture_messages))
+        found = [bytes(m) for m in iter_sysex(stream, chunk_size=1000)]
+        assert found == capture_messages
+
+
+class TestParamChange:
+    """
+    0x31 encoding. The captures hold only values below 128 (two copies of
+    31 0A 05 1F 00); the VALUE_LO/VALUE_HI split of larger values is
+    checked against MAPPING_CHECKLIST.md only, not against the pedal.
+    """
+
+    def test_captured_messages(self, param_change_files):
+        for path in param_change_files:
+            captured = path.read_bytes()
+            msg = ParamChange(captured)
+            assert build_param_change(msg.effect_id, msg.param_id, msg.value) == captured
+
+    @pytest.mark.parametrize("value, lo, hi", [
+        (0, 0x00, 0x00),
+        (127, 0x7F, 0x00),
+        (128, 0x00, 0x01),
+        (5022, 5022 & 0x7F, 5022 >> 7),
+        (0x3FFF, 0x7F, 0x7F),
+    ])
+    def test_14bit_value(self, value, lo, hi):
+        message = build_param_change(0x09, 0x02, value)
+        assert message == bytes([0xF0, 0x52, 0x00, 0x42, 0x31, 0x09, 0x02, lo, hi, 0xF7])
+        assert max(message[1:-1]) < 0x80
+
+    @pytest.mark.parametrize("args", [(0x0C, 0x02, 0), (0x09, 0x08, 0), (0x09, 0x02, 0x4000),
+                                      (0x09, 0x02, -1)])
+    def test_out_of_range(self, args):
+        with pytest.raises(ValueError):
+            build_param_change(*args)
+
+    def test_device_sends_high_values(self, device, pedal):
+        device.set_parameter("dly", "time", 5022, effect_type="Delay")
+        assert pedal.params[(0x09, 0x02)] == 5022
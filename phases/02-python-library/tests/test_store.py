@@ -0,0 +1,156 @@
+"""Tests for the content-addressed PatchStore."""
+
+from multiprocessing import Pool
+
+import pytest
+
+from zoomg9.bank import PatchBank
+from zoomg9.patch import Patch
+from zoomg9.store import MAGIC, PatchStore, patch_key
+
+
+@pytest.fixture
+def store(tmp_path):
+    return PatchStore(tmp_path / "backups.g9s")
+
+
+def test_put_get(store, capture_patches):
+    key = store.put(capture_patches[0])
+    assert key == patch_key(capture_patches[0])
+    assert store.raw(key) == capture_patches[0]
+    assert store.get(key).to_bytes() == capture_patches[0]
+    assert key in store
+    with pytest.raises(KeyError):
+        store.raw("0" * 32)
+
+
+def test_deduplicates(store, tmp_path, capture_patches):
+    keys = store.put_many(capture_patches[:3] + capture_patches[:3])
+    assert keys[:3] == keys[3:]
+    assert len(store) == 3
+    size = store.path.stat().st_size
+    store.put(Patch.from_bytes(capture_patches[1]))
+    assert store.path.stat().st_size == size
+
+
+def test_banks_and_tags(store, bank_data):
+    bank = PatchBank(b"".join(bank_data))
+    first = store.put_bank(bank, tag="pedal-1", timestamp=1.0)
+    size = store.path.stat().st_size
+
+    # Unchanged bank: only a tag record
+    assert store.put_bank(bank, tag="pedal-1", timestamp=2.0) == first
+    assert store.path.stat().st_size - size < 64
+
+    changed = bank.snapshot()
+    changed[0] = Patch("Edited")
+    second = store.put_bank(changed, tag="pedal-1", timestamp=3.0)
+
+    assert store.get_bank("pedal-1") == changed
+    assert store.get_bank(first) == bank
+    assert [b.bank for b in store.history("pedal-1")] == [first, first, second]
+    assert store.tags()["pedal-1"].timestamp == 3.0
+    assert store.bank_keys(second)[1:] == store.bank_keys(first)[1:]
+    with pytest.raises(KeyError):
+        store.get_bank("no-such-tag")
+
+
+def test_reload(tmp_path, bank_data):
+    path = tmp_path / "backups.g9s"
+    store = PatchStore(path)
+    bank_key = store.put_bank(bank_data, tag="nightly", timestamp=10.0)
+
+    reloaded = PatchStore(path)
+    assert reloaded.keys() == store.keys()
+    assert reloaded.get_bank("nightly").to_list() == bank_data
+    assert reloaded.history() == store.history()
+    assert reloaded.tags()["nightly"].bank == bank_key
+
+
+@pytest.mark.parametrize("cut", [1, 20, 100, 129])
+def test_truncated_tail(tmp_path, capture_patches, cut):
+    path = tmp_path / "backups.g9s"
+    store = PatchStore(path)
+    store.put_many(capture_patches[:5])
+    store.put(capture_patches[5])
+    full = path.read_bytes()
+    path.write_bytes(full[:-cut])
+
+    reloaded = PatchStore(path)
+    assert reloaded.keys() == store.keys()[:5]
+
+    # The next append overwrites the partial record
+    reloaded.put(capture_patches[6])
+    assert PatchStore(path).keys() == store.keys()[:5] + [patch_key(capture_patches[6])]
+
+
+def test_truncated_tag(tmp_path, bank_data):
+    path = tmp_path / "backups.g9s"
+    store = PatchStore(path)
+    store.put_bank(bank_data, tag="a")
+    store.put_bank(bank_data, tag="bb")
+    path.write_bytes(path.read_bytes()[:-1])
+    assert [b.tag for b in PatchStore(path).history()] == ["a"]
+
+
+def test_two_writers(tmp_path, capture_patches, bank_data):
+    path = tmp_path / "backups.g9s"
+    first = PatchStore(path)
+    second = PatchStore(path)
+    first.put_bank(bank_data, tag="pedal-1", timestamp=1.0)
+    second.put(capture_patches[-1])
+    second.put_bank(bank_data[::-1], tag="pedal-2", timestamp=2.0)
+    first.put_bank(bank_data, tag="pedal-1", timestamp=3.0)
+
+    reloaded = PatchStore(path)
+    assert [b.tag for b in reloaded.history()] == ["pedal-1", "pedal-2", "pedal-1"]
+    assert reloaded.get_bank("pedal-2").to_list() == bank_data[::-1]
+    assert patch_key(capture_patches[-1]) in reloaded
+    assert first.history() == reloaded.history()  # first read second's records
+
+
+def _backup(args):
+    path, tag, bank = args
+    store = PatchStore(path)
+    for n in range(5):
+        store.put_bank(bank, tag=tag, timestamp=n)
+
+
+def test_parallel_writers(tmp_path, bank_data):
+    path = str(tmp_path / "backups.g9s")
+    PatchStore(path)
+    banks = [bank_data[i:] + bank_data[:i] for i in range(4)]
+    with Pool(4) as pool:
+        pool.map(_backup, [(path, f"pedal-{i}", bank) for i, bank in enumerate(banks)])
+
+    store = PatchStore(path)
+    assert len(store.history()) == 20
+    for i, bank in enumerate(banks):
+        assert len(store.history(f"pedal-{i}")) == 5
+        assert store.get_bank(f"pedal-{i}").to_list() == bank
+
+
+def test_not_a_store(tmp_path):
+    path = tmp_path / "other.g9s"
+    path.write_bytes(b"NOPE")
+    with pytest.raises(ValueError):
+        PatchStore(path)
+
+    path.write_bytes(MAGIC + b"X")
+    with pytest.raises(ValueError):
+        PatchStore(path)
+
+
+def test_invalid_input(store, bank_data):
+    with pytest.raises(ValueError):
+        store.put(bytes(127))
+    with pytest.raises(ValueError):
+        store.put_bank(bank_data[:99])
+    with pytest.raises(ValueError):
+        store.put_bank(bank_data, tag="x" * 256)
+
+
+def test_import_syx(store, tmp_path, capture_messages, capture_patches):
+    path = tmp_path / "dump.syx"
+    path.write_bytes(b"".join(capture_messages[:4]))
+    assert store.import_syx(path) == [patch_key(d) for d in capture_patches[:4]]
@@ -0,0 +1,153 @@
+"""Tests for the coalescing ParameterStream."""
+
+import time
+
+import pytest
+
+from zoomg9.addressing import resolve_parameter
+from zoomg9.device import G9Device, G9DeviceError
+from zoomg9.emulator import VirtualG9
+from zoomg9.messages import ParamChange, decode_message
+from zoomg9.stream import ParameterStream
+
+
+class RecordingPedal(VirtualG9):
+    """VirtualG9 that keeps the 0x31 changes it receives, in order."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.changes = []
+
+    def send(self, data):
+        msg = decode_message(bytes(data))
+        if isinstance(msg, ParamChange):
+            self.changes.append((msg.effect_id, msg.param_id, msg.value))
+        super().send(data)
+
+
+@pytest.fixture
+def pedal(bank_data):
+    return RecordingPedal(bank=bank_data)
+
+
+def test_coalesces_pending_values(device, pedal):
+    stream = ParameterStream(device, max_rate=1000)
+    for value in range(101):
+        stream.set_raw(0x01, 0x02, value)
+    assert stream.pending == 1
+
+    with stream:
+        pass
+
+    assert pedal.changes == [(0x01, 0x02, 100)]
+    assert stream.stats() == {
+        "submitted": 101, "sent": 1, "coalesced": 100, "dropped": 0, "pending": 0,
+    }
+    assert pedal.in_live_mode
+
+
+def test_toggles_first(device, pedal):
+    stream = ParameterStream(device, max_rate=1000)
+    stream.set_raw(0x01, 0x02, 10)
+    stream.set_raw(0x03, 0x04, 20)
+    stream.set_raw(0x05, 0x00, 1)
+    stream.set_raw(0x01, 0x02, 11)
+    with stream:
+        pass
+    assert pedal.changes == [(0x05, 0x00, 1), (0x01, 0x02, 11), (0x03, 0x04, 20)]
+
+
+def test_drops_values_already_sent(device, pedal):
+    with ParameterStream(device, max_rate=1000) as stream:
+        stream.set_raw(0x01, 0x02, 10)
+        stream.flush()
+        stream.set_raw(0x01, 0x02, 10)
+        stream.flush()
+        assert stream.dropped == 1
+
+    # Stopped: a pending change back to the sent value cancels it
+    stream.set_raw(0x01, 0x02, 20)
+    stream.set_raw(0x01, 0x02, 10)
+    assert stream.pending == 0
+    with stream:
+        pass
+    assert pedal.changes == [(0x01, 0x02, 10)]
+
+
+def test_invalidate_resends(device, pedal):
+    with ParameterStream(device, max_rate=1000) as stream:
+        stream.set_raw(0x01, 0x02, 10)
+        stream.set_raw(0x03, 0x04, 20)
+        stream.flush()
+        device.set_parameter("amp", "gain", 50)  # Not seen by the stream
+        stream.invalidate((0x01, 0x02))
+        stream.set_raw(0x01, 0x02, 10)
+        stream.set_raw(0x03, 0x04, 20)
+        stream.flush()
+        assert stream.dropped == 1
+    assert pedal.changes[-1] == (0x01, 0x02, 10)
+    assert pedal.changes.count((0x01, 0x02, 10)) == 2
+
+
+def test_select_patch(device, pedal):
+    stream = ParameterStream(device, max_rate=1000)
+    with stream:
+        stream.set_raw(0x01, 0x02, 10)
+        stream.flush()
+    stream.set_raw(0x03, 0x04, 20)  # Pending, for the old patch
+    stream.select_patch(7)
+    assert stream.pending == 0
+    with stream:
+        stream.set_raw(0x01, 0x02, 10)
+    assert pedal.current_patch == 7
+    assert pedal.changes == [(0x01, 0x02, 10), (0x01, 0x02, 10)]
+    assert stream.dropped == 0
+
+
+def test_rate_limit(device, pedal):
+    start = time.monotonic()
+    with ParameterStream(device, max_rate=50) as stream:
+        for param_id in range(1, 8):
+            stream.set_raw(0x01, param_id, 5)
+    assert time.monotonic() - start >= 6 / 50
+    assert len(pedal.changes) == 7
+
+
+def test_flush_waits_for_message_in_flight(device, pedal):
+    with ParameterStream(device, max_rate=1000) as stream:
+        stream.set_raw(0x01, 0x02, 10)
+        assert stream.flush(timeout=1.0)
+        assert stream.sent == 1
+
+
+def test_values_above_127(device, pedal):
+    with ParameterStream(device) as stream:
+        stream.set_raw(0x06, 0x02, 2000)
+    assert pedal.params[(0x06, 0x02)] == 2000
+
+
+def test_set_validates(device):
+    stream = ParameterStream(device)
+    handle = resolve_parameter("amp", "gain")
+    with pytest.raises(ValueError):
+        stream.set_value(handle, handle.max_val + 1)
+    with pytest.raises(ValueError):
+        stream.set("amp", "no_such_param", 1)
+    assert stream.submitted == 0
+
+
+def test_sender_error_is_raised(bank_data):
+    device = G9Device(transport=VirtualG9(bank=bank_data))  # Never connected
+    stream = ParameterStream(device)
+    stream.start()
+    stream.set_raw(0x01, 0x02, 10)
+    with pytest.raises(G9DeviceError):
+        stream.flush(timeout=1.0)
+    with pytest.raises(G9DeviceError):
+        stream.set_raw(0x01, 0x02, 11)
+    stream.stop(flush=False)
+
+
+def test_invalid_rate(device):
+    with pytest.raises(ValueError):
+        ParameterStream(device, max_rate=0)
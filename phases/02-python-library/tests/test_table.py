@@ -0,0 +1,79 @@
+"""Tests for the columnar PatchTable."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from zoomg9 import table as table_module  # noqa: E402
+from zoomg9.bank import PatchBank  # noqa: E402
+from zoomg9.table import PatchTable  # noqa: E402
+from zoomg9.view import PatchView, _FIELDS  # noqa: E402
+
+
+@pytest.fixture
+def table(capture_patches):
+    return PatchTable(b"".join(capture_patches))
+
+
+def test_columns_match_view(table, capture_patches):
+    assert len(table) == len(capture_patches)
+    for field in _FIELDS:
+        expected = [field.__get__(PatchView(data)) for data in capture_patches]
+        assert table[field.label].tolist() == expected, field.label
+
+
+def test_on_columns_are_bool(table):
+    on_columns = [c for c in table.columns if c.endswith(".on")]
+    assert "amp_b.on" in on_columns and "amp_a.on" in on_columns
+    for column in on_columns:
+        assert table[column].dtype == np.bool_
+
+
+def test_selected_channel_columns(table, capture_patches):
+    expected = [PatchView(data).amp.gain for data in capture_patches]
+    assert table["amp.gain"].tolist() == expected
+    assert table["eq.band3"].tolist() == [PatchView(d).eq.band3 for d in capture_patches]
+
+
+def test_where_and_names(table, capture_patches):
+    mask = table["delay.on"] & (table["delay.time"] > 500)
+    hits = table.where(mask)
+    expected = [i for i, d in enumerate(capture_patches)
+                if PatchView(d).delay.on and PatchView(d).delay.time > 500]
+    assert table.indices(mask).tolist() == expected
+    assert hits.names() == [PatchView(capture_patches[i]).name for i in expected]
+    assert [hits.patch(i).to_bytes() for i in range(len(hits))] == [
+        capture_patches[i] for i in expected
+    ]
+
+
+def test_stats_and_value_counts(table, capture_patches):
+    times = [PatchView(d).delay.time for d in capture_patches]
+    stats = table.stats("delay.time")
+    assert stats["count"] == len(times)
+    assert stats["min"] == min(times) and stats["max"] == max(times)
+    assert stats["mean"] == pytest.approx(sum(times) / len(times))
+    assert table.stats("delay.time", mask=np.zeros(len(table), bool))["count"] == 0
+
+    counts = table.value_counts("amp.type")
+    assert sum(counts.values()) == len(capture_patches)
+    assert list(counts.values()) == sorted(counts.values(), reverse=True)
+
+
+def test_from_banks_and_patches(bank_data):
+    bank = PatchBank(b"".join(bank_data))
+    table = PatchTable.from_banks(bank, bank)
+    assert len(table) == 200
+    assert table.view(150).to_bytes() == bank_data[50]
+    assert PatchTable.from_patches(bank_data[:5]).raw.tobytes() == b"".join(bank_data[:5])
+
+
+def test_invalid_size():
+    with pytest.raises(ValueError):
+        PatchTable(bytes(200))
+
+
+def test_requires_numpy(monkeypatch):
+    monkeypatch.setattr(table_module, "np", None)
+    with pytest.raises(ImportError):
+        PatchTable(bytes(128))
@@ -0,0 +1,97 @@
+"""Tests for the lazy PatchView."""
+
+import pytest
+
+from zoomg9.patch import Patch
+from zoomg9.view import PatchView, _MODULE_VIEWS
+
+
+def test_fields_match_patch(capture_patches):
+    for data in capture_patches:
+        view = PatchView(data)
+        patch = Patch.from_bytes(data)
+        assert view.name == patch.name.rstrip(" \x00")
+        assert (view.level, view.tempo, view.amp_sel) == (patch.level, patch.tempo, patch.amp_sel)
+        for module, view_class in _MODULE_VIEWS.items():
+            patch_module = getattr(patch, module)
+            for field in view_class.fields:
+                if hasattr(patch_module, field):
+                    assert getattr(getattr(view, module), field) == getattr(patch_module, field)
+        assert view.eq_a.bands == patch.eq_a.bands
+        assert view.eq_b.bands == patch.eq_b.bands
+
+
+def test_write_in_place(capture_patches):
+    data = bytearray(capture_patches[0])
+    view = PatchView(data)
+    view.delay.time = 4000  # Spans two bytes
+    view.amp_b.gain = 50
+    view.mod.on = False
+    view.name = "Viewed"
+
+    patch = Patch.from_bytes(bytes(data))
+    assert patch.delay.time == 4000
+    assert patch.amp_b.gain == 50
+    assert patch.mod.on is False
+    assert patch.name == "Viewed"
+
+    # Every other field is unchanged
+    expected = Patch.from_bytes(capture_patches[0])
+    expected.delay.time = 4000
+    expected.amp_b.gain = 50
+    expected.mod.on = False
+    expected.name = "Viewed"
+    assert bytes(data) == expected.to_bytes()
+
+
+def test_selected_channel(capture_patches):
+    data = bytearray(capture_patches[0])
+    view = PatchView(data)
+    view.amp_sel = 0
+    assert view.amp.gain == view.amp_a.gain
+    view.amp_sel = 1
+    assert view.amp.gain == view.amp_b.gain
+    assert view.eq.bands == view.eq_b.bands
+
+
+def test_eq_bands(capture_patches):
+    view = PatchView(bytearray(capture_patches[0]))
+    view.eq_a.bands = [1, 2, 3, 4, 5, 6]
+    assert view.eq_a.bands == [1, 2, 3, 4, 5, 6]
+    with pytest.raises(ValueError):
+        view.eq_a.bands = [1, 2, 3]
+
+
+def test_range_checked(capture_patches):
+    view = PatchView(bytearray(capture_patches[0]))
+    with pytest.raises(ValueError):
+        view.amp_a.gain = 1000
+    with pytest.raises(ValueError):
+        view.tempo = 20
+
+
+def test_read_only(capture_patches):
+    view = PatchView(capture_patches[0])
+    assert view.readonly
+    with pytest.raises(TypeError):
+        view.amp_a.gain = 10
+
+
+def test_slice_of_larger_buffer(bank_data):
+    buf = bytearray(b"".join(bank_data[:3]))
+    view = PatchView(memoryview(buf)[128:256])
+    view.name = "Middle"
+    assert Patch.from_bytes(bytes(buf[128:256])).name == "Middle"
+    assert bytes(buf[:128]) == bank_data[0]
+
+
+def test_round_trip(capture_patches):
+    for data in capture_patches[:10]:
+        view = PatchView(data)
+        assert view.to_bytes() == data
+        assert view.to_patch().to_bytes() == data
+
+
+def test_wrong_size():
+    with pytest.raises(ValueError):
+        PatchView(bytes(127))
@@ -38,7 +38,21 @@ __author__ = "Andres Mantilla"
 
 # Main classes
 from .device import G9Device, G9DeviceError
+from .async_device import AsyncG9Device
+from .transport import Transport, MidoTransport
+from .emulator import VirtualG9
+from .stream import ParameterStream
+from .addressing import ParamHandle, resolve, resolve_parameter
 from .patch import Patch
+from .bank import PatchBank
+from .view import PatchView, ModuleView
+from .diff import FieldChange, UpdatePlan, diff_patches, diff_banks, plan_update
+from .table import PatchTable
+from .store import PatchStore, Backup, patch_key
+from .library import PatchLibrary, LibraryEntry
+from .bankfile import BankFile
+from .importer import import_syx, find_syx, ImportReport
+from .capture import CaptureWriter, CaptureLog, CaptureRecord, DIR_RX, DIR_TX, DIR_UNKNOWN
 
 # Effect modules
 from .effects import (
@@ -78,8 +92,17 @@ from .encoding import (
     decode_nibbles,
     encode_7bit,
     decode_7bit,
+    encode_nibbles_batch,
+    decode_nibbles_batch,
+    encode_7bit_batch,
+    decode_7bit_batch,
     pack_bits,
     unpack_bits,
+    pack_fields,
+    unpack_fields,
+    update_fields,
+    calculate_checksum,
+    verify_checksum,
 )
 
 from .protocol import (
@@ -91,6 +114,28 @@ from .protocol import (
     build_enable_live,
     build_disable_live,
     parse_read_response,
+    SysexTemplate,
+    verify_bank,
+    ChecksumError,
+    SysexFramer,
+    iter_sysex,
+    iter_patches,
+)
+
+from .messages import (
+    decode_message,
+    G9Message,
+    UnknownMessage,
+    ReadRequest,
+    ReadResponse,
+    WriteData,
+    ParamChange,
+    EditEnter,
+    EditExit,
+    LiveEnable,
+    LiveDisable,
+    Identity,
+    IdentityRequest,
 )
 
 __all__ = [
@@ -99,7 +144,39 @@ __all__ = [
     # Main classes
     "G9Device",
     "G9DeviceError",
+    "AsyncG9Device",
+    "Transport",
+    "MidoTransport",
+    "VirtualG9",
+    "ParameterStream",
+    "ParamHandle",
+    "resolve",
+    "resolve_parameter",
     "Patch",
+    "PatchBank",
+    "PatchView",
+    "ModuleView",
+    "FieldChange",
+    "UpdatePlan",
+    "diff_patches",
+    "diff_banks",
+    "plan_update",
+    "PatchTable",
+    "PatchStore",
+    "Backup",
+    "patch_key",
+    "PatchLibrary",
+    "LibraryEntry",
+    "BankFile",
+    "import_syx",
+    "find_syx",
+    "ImportReport",
+    "CaptureWriter",
+    "CaptureLog",
+    "CaptureRecord",
+    "DIR_RX",
+    "DIR_TX",
+    "DIR_UNKNOWN",
     # Effect modules
     "EffectModule",
     "AmpModule",
@@ -131,8 +208,17 @@ __all__ = [
     "decode_nibbles",
     "encode_7bit",
     "decode_7bit",
+    "encode_nibbles_batch",
+    "decode_nibbles_batch",
+    "encode_7bit_batch",
+    "decode_7bit_batch",
     "pack_bits",
     "unpack_bits",
+    "pack_fields",
+    "unpack_fields",
+    "update_fields",
+    "calculate_checksum",
+    "verify_checksum",
     # Protocol functions
     "build_read_request",
     "build_write_data",
@@ -142,4 +228,24 @@ __all__ = [
     "build_enable_live",
     "build_disable_live",
     "parse_read_response",
+    "SysexTemplate",
+    "verify_bank",
+    "ChecksumError",
+    "SysexFramer",
+    "iter_sysex",
+    "iter_patches",
+    # Typed messages
+    "decode_message",
+    "G9Message",
+    "UnknownMessage",
+    "ReadRequest",
+    "ReadResponse",
+    "WriteData",
+    "ParamChange",
+    "EditEnter",
+    "EditExit",
+    "LiveEnable",
+    "LiveDisable",
+    "Identity",
+    "IdentityRequest",
 ]
@@ -0,0 +1,315 @@
+"""
+Zoom G9.2tt Parameter Addressing
+
+Resolves "module.param" names to prevalidated ParamHandle objects
+(effect_id, param_id, min_val, max_val) for 0x31 parameter changes.
+Resolve once, then reuse the handle on every send:
+
+    gain = resolve("amp.gain")
+    time = resolve("dly.time", effect_type="PingPongDelay")
+    device.set_value(gain, 80)
+
+Tables are built once from PARAM_RANGES, PARAM_NAMES and the per-type
+parameter definitions of G9ED (phases/03-complete-mapping/reference/
+efx_parsed.json, copied into the package as data/efx_parsed.json by
+setup.py at build time). In each effect type the parameters are numbered
+from 0x02 in G9ED order, so the same param_id means different things per
+type (MOD 0x02 is Depth for Chorus but Shift for PitchShifter). Pass
+effect_type to resolve names and ranges for that type; without it only
+names meaning the same in every type resolve.
+
+The parameter names set_parameter() accepted before these tables existed
+(LEGACY_PARAM_ALIASES) keep their original addresses when no effect_type
+is given, even where PARAM_NAMES numbers the parameter differently (e.g.
+"cmp.level" is still 0x04, PARAM_NAMES has Level at 0x05); existing
+callers keep sending to the same parameter. Pass effect_type to address
+the parameter by its G9ED name instead.
+"""
+
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional, Tuple, Union
+
+from .constants import (
+    EFFECT_TOP,
+    EFFECT_CMP,
+    EFFECT_WAH,
+    EFFECT_EXT,
+    EFFECT_ZNR,
+    EFFECT_AMP,
+    EFFECT_EQ,
+    EFFECT_CAB,
+    EFFECT_MOD,
+    EFFECT_DLY,
+    EFFECT_REV,
+    EFFECT_SYNC,
+    EFFECT_NAMES,
+    PARAM_NAMES,
+    PARAM_RANGES,
+    PARAM_ONOFF,
+    PARAM_TYPE,
+)
+
+# Packaged copy (installed builds), else the phase 03 reference in the source tree
+_PACKAGED_EFX = Path(__file__).resolve().parent / "data" / "efx_parsed.json"
+_REFERENCE_EFX = (
+    Path(__file__).resolve().parents[2] / "03-complete-mapping" / "reference" / "efx_parsed.json"
+)
+EFX_PATH = _PACKAGED_EFX if _PACKAGED_EFX.exists() else _REFERENCE_EFX
+
+# Module name aliases -> effect ID
+EFFECT_ALIASES = {
+    "top": EFFECT_TOP, "total": EFFECT_TOP,
+    "cmp": EFFECT_CMP, "comp": EFFECT_CMP, "compressor": EFFECT_CMP,
+    "wah": EFFECT_WAH,
+    "ext": EFFECT_EXT,
+    "znr": EFFECT_ZNR,
+    "amp": EFFECT_AMP,
+    "eq": EFFECT_EQ,
+    "cab": EFFECT_CAB,
+    "mod": EFFECT_MOD,
+    "dly": EFFECT_DLY, "delay": EFFECT_DLY,
+    "rev": EFFECT_REV, "reverb": EFFECT_REV,
+    "sync": EFFECT_SYNC, "ttl": EFFECT_SYNC,
+}
+
+# Parameter aliases accepted by set_parameter() since the first release,
+# for every module but SYNC. Without an effect_type they take precedence
+# over PARAM_NAMES and G9ED names so their addresses never change.
+LEGACY_PARAM_ALIASES = {
+    "on": 0x00, "onoff": 0x00,
+    "type": 0x01,
+    "gain": 0x02, "sense": 0x02, "depth": 0x02, "time": 0x02, "decay": 0x02,
+    "send": 0x02, "band1": 0x02,
+    "tone": 0x03, "attack": 0x03, "rate": 0x03, "feedback": 0x03,
+    "predelay": 0x03, "return": 0x03, "band2": 0x03,
+    "level": 0x04, "resonance": 0x04, "hidamp": 0x04, "dry": 0x04,
+    "band3": 0x04, "mictype": 0x03, "micpos": 0x04,
+    "mix": 0x05, "band4": 0x05,
+    "band5": 0x06, "band6": 0x07,
+}
+
+# Range of a legacy alias whose param ID is not in PARAM_RANGES (values
+# above 127 were never accepted there)
+_LEGACY_RANGE = (0, 127)
+
+# First 0x31 param ID of the typed parameters (0x02 unless listed)
+_TYPED_PARAM_BASE = {
+    EFFECT_TOP: 0x05,   # Total Level
+    EFFECT_SYNC: 0x00,  # ARRM BPM
+}
+
+
+class ParamHandle(NamedTuple):
+    """Prevalidated address of a real-time parameter."""
+
+    effect_id: int
+    param_id: int
+    min_val: int
+    max_val: int
+    name: str  # "module.param", e.g. "dly.time"
+
+    def check(self, value: int):
+        """
+        Raise ValueError if value is out of range for this parameter.
+
+        Args:
+            value: Value to send
+        """
+        if not self.min_val <= value <= self.max_val:
+            raise ValueError(
+                f"{self.name}: value must be {self.min_val}-{self.max_val}, got {value}"
+            )
+
+
+def _key(name: str) -> str:
+    """Normalize a module, parameter or type name ("Pre Delay" -> "predelay")."""
+    return re.sub(r"[^a-z0-9]", "", name.lower())
+
+
+def _module_name(effect_id: int) -> str:
+    return EFFECT_NAMES[effect_id].lower()
+
+
+@lru_cache(maxsize=None)
+def _efx_modules() -> Tuple[dict, ...]:
+    """G9ED module definitions, indexed by effect ID."""
+    with open(EFX_PATH, encoding="utf-8") as f:
+        return tuple(json.load(f)["modules"])
+
+
+@lru_cache(maxsize=None)
+def _typed_tables() -> Dict[int, Tuple[Dict[str, ParamHandle], ...]]:
+    """effect_id -> per-type {param key: handle}, from the G9ED definitions."""
+    tables = {}
+    for effect_id, module in enumerate(_efx_modules()):
+        base = _TYPED_PARAM_BASE.get(effect_id, 0x02)
+        module_name = _module_name(effect_id)
+        types = []
+        for effect_type in module["types"]:
+            table = {}
+            # On/Off and Type are the same in every type
+            for param_id, aliases in ((PARAM_ONOFF, ("on", "onoff")), (PARAM_TYPE, ("type",))):
+                if param_id in PARAM_RANGES.get(effect_id, {}):
+                    min_val, max_val = PARAM_RANGES[effect_id][param_id]
+                    handle = ParamHandle(effect_id, param_id, min_val, max_val,
+                                         f"{module_name}.{aliases[0]}")
+                    for alias in aliases:
+                        table[alias] = handle
+            for index, param in enumerate(effect_type["parameters"]):
+                key = _key(param["name"])
+                table[key] = ParamHandle(effect_id, base + index, 0, param["max"],
+                                         f"{module_name}.{key}")
+            types.append(table)
+        tables[effect_id] = tuple(types)
+    return tables
+
+
+@lru_cache(maxsize=None)
+def _type_indexes() -> Dict[int, Dict[str, int]]:
+    """effect_id -> {type key: type index}."""
+    return {
+        effect_id: {_key(t["name"]): i for i, t in enumerate(module["types"])}
+        for effect_id, module in enumerate(_efx_modules())
+    }
+
+
+@lru_cache(maxsize=None)
+def _generic_tables() -> Dict[int, Dict[str, ParamHandle]]:
+    """
+    effect_id -> {param key: handle} for names that do not depend on the type.
+
+    In order of precedence: the legacy aliases, G9ED names with the same
+    param ID in every type of the module, then PARAM_NAMES.
+    """
+    tables = {}
+    for effect_id in EFFECT_NAMES:
+        module_name = _module_name(effect_id)
+        ranges = PARAM_RANGES.get(effect_id, {})
+        table = {}
+
+        for param_id, name in PARAM_NAMES.get(effect_id, {}).items():
+            if param_id in ranges:
+                table[_key(name)] = (param_id, ranges[param_id])
+
+        typed = _typed_tables().get(effect_id, ())
+        seen = {}  # key -> (param_id, max) or None if ambiguous
+        for type_table in typed:
+            for key, handle in type_table.items():
+                prev = seen.get(key, (handle.param_id, handle.max_val))
+                if prev is None or prev[0] != handle.param_id:
+                    seen[key] = None
+                else:
+                    seen[key] = (handle.param_id, max(prev[1], handle.max_val))
+        for key, entry in seen.items():
+            if entry is not None:
+                param_id, max_val = entry
+                table[key] = (param_id, ranges.get(param_id, (0, max_val)))
+
+        # Legacy aliases last so they overwrite the other sources
+        if effect_id != EFFECT_SYNC:
+            for alias, param_id in LEGACY_PARAM_ALIASES.items():
+                table[alias] = (param_id, ranges.get(param_id, _LEGACY_RANGE))
+
+        tables[effect_id] = {
+            key: ParamHandle(effect_id, param_id, min_val, max_val, f"{module_name}.{key}")
+            for key, (param_id, (min_val, max_val)) in table.items()
+        }
+    return tables
+
+
+def _type_index(effect_id: int, effect_type: Union[int, str]) -> int:
+    """Return the type index for a type number or name."""
+    types = _typed_tables().get(effect_id, ())
+    if isinstance(effect_type, str):
+        index = _type_indexes()[effect_id].get(_key(effect_type))
+        if index is None:
+            raise ValueError(f"Unknown {EFFECT_NAMES[effect_id]} type: {effect_type}")
+        return index
+    if not 0 <= effect_type < len(types):
+        raise ValueError(f"Unknown {EFFECT_NAMES[effect_id]} type: {effect_type}")
+    return effect_type
+
+
+@lru_cache(maxsize=4096)
+def resolve_parameter(
+    effect: str, param: str, effect_type: Optional[Union[int, str]] = None
+) -> ParamHandle:
+    """
+    Resolve an effect and parameter name to a handle.
+
+    Args:
+        effect: Effect name (amp, delay, reverb, etc.)
+        param: Parameter name (gain, time, mix, etc.)
+        effect_type: Effect type number or name (e.g. 3 or "Arena") for
+                     type-specific names and ranges
+
+    Returns:
+        ParamHandle
+
+    Raises:
+        ValueError: If effect, type or parameter is unknown
+    """
+    effect_id = EFFECT_ALIASES.get(_key(effect))
+    if effect_id is None:
+        raise ValueError(f"Unknown effect: {effect}")
+
+    key = _key(param)
+
+    if effect_type is not None and _typed_tables().get(effect_id):
+        table = _typed_tables()[effect_id][_type_index(effect_id, effect_type)]
+        handle = table.get(key)
+        if handle is None:
+            raise ValueError(
+                f"Unknown parameter for {EFFECT_NAMES[effect_id]} type {effect_type}: {param}"
+            )
+        return handle
+
+    handle = _generic_tables()[effect_id].get(key)
+    if handle is None:
+        raise ValueError(f"Unknown parameter: {param}")
+    return handle
+
+
+def resolve(name: str, effect_type: Optional[Union[int, str]] = None) -> ParamHandle:
+    """
+    Resolve a "module.param" name (e.g. "dly.time") to a handle.
+
+    Args:
+        name: Dotted parameter name
+        effect_type: Effect type number or name, see resolve_parameter()
+
+    Returns:
+        ParamHandle
+
+    Raises:
+        ValueError: If the name cannot be resolved
+    """
+    effect, sep, param = name.partition(".")
+    if not sep:
+        raise ValueError(f"Expected 'module.param', got {name!r}")
+    return resolve_parameter(effect, param, effect_type)
+
+
+def parameters(
+    effect: str,
+    effect_type: Optional[Union[int, str]] = None,
+) -> Dict[str, ParamHandle]:
+    """
+    Return all handles of a module, keyed by normalized parameter name.
+
+    Args:
+        effect: Effect name
+        effect_type: Effect type number or name (type-specific parameters)
+
+    Returns:
+        Dictionary of parameter name -> ParamHandle
+    """
+    effect_id = EFFECT_ALIASES.get(_key(effect))
+    if effect_id is None:
+        raise ValueError(f"Unknown effect: {effect}")
+    if effect_type is not None and _typed_tables().get(effect_id):
+        return dict(_typed_tables()[effect_id][_type_index(effect_id, effect_type)])
+    return dict(_generic_tables()[effect_id])
@@ -0,0 +1,592 @@
+"""
+Zoom G9.2tt asyncio Device Communication
+
+Non-blocking counterpart of G9Device for use inside an asyncio event loop
+(e.g. next to a web server, or to drive several pedals from one thread).
+
+The transport delivers input on its own thread; the input callback hands
+each SysEx message to the event loop with call_soon_threadsafe(), where it
+resolves the future of the first waiter whose predicate matches. Messages
+nobody is waiting for are kept in a short backlog, so a reply that arrives
+before its waiter is registered is not lost.
+
+Every waiting call takes a timeout and can be cancelled like any other
+coroutine (asyncio.wait_for, task.cancel(), ...).
+"""
+
+import asyncio
+from collections import deque
+from typing import Callable, List, Optional, Union
+
+try:
+    import mido
+except ImportError:
+    mido = None
+
+from .constants import PATCH_COUNT, CMD_READ_PATCH, CMD_PARAM_CHANGE
+from .protocol import (
+    ENTER_EDIT,
+    EXIT_EDIT,
+    ENABLE_LIVE,
+    DISABLE_LIVE,
+    IDENTITY_REQUEST,
+    SysexTemplate,
+    build_write_data,
+    build_patch_select,
+    build_read_response,
+    parse_read_response,
+    parse_identity_response,
+    ChecksumError,
+)
+from .addressing import ParamHandle, resolve_parameter
+from .device import G9Device, G9DeviceError
+from .diff import UpdatePlan
+from .messages import EditExit, Identity, ReadRequest, ReadResponse, decode_message
+from .patch import Patch
+from .transport import Transport, MidoTransport
+
+# Unclaimed messages kept for late waiters
+BACKLOG_SIZE = 256
+
+Predicate = Callable[[bytes], bool]
+
+
+def _is_read_response(patch_num: int) -> Predicate:
+    """Match a read response (0x21) for one patch."""
+    def match(msg: bytes) -> bool:
+        message = decode_message(msg)
+        return isinstance(message, ReadResponse) and message.patch_num == patch_num
+    return match
+
+
+def _is_identity_response(msg: bytes) -> bool:
+    """Match a Universal Identity Reply (F0 7E dev 06 02 ...)."""
+    return isinstance(decode_message(msg), Identity)
+
+
+def _is_bulk_request(msg: bytes) -> bool:
+    """Match what the pedal sends during bulk write: 0x11 or 0x1F."""
+    return isinstance(decode_message(msg), (ReadRequest, EditExit))
+
+
+class AsyncG9Device:
+    """
+    asyncio interface for communicating with the Zoom G9.2tt.
+
+    Example usage:
+        async with AsyncG9Device() as device:
+            patch = await device.read_patch(0)
+            print(patch.name, patch.amp.type_name)
+
+            patches = await device.read_all()
+            await device.set_parameter("amp", "gain", 70)
+
+    Several coroutines may use the same device at once: replies are matched
+    to their request (read responses by patch number), so e.g. concurrent
+    read_patch() calls do not steal each other's data, and concurrent
+    writes take turns.
+    """
+
+    def __init__(self, port_name: Optional[str] = None, transport: Optional[Transport] = None):
+        """
+        Initialize the device interface.
+
+        Args:
+            port_name: Specific MIDI port name to use.
+                      If None, will auto-detect on connect().
+            transport: Transport to use instead of a MIDI port
+                      (e.g. zoomg9.emulator.VirtualG9)
+        """
+        if transport is None and mido is None:
+            raise ImportError(
+                "mido is required for MIDI communication. "
+                "Install with: pip install mido python-rtmidi"
+            )
+
+        self.port_name = port_name
+        self._transport = transport
+        self._own_transport = transport is None  # Created on connect()
+        self._connected = False
+        self._in_edit_mode = False
+        self._in_live_mode = False
+        self._loop = None
+        self._waiters = []  # (predicate, future), in registration order
+        self._backlog = deque(maxlen=BACKLOG_SIZE)
+        self._bank = [None] * PATCH_COUNT  # Raw 128-byte cache per slot
+        self._mode_lock = None
+        self._write_lock = None  # One slot write or bulk write at a time
+
+        # Preallocated messages, filled and sent without awaiting in between
+        self._read_msg = SysexTemplate(CMD_READ_PATCH, 1)
+        self._param_msg = SysexTemplate(CMD_PARAM_CHANGE, 4)
+
+    @property
+    def connected(self) -> bool:
+        """Whether the device is currently connected."""
+        return self._connected
+
+    list_ports = staticmethod(G9Device.list_ports)
+
+    async def connect(self, port_name: Optional[str] = None) -> bool:
+        """
+        Connect to the G9.2tt.
+
+        Must be called from the event loop that will use the device.
+
+        Args:
+            port_name: Optional port name override
+
+        Returns:
+            True if connection successful
+
+        Raises:
+            G9DeviceError: If connection fails
+        """
+        if self._connected:
+            return True
+
+        if self._own_transport:
+            if port_name:
+                self.port_name = port_name
+            elif not self.port_name:
+                self.port_name = G9Device._find_port()
+
+            if not self.port_name:
+                raise G9DeviceError("No MIDI port found")
+
+        self._loop = asyncio.get_running_loop()
+        self._mode_lock = asyncio.Lock()
+        self._write_lock = asyncio.Lock()
+        self._backlog.clear()
+
+        try:
+            if self._own_transport:
+                self._transport = MidoTransport(self.port_name)
+            self._transport.open(self._on_message)
+            self._connected = True
+            return True
+        except Exception as e:
+            raise G9DeviceError(f"Failed to connect: {e}")
+
+    async def disconnect(self):
+        """Disconnect from the G9.2tt, failing any pending waits."""
+        if self._in_live_mode:
+            try:
+                await self.disable_live_mode()
+            except Exception:
+                pass
+
+        if self._in_edit_mode:
+            try:
+                await self.exit_edit_mode()
+            except Exception:
+                pass
+
+        if self._transport is not None and self._connected:
+            self._transport.close()
+        if self._own_transport:
+            self._transport = None
+
+        self._connected = False
+
+        for _, future in self._waiters:
+            if not future.done():
+                future.set_exception(G9DeviceError("Disconnected"))
+        self._waiters.clear()
+        self._backlog.clear()
+
+    def _send_sysex(self, data: bytes):
+        """Send a complete SysEx message (bytes, bytearray or memoryview)."""
+        if not self._connected:
+            raise G9DeviceError("Not connected")
+
+        self._transport.send(data)
+
+    def _on_message(self, data: bytes):
+        """Transport callback (runs on the transport's thread)."""
+        try:
+            self._loop.call_soon_threadsafe(self._dispatch, data)
+        except RuntimeError:
+            pass  # Event loop already closed
+
+    def _dispatch(self, msg: bytes):
+        """Resolve the first matching waiter, or keep the message (event loop)."""
+        for i, (predicate, future) in enumerate(self._waiters):
+            if not future.done() and predicate(msg):
+                del self._waiters[i]
+                future.set_result(msg)
+                return
+        self._backlog.append(msg)
+
+    async def _expect(self, predicate: Predicate, timeout: Optional[float]) -> Optional[bytes]:
+        """
+        Wait for a message matching predicate.
+
+        Messages that arrived earlier and were not claimed by another
+        waiter are checked first.
+
+        Returns:
+            The message, or None on timeout
+        """
+        if not self._connected:
+            raise G9DeviceError("Not connected")
+
+        for i, msg in enumerate(self._backlog):
+            if predicate(msg):
+                del self._backlog[i]
+                return msg
+
+        future = self._loop.create_future()
+        entry = (predicate, future)
+        self._waiters.append(entry)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            if entry in self._waiters:
+                self._waiters.remove(entry)
+
+    async def _request(self, data: bytes, predicate: Predicate, timeout: Optional[float]) -> Optional[bytes]:
+        """Send a message and wait for the reply matching predicate."""
+        self._send_sysex(data)
+        return await self._expect(predicate, timeout)
+
+    async def _set_mode(self, message: bytes, attr: str, state: bool):
+        """Send a mode switch and give the pedal time to apply it."""
+        if not self._connected:  # _mode_lock is created by connect()
+            raise G9DeviceError("Not connected")
+
+        async with self._mode_lock:
+            if getattr(self, attr) == state:
+                return
+            self._send_sysex(message)
+            await asyncio.sleep(0.1)
+            setattr(self, attr, state)
+
+    async def enter_edit_mode(self):
+        """Enter edit mode (required before write operations)."""
+        await self._set_mode(ENTER_EDIT, "_in_edit_mode", True)
+
+    async def exit_edit_mode(self):
+        """Exit edit mode."""
+        await self._set_mode(EXIT_EDIT, "_in_edit_mode", False)
+
+    async def enable_live_mode(self):
+        """Enable live/real-time mode for parameter changes (0x50)."""
+        await self._set_mode(ENABLE_LIVE, "_in_live_mode", True)
+
+    async def disable_live_mode(self):
+        """Disable live/real-time mode (0x51)."""
+        await self._set_mode(DISABLE_LIVE, "_in_live_mode", False)
+
+    async def identity(self, timeout: float = 2.0) -> dict:
+        """
+        Query device identity.
+
+        Args:
+            timeout: Seconds to wait for the reply
+
+        Returns:
+            Dictionary with manufacturer, model, firmware info
+        """
+        response = await self._request(IDENTITY_REQUEST, _is_identity_response, timeout)
+
+        if response:
+            return parse_identity_response(response)
+        return {"valid": False}
+
+    def select_patch(self, patch_num: int):
+        """
+        Select/activate a patch on the device (Program Change).
+
+        Args:
+            patch_num: Patch number (0-99)
+        """
+        if not 0 <= patch_num <= 99:
+            raise ValueError(f"Patch number must be 0-99, got {patch_num}")
+        if not self._connected:
+            raise G9DeviceError("Not connected")
+
+        self._transport.send(bytes([0xC0, patch_num]))
+
+    async def read_patch(self, patch_num: int, timeout: float = 3.0) -> Patch:
+        """
+        Read a patch from the device.
+
+        Args:
+            patch_num: Patch number (0-99)
+            timeout: Seconds to wait for the reply
+
+        Returns:
+            Patch object with all parameters
+
+        Raises:
+            G9DeviceError: If read fails or the checksum does not match
+        """
+        if not 0 <= patch_num <= 99:
+            raise ValueError(f"Patch number must be 0-99, got {patch_num}")
+
+        response = await self._request(
+            self._read_msg.fill(patch_num), _is_read_response(patch_num), timeout
+        )
+
+        if response is None:
+            raise G9DeviceError(f"Failed to read patch {patch_num}")
+
+        try:
+            _, decoded = parse_read_response(response)
+        except ChecksumError as e:
+            raise G9DeviceError(f"Corrupted transfer reading patch {patch_num}: {e}")
+        self._bank[patch_num] = decoded
+        return Patch.from_bytes(decoded)
+
+    async def read_all(
+        self,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        window: int = 4,
+        timeout: float = 3.0,
+        retries: int = 3,
+    ) -> List[Patch]:
+        """
+        Read all patches from the device.
+
+        Up to `window` read requests are in flight at once; each reply is
+        matched to its request by patch number. A patch whose reply times
+        out or fails the checksum is requested again.
+
+        Args:
+            progress_callback: Optional callback(current, total) for progress updates
+            window: Number of requests in flight (1 = no pipelining)
+            timeout: Seconds to wait for each reply
+            retries: Extra attempts per patch before giving up
+
+        Returns:
+            List of 100 Patch objects
+
+        Raises:
+            G9DeviceError: If a patch cannot be read after all retries
+        """
+        if window < 1:
+            raise ValueError(f"Invalid window {window}")
+
+        slots = asyncio.Semaphore(window)
+        done = 0
+
+        async def read_one(patch_num: int) -> Patch:
+            nonlocal done
+            async with slots:
+                for attempt in range(retries + 1):
+                    try:
+                        patch = await self.read_patch(patch_num, timeout)
+                        break
+                    except G9DeviceError:
+                        if attempt == retries:
+                            raise
+            done += 1
+            if progress_callback:
+                progress_callback(done, PATCH_COUNT)
+            return patch
+
+        tasks = [asyncio.ensure_future(read_one(n)) for n in range(PATCH_COUNT)]
+        try:
+            return list(await asyncio.gather(*tasks))
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def write_patch(self, patch_num: int, patch: Patch):
+        """
+        Write a single patch directly to its slot.
+
+        Same sequence as G9Device.write_patch(): select slot, 0x28 data,
+        confirm, with EXIT_EDIT if edit mode was entered here.
+
+        Args:
+            patch_num: Patch number (0-99)
+            patch: Patch object to write
+        """
+        if not 0 <= patch_num <= 99:
+            raise ValueError(f"Patch number must be 0-99, got {patch_num}")
+
+        if not self._connected:  # _write_lock is created by connect()
+            raise G9DeviceError("Not connected")
+
+        data = patch.to_bytes()
+
+        # The pedal holds one selected slot: another write's select must
+        # not land between this select and its confirm
+        async with self._write_lock:
+            was_editing = self._in_edit_mode
+            await self.enter_edit_mode()
+            try:
+                self._send_sysex(build_patch_select(patch_num, 0x02))
+                await asyncio.sleep(0.1)
+                self._send_sysex(build_write_data(data))
+                await asyncio.sleep(0.1)
+                self._send_sysex(build_patch_select(patch_num, 0x09))
+                await asyncio.sleep(0.1)
+            finally:
+                if not was_editing:
+                    await self.exit_edit_mode()
+
+            self._bank[patch_num] = data
+
+    async def write_all(
+        self,
+        patches: List[Patch],
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        timeout: float = 5.0
+    ):
+        """
+        Write all patches to the device using bulk write protocol.
+
+        The pedal must be in BULK RX mode; it requests each patch (0x11),
+        gets a read response (0x21) and sends EXIT_EDIT (0x1F) when done.
+        See G9Device.write_all() for the full protocol.
+
+        Args:
+            patches: List of 100 Patch objects
+            progress_callback: Optional callback(current, total) for progress updates
+            timeout: Timeout in seconds waiting for pedal requests
+
+        Raises:
+            G9DeviceError: If write fails or times out
+            ValueError: If patches list is not exactly 100 items
+        """
+        if len(patches) != PATCH_COUNT:
+            raise ValueError(f"Expected {PATCH_COUNT} patches, got {len(patches)}")
+
+        if not self._connected:
+            raise G9DeviceError("Not connected")
+
+        async with self._write_lock:
+            await self._bulk_write(
+                [p.to_bytes() for p in patches],
+                [p.checksum() for p in patches],
+                progress_callback,
+                timeout,
+            )
+
+    async def _bulk_write(
+        self,
+        patches_data: List[bytes],
+        checksums: List[bytes],
+        progress_callback: Optional[Callable[[int, int], None]],
+        timeout: float,
+    ):
+        """Answer the pedal's bulk requests (called with _write_lock held)."""
+        self._send_sysex(ENTER_EDIT)
+
+        count = 0
+        consecutive_errors = 0
+
+        while True:
+            response = await self._expect(_is_bulk_request, timeout)
+
+            if response is None:
+                consecutive_errors += 1
+                if consecutive_errors >= 3:
+                    if count == 0:
+                        raise G9DeviceError(
+                            "No response from pedal. Make sure it's in BULK RX mode."
+                        )
+                    break
+                continue
+
+            consecutive_errors = 0
+
+            msg = decode_message(response)
+            if isinstance(msg, EditExit):  # Pedal is done
+                break
+
+            patch_num = msg.patch_num
+            if 0 <= patch_num < PATCH_COUNT:
+                self._send_sysex(build_read_response(
+                    patch_num, patches_data[patch_num], checksums[patch_num]
+                ))
+                count += 1
+
+                if progress_callback:
+                    progress_callback(count, PATCH_COUNT)
+
+        if count != PATCH_COUNT:
+            raise G9DeviceError(f"Only wrote {count}/{PATCH_COUNT} patches")
+
+        self._bank = patches_data
+
+    async def set_parameter(
+        self,
+        effect: str,
+        param: str,
+        value: int,
+        effect_type: Optional[Union[int, str]] = None,
+    ):
+        """
+        Set an effect parameter in real-time.
+
+        Enables live mode first if needed (see G9Device.set_parameter()).
+
+        Args:
+            effect: Effect name (amp, delay, reverb, etc.)
+            param: Parameter name (gain, time, mix, etc.)
+            value: New value
+            effect_type: Current type of the effect (number or name)
+
+        Raises:
+            ValueError: If effect/param not found or value out of range
+        """
+        await self.set_value(resolve_parameter(effect, param, effect_type), value)
+
+    async def set_value(self, handle: ParamHandle, value: int):
+        """
+        Set a real-time parameter through a precomputed handle.
+
+        Args:
+            handle: Handle from zoomg9.addressing.resolve()
+            value: New value
+
+        Raises:
+            ValueError: If value is out of range
+        """
+        handle.check(value)
+
+        if not self._in_live_mode:
+            await self.enable_live_mode()
+
+        # 14-bit value: VALUE_LO, VALUE_HI
+        self._send_sysex(
+            self._param_msg.fill(handle.effect_id, handle.param_id, value & 0x7F, value >> 7)
+        )
+
+    async def apply_update(self, plan: UpdatePlan, patch_num: Optional[int] = None):
+        """
+        Apply a plan from zoomg9.diff.plan_update() (see G9Device.apply_update()).
+
+        Args:
+            plan: UpdatePlan to apply
+            patch_num: Slot to write (required for full writes)
+
+        Raises:
+            ValueError: If a full write is planned and patch_num is missing
+        """
+        if plan.full_write:
+            if patch_num is None:
+                raise ValueError("A full write needs patch_num")
+            await self.write_patch(patch_num, Patch.from_bytes(plan.data))
+            return
+
+        if plan.messages and not self._in_live_mode:
+            await self.enable_live_mode()
+        for msg in plan.messages:
+            self._send_sysex(msg)
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.disconnect()
+        return False
@@ -0,0 +1,180 @@
+"""
+Zoom G9.2tt Patch Bank
+
+A bank of 100 patches stored as one contiguous 12,800-byte buffer
+(100 x 128 decoded bytes) instead of 100 Patch objects. Patches are
+decoded on demand; writes mark the slot dirty.
+
+Snapshots are copy-on-write: snapshot() freezes the buffer into an
+immutable bytes object shared by both banks, and the first write to
+either bank copies it into a private bytearray. Keeping many snapshots
+of a bank costs one shared buffer until they diverge.
+"""
+
+from typing import Iterable, Iterator, List, Union
+
+from .constants import PATCH_COUNT, PATCH_SIZE_DECODED, PATCH_NAME_LENGTH, DIRECT_OFFSETS
+from .patch import Patch
+from .view import PatchView
+
+BANK_SIZE = PATCH_COUNT * PATCH_SIZE_DECODED  # 12,800 bytes
+
+_NAME_START = DIRECT_OFFSETS["Name"]
+
+
+class PatchBank:
+    """
+    100 patches in one contiguous buffer, with dirty-slot tracking.
+
+    Example usage:
+        bank = device.read_bank()
+        print(bank.names())
+
+        patch = bank[5]            # Decoded Patch (a copy)
+        patch.amp.gain = 80
+        bank[5] = patch            # Written back, slot 5 marked dirty
+
+        backup = bank.snapshot()   # O(1), shares the buffer
+    """
+
+    __slots__ = ("_buf", "_dirty")
+
+    def __init__(self, data: Union[bytes, bytearray, memoryview, None] = None):
+        """
+        Create a bank from raw data.
+
+        Args:
+            data: 12,800 bytes (100 decoded patches back to back).
+                  If None, every slot holds a default Patch().
+        """
+        if data is None:
+            self._buf = Patch().to_bytes() * PATCH_COUNT
+        else:
+            if len(data) != BANK_SIZE:
+                raise ValueError(f"Expected {BANK_SIZE} bytes, got {len(data)}")
+            self._buf = bytes(data)
+        self._dirty = 0  # Bit n set = slot n modified
+
+    @classmethod
+    def from_patches(cls, patches: Iterable[Union[Patch, bytes]]) -> "PatchBank":
+        """
+        Build a bank from 100 Patch objects or raw 128-byte patches.
+
+        Args:
+            patches: Iterable of exactly 100 items
+
+        Returns:
+            PatchBank (no slots dirty)
+        """
+        chunks = [p.to_bytes() if isinstance(p, Patch) else bytes(p) for p in patches]
+        if len(chunks) != PATCH_COUNT:
+            raise ValueError(f"Expected {PATCH_COUNT} patches, got {len(chunks)}")
+        for i, chunk in enumerate(chunks):
+            if len(chunk) != PATCH_SIZE_DECODED:
+                raise ValueError(f"Patch {i}: expected {PATCH_SIZE_DECODED} bytes, got {len(chunk)}")
+        return cls(b"".join(chunks))
+
+    def __len__(self) -> int:
+        return PATCH_COUNT
+
+    def _offset(self, patch_num: int) -> int:
+        if not 0 <= patch_num < PATCH_COUNT:
+            raise IndexError(f"Patch number must be 0-99, got {patch_num}")
+        return patch_num * PATCH_SIZE_DECODED
+
+    def raw(self, patch_num: int) -> memoryview:
+        """
+        Return a read-only view of one slot's 128 bytes (no copy).
+
+        The view reflects later writes only until the next snapshot().
+        """
+        start = self._offset(patch_num)
+        return memoryview(self._buf).toreadonly()[start:start + PATCH_SIZE_DECODED]
+
+    def view(self, patch_num: int) -> PatchView:
+        """
+        Return a read-only PatchView of one slot (decodes fields on access).
+
+        Use it for searches and listings; to change a slot, assign a Patch
+        or PatchView back to it.
+        """
+        return PatchView(self.raw(patch_num))
+
+    def __getitem__(self, patch_num: int) -> Patch:
+        """Decode one slot. The Patch is a copy; assign it back to store changes."""
+        start = self._offset(patch_num)
+        return Patch.from_bytes(bytes(self._buf[start:start + PATCH_SIZE_DECODED]))
+
+    def __setitem__(self, patch_num: int, patch: Union[Patch, PatchView, bytes]):
+        """Store a Patch, PatchView or raw 128 bytes in a slot and mark it dirty."""
+        data = patch.to_bytes() if isinstance(patch, (Patch, PatchView)) else patch
+        if len(data) != PATCH_SIZE_DECODED:
+            raise ValueError(f"Expected {PATCH_SIZE_DECODED} bytes, got {len(data)}")
+        start = self._offset(patch_num)
+        if self._buf[start:start + PATCH_SIZE_DECODED] == data:
+            return
+        if not isinstance(self._buf, bytearray):
+            self._buf = bytearray(self._buf)  # Copy on first write
+        self._buf[start:start + PATCH_SIZE_DECODED] = data
+        self._dirty |= 1 << patch_num
+
+    def __iter__(self) -> Iterator[Patch]:
+        for patch_num in range(PATCH_COUNT):
+            yield self[patch_num]
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, PatchBank):
+            return NotImplemented
+        return self._buf == other._buf
+
+    def name(self, patch_num: int) -> str:
+        """Patch name of one slot, read without decoding the patch."""
+        start = self._offset(patch_num) + _NAME_START
+        raw = bytes(self._buf[start:start + PATCH_NAME_LENGTH])
+        return raw.decode("ascii", errors="replace").rstrip(" \x00")
+
+    def names(self) -> List[str]:
+        """All 100 patch names."""
+        return [self.name(patch_num) for patch_num in range(PATCH_COUNT)]
+
+    @property
+    def dirty(self) -> List[int]:
+        """Slots modified since creation or the last mark_clean()."""
+        mask = self._dirty
+        return [n for n in range(PATCH_COUNT) if mask >> n & 1]
+
+    def is_dirty(self, patch_num: int) -> bool:
+        """Whether a slot was modified."""
+        return bool(self._dirty >> patch_num & 1)
+
+    def mark_clean(self):
+        """Forget which slots were modified (e.g. after writing the bank)."""
+        self._dirty = 0
+
+    def snapshot(self) -> "PatchBank":
+        """
+        Return an independent copy that shares the buffer until written.
+
+        The dirty slots are copied too.
+        """
+        if isinstance(self._buf, bytearray):
+            self._buf = bytes(self._buf)  # Freeze: shared from now on
+        copy = PatchBank.__new__(PatchBank)
+        copy._buf = self._buf
+        copy._dirty = self._dirty
+        return copy
+
+    def to_bytes(self) -> bytes:
+        """The whole bank as 12,800 bytes."""
+        return bytes(self._buf)
+
+    def to_list(self) -> List[bytes]:
+        """The bank as 100 raw 128-byte patches."""
+        buf = self._buf
+        return [
+            bytes(buf[start:start + PATCH_SIZE_DECODED])
+            for start in range(0, BANK_SIZE, PATCH_SIZE_DECODED)
+        ]
+
+    def __repr__(self):
+        return f"PatchBank(dirty={self.dirty})"
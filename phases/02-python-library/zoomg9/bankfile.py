@@ -0,0 +1,296 @@
+"""
+Zoom G9.2tt Bank File
+
+A fixed-layout binary file for one bank of 100 patches, opened through
+mmap: reading patch 73 touches only the header and that patch's 128
+bytes, and assigning a slot writes it in place. The layout (little-endian):
+
+    0x0000  Header (128 bytes)
+              magic b"G9BK", version (u16), patch count (u16),
+              patch size (u16), reserved (u16), created, modified
+              (float64 UNIX time), label (64 bytes UTF-8, NUL padded)
+    0x0080  100 x 128 bytes of decoded patch data
+    0x3280  100 x CRC-32 (u32), the READ_RESP checksum of each slot
+
+Example usage:
+    BankFile.create("bank_412.g9b", device.read_bank(), label="Live 2026")
+
+    with BankFile("bank_412.g9b") as bank:
+        patch = bank[73]               # Decodes one slot
+
+    with BankFile("bank_412.g9b", writable=True) as bank:
+        bank[73] = patch               # Written in place, checksum updated
+
+    BankFile.from_syx("backup.syx", "backup.g9b")   # 100 read responses
+    BankFile("backup.g9b").to_syx("copy.syx")
+"""
+
+import mmap
+import struct
+import time
+from pathlib import Path
+from typing import Iterable, List, Optional, Union
+
+from .constants import PATCH_COUNT, PATCH_SIZE_DECODED, PATCH_NAME_LENGTH, DIRECT_OFFSETS
+from .bank import PatchBank, BANK_SIZE
+from .encoding import _calculate_crc32, _encode_crc_7bit
+from .patch import Patch
+from .protocol import build_read_response, iter_patches
+from .view import PatchView
+
+MAGIC = b"G9BK"
+VERSION = 1
+LABEL_SIZE = 64
+
+_HEADER = struct.Struct(f"<4sHHHHdd{LABEL_SIZE}s")
+HEADER_SIZE = 128
+DATA_OFFSET = HEADER_SIZE
+CRC_OFFSET = DATA_OFFSET + BANK_SIZE
+FILE_SIZE = CRC_OFFSET + PATCH_COUNT * 4  # 13,328 bytes
+
+_MODIFIED = struct.Struct("<d")
+_MODIFIED_OFFSET = struct.calcsize("<4sHHHHd")
+_CRC = struct.Struct("<I")
+_CRCS = struct.Struct(f"<{PATCH_COUNT}I")
+_NAME_START = DIRECT_OFFSETS["Name"]
+
+
+class BankFile:
+    """
+    One bank of 100 patches in a memory-mapped file.
+
+    Slots are returned as copies (a Patch, a PatchView over 128 bytes, or
+    the bytes themselves), so the file can be closed at any time.
+    """
+
+    def __init__(self, path: Union[str, Path], writable: bool = False):
+        """
+        Open a bank file.
+
+        Args:
+            path: Bank file path
+            writable: Open for in-place slot writes
+
+        Raises:
+            ValueError: If the file is not a bank file
+        """
+        self.path = Path(path)
+        self.writable = writable
+        self._file = open(self.path, "r+b" if writable else "rb")
+        try:
+            self._mm = mmap.mmap(
+                self._file.fileno(), 0,
+                access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ,
+            )
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{self.path}: not a bank file (empty)")
+
+        if len(self._mm) != FILE_SIZE or self._mm[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"{self.path}: not a bank file")
+        _, version, count, size, _, self.created, _, _ = _HEADER.unpack_from(self._mm)
+        if version != VERSION or count != PATCH_COUNT or size != PATCH_SIZE_DECODED:
+            self.close()
+            raise ValueError(f"{self.path}: unsupported bank file version {version}")
+
+    @classmethod
+    def create(
+        cls,
+        path: Union[str, Path],
+        bank: Union[PatchBank, Iterable[Union[Patch, PatchView, bytes]], None] = None,
+        label: str = "",
+    ) -> "BankFile":
+        """
+        Write a new bank file and open it for writing.
+
+        Args:
+            path: Bank file path (overwritten if it exists)
+            bank: PatchBank or 100 patches (default: 100 default patches)
+            label: Free-form description (up to 64 bytes of UTF-8)
+
+        Returns:
+            Writable BankFile
+        """
+        if bank is None:
+            bank = PatchBank()
+        elif not isinstance(bank, PatchBank):
+            bank = PatchBank.from_patches(
+                p.to_bytes() if isinstance(p, PatchView) else p for p in bank
+            )
+        data = bank.to_bytes()
+
+        now = time.time()
+        header = _HEADER.pack(
+            MAGIC, VERSION, PATCH_COUNT, PATCH_SIZE_DECODED, 0, now, now, _encode_label(label)
+        )
+        crcs = _CRCS.pack(*(
+            _calculate_crc32(data[start:start + PATCH_SIZE_DECODED])
+            for start in range(0, BANK_SIZE, PATCH_SIZE_DECODED)
+        ))
+        Path(path).write_bytes(header.ljust(HEADER_SIZE, b"\x00") + data + crcs)
+        return cls(path, writable=True)
+
+    @classmethod
+    def from_syx(
+        cls,
+        syx_path: Union[str, Path],
+        path: Union[str, Path],
+        label: Optional[str] = None,
+    ) -> "BankFile":
+        """
+        Convert a .syx bank dump (100 0x21 read responses) to a bank file.
+
+        Args:
+            syx_path: .syx file with one read response per patch, in any order
+            path: Bank file to create
+            label: Label (default: the .syx file name, cut to 64 bytes)
+
+        Returns:
+            Writable BankFile
+
+        Raises:
+            ValueError: If some of the 100 patches are missing
+            ChecksumError: If a read response fails its checksum
+        """
+        slots = [None] * PATCH_COUNT
+        with open(syx_path, "rb") as f:
+            for patch_num, data in iter_patches(f):
+                if 0 <= patch_num < PATCH_COUNT:
+                    slots[patch_num] = data
+        missing = [n for n, data in enumerate(slots) if data is None]
+        if missing:
+            raise ValueError(f"{syx_path}: {len(missing)} patches missing (first: {missing[0]})")
+        if label is None:
+            label = _truncate_label(Path(syx_path).name)
+        return cls.create(path, slots, label)
+
+    def to_syx(self, path: Union[str, Path]):
+        """
+        Write the bank as 100 0x21 read responses (the read_all() format).
+
+        Checksums come from the file; nothing is recomputed.
+        """
+        with open(path, "wb") as f:
+            for patch_num in range(PATCH_COUNT):
+                f.write(build_read_response(
+                    patch_num, self.raw(patch_num), _encode_crc_7bit(self.crc(patch_num))
+                ))
+
+    def close(self):
+        """Unmap and close the file."""
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def __len__(self) -> int:
+        return PATCH_COUNT
+
+    def _offset(self, patch_num: int) -> int:
+        if not 0 <= patch_num < PATCH_COUNT:
+            raise IndexError(f"Patch number must be 0-99, got {patch_num}")
+        return DATA_OFFSET + patch_num * PATCH_SIZE_DECODED
+
+    @property
+    def label(self) -> str:
+        """Label stored in the header."""
+        raw = _HEADER.unpack_from(self._mm)[7]
+        return raw.rstrip(b"\x00").decode("utf-8", errors="replace")
+
+    @property
+    def modified(self) -> float:
+        """Time of the last slot write (UNIX time)."""
+        return _MODIFIED.unpack_from(self._mm, _MODIFIED_OFFSET)[0]
+
+    def raw(self, patch_num: int) -> bytes:
+        """The 128 bytes of one slot."""
+        start = self._offset(patch_num)
+        return self._mm[start:start + PATCH_SIZE_DECODED]
+
+    def view(self, patch_num: int) -> PatchView:
+        """A read-only PatchView of one slot."""
+        return PatchView(self.raw(patch_num))
+
+    def __getitem__(self, patch_num: int) -> Patch:
+        """Decode one slot."""
+        return Patch.from_bytes(self.raw(patch_num))
+
+    def __setitem__(self, patch_num: int, patch: Union[Patch, PatchView, bytes]):
+        """
+        Write a slot in place and update its checksum.
+
+        Raises:
+            TypeError: If the file was opened read-only
+        """
+        if not self.writable:
+            raise TypeError("Bank file is open read-only")
+        data = patch.to_bytes() if isinstance(patch, (Patch, PatchView)) else bytes(patch)
+        if len(data) != PATCH_SIZE_DECODED:
+            raise ValueError(f"Expected {PATCH_SIZE_DECODED} bytes, got {len(data)}")
+        start = self._offset(patch_num)
+        self._mm[start:start + PATCH_SIZE_DECODED] = data
+        _CRC.pack_into(self._mm, CRC_OFFSET + 4 * patch_num, _calculate_crc32(data))
+        _MODIFIED.pack_into(self._mm, _MODIFIED_OFFSET, time.time())
+
+    def __iter__(self):
+        for patch_num in range(PATCH_COUNT):
+            yield self[patch_num]
+
+    def crc(self, patch_num: int) -> int:
+        """Stored CRC-32 of one slot."""
+        self._offset(patch_num)
+        return _CRC.unpack_from(self._mm, CRC_OFFSET + 4 * patch_num)[0]
+
+    def verify(self) -> List[int]:
+        """
+        Check every slot against its stored checksum.
+
+        Returns:
+            Patch numbers whose data does not match (empty if all good)
+        """
+        return [
+            patch_num for patch_num in range(PATCH_COUNT)
+            if _calculate_crc32(self.raw(patch_num)) != self.crc(patch_num)
+        ]
+
+    def name(self, patch_num: int) -> str:
+        """Patch name of one slot, read without decoding the patch."""
+        start = self._offset(patch_num) + _NAME_START
+        raw = self._mm[start:start + PATCH_NAME_LENGTH]
+        return raw.decode("ascii", errors="replace").rstrip(" \x00")
+
+    def names(self) -> List[str]:
+        """All 100 patch names."""
+        return [self.name(patch_num) for patch_num in range(PATCH_COUNT)]
+
+    def to_bank(self) -> PatchBank:
+        """Load the whole bank into a PatchBank."""
+        return PatchBank(self._mm[DATA_OFFSET:CRC_OFFSET])
+
+    def flush(self):
+        """Write in-place changes to disk."""
+        self._mm.flush()
+
+    def __repr__(self):
+        mode = "writable" if self.writable else "read-only"
+        return f"BankFile({str(self.path)!r}, {mode}, label={self.label!r})"
+
+
+def _truncate_label(label: str) -> str:
+    """Cut a label to LABEL_SIZE bytes of UTF-8 without splitting a character."""
+    return label.encode("utf-8")[:LABEL_SIZE].decode("utf-8", errors="ignore")
+
+
+def _encode_label(label: str) -> bytes:
+    raw = label.encode("utf-8")
+    if len(raw) > LABEL_SIZE:
+        raise ValueError(f"Label too long ({len(raw)} bytes, max {LABEL_SIZE})")
+    return raw
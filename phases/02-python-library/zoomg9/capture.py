@@ -0,0 +1,388 @@
+"""
+Zoom G9.2tt Capture Log
+
+One append-only file per capture session instead of one .syx file per
+message. CaptureWriter buffers records and a background thread flushes
+them every flush_interval, busy or idle; a sidecar index (<file>.idx) holds the offset, time and
+command byte of every message so CaptureLog can find all 0x21 responses,
+or everything between two times, without scanning the log.
+
+    with CaptureWriter("session.g9cap") as log:
+        log.write(msg.data, DIR_RX, "UM-ONE")      # from mido, F0/F7 optional
+
+    log = CaptureLog("session.g9cap")
+    for record in log.find(cmd=0x21):
+        print(record.time, record.port, record.data.hex())
+    log.to_syx("responses.syx", cmd=0x21)
+
+Log file: the magic b"G9CAP\\x01" and the session start (float64 UNIX
+time), then records of a length (u32, bytes after the length field) and
+a kind byte:
+
+    0  message: time (u64 ns since start, monotonic), direction (u8),
+       port (u16), the complete F0 ... F7 message
+    1  port: port number (u16), name (UTF-8)
+
+Index file: one entry per record, offset (u64), time (u64 ns), command
+byte (u8, 0xFF for non-Zoom messages, 0xFE for port records). Opening a
+log reads only the index and the few port records it points to; a record
+cut short by a crash is ignored, and entries missing after a crash are
+rebuilt by scanning the log from the last indexed record.
+"""
+
+import bisect
+import mmap
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Union
+
+from .constants import ZOOM_MANUFACTURER_ID, G9TT_MODEL_ID
+
+MAGIC = b"G9CAP\x01"
+
+# Message directions
+DIR_RX = 0       # Device -> computer
+DIR_TX = 1       # Computer -> device
+DIR_UNKNOWN = 2
+
+_KIND_MESSAGE = 0
+_KIND_PORT = 1
+
+_HEADER = struct.Struct("<d")
+_LENGTH = struct.Struct("<I")
+_MESSAGE = struct.Struct("<BQBH")  # kind, time, direction, port
+_PORT = struct.Struct("<BH")       # kind, port
+_INDEX = struct.Struct("<QQB")     # offset, time, command
+
+_NO_COMMAND = 0xFF
+_PORT_ENTRY = 0xFE  # Index entry of a port record (Zoom commands are 7-bit)
+
+
+def _command(message: bytes) -> int:
+    """Command byte of a Zoom G9.2tt message (F0 52 00 42 CMD ...)."""
+    if (len(message) > 5 and message[1] == ZOOM_MANUFACTURER_ID
+            and message[3] == G9TT_MODEL_ID):
+        return message[4]
+    return _NO_COMMAND
+
+
+def index_path(path: Union[str, Path]) -> Path:
+    """Sidecar index of a capture log."""
+    path = Path(path)
+    return path.with_name(path.name + ".idx")
+
+
+class CaptureRecord(NamedTuple):
+    """One captured message."""
+
+    time: float       # Seconds since the session start
+    direction: int    # DIR_RX, DIR_TX or DIR_UNKNOWN
+    port: str
+    data: bytes       # Complete message, F0 ... F7
+
+    @property
+    def command(self) -> Optional[int]:
+        """Zoom command byte, or None for other messages."""
+        command = _command(self.data)
+        return None if command == _NO_COMMAND else command
+
+
+class CaptureWriter:
+    """
+    Buffered writer for a capture log.
+
+    Safe to share between threads (one capture thread per port). Buffered
+    records are written by a flusher thread every flush_interval seconds,
+    so they reach the disk even when no further messages arrive.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        flush_interval: float = 1.0,
+        buffer_size: int = 1 << 16,
+    ):
+        """
+        Create a capture log (overwriting any existing one).
+
+        Args:
+            path: Log file path; the index goes to path + ".idx"
+            flush_interval: Seconds between flushes to disk (a crash loses
+                            at most this much)
+            buffer_size: Write buffer size in bytes
+
+        Raises:
+            ValueError: If flush_interval is not positive
+        """
+        if flush_interval <= 0:
+            raise ValueError(f"flush_interval must be positive, got {flush_interval}")
+
+        self.path = Path(path)
+        self.flush_interval = flush_interval
+        self.start_time = time.time()
+        self.count = 0
+
+        self._t0 = time.monotonic_ns()
+        self._last_ns = 0
+        self._dirty = False
+        self._ports: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        self._log = open(self.path, "wb", buffering=buffer_size)
+        self._index = open(index_path(self.path), "wb", buffering=buffer_size)
+        self._log.write(MAGIC + _HEADER.pack(self.start_time))
+        self._offset = len(MAGIC) + _HEADER.size
+        self._flush()  # The header is on disk before the first message
+
+        self._closing = threading.Event()
+        self._flusher = threading.Thread(target=self._run, name="CaptureWriter", daemon=True)
+        self._flusher.start()
+
+    def _record(self, body: bytes):
+        self._log.write(_LENGTH.pack(len(body)))
+        self._log.write(body)
+        self._offset += _LENGTH.size + len(body)
+
+    def write(
+        self,
+        data,
+        direction: int = DIR_UNKNOWN,
+        port: str = "",
+        timestamp: Optional[float] = None,
+    ):
+        """
+        Append one message.
+
+        Args:
+            data: SysEx message with or without F0/F7 (bytes, list, or
+                  mido's msg.data), or any other MIDI message's bytes
+            direction: DIR_RX, DIR_TX or DIR_UNKNOWN
+            port: Port name
+            timestamp: Seconds since the session start (default: now)
+        """
+        message = bytes(data)
+        if not message or message[0] < 0x80:
+            message = b"\xF0" + message + b"\xF7"
+
+        with self._lock:
+            if timestamp is None:
+                ns = time.monotonic_ns() - self._t0
+            else:
+                ns = int(timestamp * 1e9)
+            ns = self._last_ns = max(ns, self._last_ns)  # Never goes backwards
+
+            port_id = self._ports.get(port)
+            if port_id is None:
+                port_id = self._ports[port] = len(self._ports)
+                self._index.write(_INDEX.pack(self._offset, ns, _PORT_ENTRY))
+                self._record(_PORT.pack(_KIND_PORT, port_id) + port.encode("utf-8"))
+
+            self._index.write(_INDEX.pack(self._offset, ns, _command(message)))
+            self._record(_MESSAGE.pack(_KIND_MESSAGE, ns, direction, port_id) + message)
+            self.count += 1
+            self._dirty = True
+
+    def _flush(self):
+        # Either file may also write itself out when its buffer fills, so
+        # after a crash the index can point past the end of the log, or
+        # lag behind it. CaptureLog copes with both: it stops at the first
+        # entry without a complete record and scans the log from there.
+        self._log.flush()
+        self._index.flush()
+        self._dirty = False
+
+    def _run(self):
+        """Flusher thread: write buffered records every flush_interval."""
+        while not self._closing.wait(self.flush_interval):
+            with self._lock:
+                if self._dirty and not self._log.closed:
+                    self._flush()
+
+    def flush(self):
+        """Write buffered records to disk."""
+        with self._lock:
+            self._flush()
+
+    def close(self):
+        """Flush and close the log."""
+        self._closing.set()
+        if self._flusher is not threading.current_thread():
+            self._flusher.join()
+        with self._lock:
+            if not self._log.closed:
+                self._flush()
+                self._log.close()
+                self._index.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+class CaptureLog:
+    """
+    Read-only access to a capture log through its index.
+
+    Example usage:
+        log = CaptureLog("session.g9cap")
+        len(log)                          # Messages
+        log[0]                            # CaptureRecord
+        log.find(cmd=0x21, start=2.5)     # Read responses after 2.5 s
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Open a capture log.
+
+        Raises:
+            ValueError: If the file is not a capture log
+        """
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        header_size = len(MAGIC) + _HEADER.size
+        if len(self._mm) < header_size or self._mm[:len(MAGIC)] != MAGIC:
+            self._mm.close()
+            raise ValueError(f"{self.path}: not a capture log")
+        self.start_time = _HEADER.unpack_from(self._mm, len(MAGIC))[0]
+
+        self.ports: List[str] = []
+        self._offsets: List[int] = []
+        self._times: List[int] = []
+        self._commands = bytearray()
+        self._scan(self._load_index(header_size))
+
+    def _port(self, pos: int, length: int):
+        """Register the port record at pos."""
+        body = pos + _LENGTH.size
+        port_id = _PORT.unpack_from(self._mm, body)[1]
+        name = self._mm[body + _PORT.size:body + length].decode("utf-8", errors="replace")
+        if port_id >= len(self.ports):
+            self.ports.extend(str(n) for n in range(len(self.ports), port_id + 1))
+        self.ports[port_id] = name
+
+    def _load_index(self, header_size: int) -> int:
+        """
+        Read the index entries that point to complete records.
+
+        Returns:
+            Log offset just past the last indexed record
+        """
+        path = index_path(self.path)
+        if not path.exists():
+            return header_size
+        data = path.read_bytes()
+        end = len(self._mm)
+        indexed_end = header_size
+        for offset, ns, command in _INDEX.iter_unpack(data[:len(data) - len(data) % _INDEX.size]):
+            if offset + _LENGTH.size > end:
+                break
+            length = _LENGTH.unpack_from(self._mm, offset)[0]
+            if offset + _LENGTH.size + length > end:
+                break
+            if command == _PORT_ENTRY:
+                self._port(offset, length)
+            else:
+                self._offsets.append(offset)
+                self._times.append(ns)
+                self._commands.append(command)
+            indexed_end = offset + _LENGTH.size + length
+        return indexed_end
+
+    def _scan(self, pos: int):
+        """Index the records after pos, which the index file lacks."""
+        mm = self._mm
+        end = len(mm)
+        while pos + _LENGTH.size <= end:
+            length = _LENGTH.unpack_from(mm, pos)[0]
+            body = pos + _LENGTH.size
+            if body + length > end or length == 0:
+                break  # Cut short by a crash
+            kind = mm[body]
+            if kind == _KIND_PORT:
+                self._port(pos, length)
+            elif kind == _KIND_MESSAGE:
+                ns = _MESSAGE.unpack_from(mm, body)[1]
+                self._offsets.append(pos)
+                self._times.append(ns)
+                self._commands.append(_command(mm[body + _MESSAGE.size:body + length]))
+            pos = body + length
+
+    def close(self):
+        """Unmap the log."""
+        self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __getitem__(self, i: int) -> CaptureRecord:
+        offset = self._offsets[i]
+        length = _LENGTH.unpack_from(self._mm, offset)[0]
+        body = offset + _LENGTH.size
+        _, ns, direction, port_id = _MESSAGE.unpack_from(self._mm, body)
+        port = self.ports[port_id] if port_id < len(self.ports) else str(port_id)
+        return CaptureRecord(ns / 1e9, direction, port, self._mm[body + _MESSAGE.size:body + length])
+
+    def __iter__(self) -> Iterator[CaptureRecord]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def find(
+        self,
+        cmd: Optional[int] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        direction: Optional[int] = None,
+    ) -> List[CaptureRecord]:
+        """
+        Messages matching all the given filters, in time order.
+
+        Args:
+            cmd: Zoom command byte (e.g. 0x21)
+            start: Earliest time, in seconds since the session start
+            end: Latest time (exclusive)
+            direction: DIR_RX, DIR_TX or DIR_UNKNOWN
+
+        Returns:
+            List of CaptureRecord
+        """
+        first = 0 if start is None else bisect.bisect_left(self._times, int(start * 1e9))
+        last = len(self) if end is None else bisect.bisect_left(self._times, int(end * 1e9))
+        commands = self._commands
+        found = []
+        for i in range(first, last):
+            if cmd is not None and commands[i] != cmd:
+                continue
+            record = self[i]
+            if direction is None or record.direction == direction:
+                found.append(record)
+        return found
+
+    def to_syx(self, path: Union[str, Path], **filters) -> int:
+        """
+        Export messages to a .syx file (all of them, or those matching the
+        same filters as find()).
+
+        Returns:
+            Number of messages written
+        """
+        records = self.find(**filters) if filters else list(self)
+        with open(path, "wb") as f:
+            for record in records:
+                f.write(record.data)
+        return len(records)
+
+    def __repr__(self):
+        return f"CaptureLog({str(self.path)!r}, {len(self)} messages, ports={self.ports})"
@@ -10,12 +10,14 @@ FUNCIONALIDAD PROBADA (2026-01-26):
     ✓ read_patch - Leer un patch
     ✓ read_all - Leer todos los patches
     ✓ set_parameter - Control en tiempo real (comando 0x31)
-    ✓ write_patch - Escribir patch via bulk write (checksum CRC-32 descifrado 2026-01-26)
+    ✓ write_patch - Escribir un patch directo en su slot (0x28 + confirmación 0x31)
     ✓ write_all - Escribir todos los patches
 """
 
+import queue
 import time
-from typing import Optional, List, Callable
+from collections import deque
+from typing import Optional, List, Callable, Union
 
 try:
     import mido
@@ -25,23 +27,29 @@ except ImportError:
 from .constants import (
     PATCH_COUNT,
     EFFECT_NAMES,
-    PARAM_RANGES,
+    CMD_READ_PATCH,
+    CMD_PARAM_CHANGE,
 )
 from .protocol import (
-    build_read_request,
-    build_enter_edit,
-    build_exit_edit,
+    ENTER_EDIT,
+    EXIT_EDIT,
+    ENABLE_LIVE,
+    DISABLE_LIVE,
+    IDENTITY_REQUEST,
+    SysexTemplate,
     build_write_data,
-    build_param_change,
     build_patch_select,
     build_read_response,
-    build_identity_request,
-    build_enable_live,
-    build_disable_live,
     parse_read_response,
     parse_identity_response,
+    ChecksumError,
 )
+from .addressing import ParamHandle, resolve_parameter
+from .bank import PatchBank
+from .diff import UpdatePlan
+from .messages import EditExit, ReadRequest, ReadResponse, decode_message
 from .patch import Patch
+from .transport import Transport, MidoTransport
 
 
 class G9DeviceError(Exception):
@@ -68,26 +76,34 @@ class G9Device:
         device.disconnect()
     """
 
-    def __init__(self, port_name: Optional[str] = None):
+    def __init__(self, port_name: Optional[str] = None, transport: Optional[Transport] = None):
         """
         Initialize the device interface.
 
         Args:
             port_name: Specific MIDI port name to use.
                       If None, will auto-detect on connect().
+            transport: Transport to use instead of a MIDI port
+                      (e.g. zoomg9.emulator.VirtualG9)
         """
-        if mido is None:
+        if transport is None and mido is None:
             raise ImportError(
                 "mido is required for MIDI communication. "
                 "Install with: pip install mido python-rtmidi"
             )
 
         self.port_name = port_name
-        self._inport = None
-        self._outport = None
+        self._transport = transport
+        self._own_transport = transport is None  # Created on connect()
         self._connected = False
         self._in_edit_mode = False
         self._in_live_mode = False
+        self._rx = queue.Queue()  # SysEx messages from the input callback
+        self._bank = [None] * PATCH_COUNT  # Raw 128-byte cache per slot
+
+        # Preallocated messages for the hot paths (refilled in place)
+        self._read_msg = SysexTemplate(CMD_READ_PATCH, 1)
+        self._param_msg = SysexTemplate(CMD_PARAM_CHANGE, 4)
 
     @property
     def connected(self) -> bool:
@@ -110,7 +126,8 @@ class G9Device:
             "output": list(mido.get_output_names()),
         }
 
-    def _find_port(self) -> Optional[str]:
+    @staticmethod
+    def _find_port() -> Optional[str]:
         """Auto-detect the G9.2tt MIDI port."""
         outputs = mido.get_output_names()
 
@@ -144,17 +161,20 @@ class G9Device:
         if self._connected:
             return True
 
-        if port_name:
-            self.port_name = port_name
-        elif not self.port_name:
-            self.port_name = self._find_port()
+        if self._own_transport:
+            if port_name:
+                self.port_name = port_name
+            elif not self.port_name:
+                self.port_name = self._find_port()
 
-        if not self.port_name:
-            raise G9DeviceError("No MIDI port found")
+            if not self.port_name:
+                raise G9DeviceError("No MIDI port found")
 
         try:
-            self._outport = mido.open_output(self.port_name)
-            self._inport = mido.open_input(self.port_name)
+            if self._own_transport:
+                self._transport = MidoTransport(self.port_name)
+            self._drain_input()
+            self._transport.open(self._on_message)
             self._connected = True
             return True
         except Exception as e:
@@ -174,49 +194,53 @@ class G9Device:
             except Exception:
                 pass
 
-        if self._outport:
-            self._outport.close()
-            self._outport = None
-
-        if self._inport:
-            self._inport.close()
-            self._inport = None
+        if self._transport is not None and self._connected:
+            self._transport.close()
+        if self._own_transport:
+            self._transport = None
 
         self._connected = False
 
     def _send_sysex(self, data: bytes):
-        """Send a SysEx message."""
+        """Send a complete SysEx message (bytes, bytearray or memoryview)."""
         if not self._connected:
             raise G9DeviceError("Not connected")
 
-        # mido expects data without F0/F7
-        if data[0] == 0xF0:
-            data = data[1:]
-        if data[-1] == 0xF7:
-            data = data[:-1]
+        self._transport.send(data)
 
-        msg = mido.Message("sysex", data=list(data))
-        self._outport.send(msg)
+    def _on_message(self, data: bytes):
+        """Transport callback (runs on the transport's thread)."""
+        self._rx.put(data)
+
+    def _drain_input(self):
+        """Discard any SysEx messages received but not yet consumed."""
+        while True:
+            try:
+                self._rx.get_nowait()
+            except queue.Empty:
+                return
 
     def _receive_sysex(self, timeout: float = 2.0) -> Optional[bytes]:
-        """Receive a SysEx message with timeout."""
+        """
+        Receive a SysEx message with timeout.
+
+        Blocks until the input callback delivers a message, so the call
+        returns as soon as the reply arrives.
+        """
         if not self._connected:
             raise G9DeviceError("Not connected")
 
-        start = time.time()
-        while time.time() - start < timeout:
-            for msg in self._inport.iter_pending():
-                if msg.type == "sysex":
-                    return bytes([0xF0] + list(msg.data) + [0xF7])
-            time.sleep(0.01)
-        return None
+        try:
+            return self._rx.get(timeout=timeout)
+        except queue.Empty:
+            return None
 
     def enter_edit_mode(self):
         """Enter edit mode (required before write operations)."""
         if self._in_edit_mode:
             return
 
-        self._send_sysex(build_enter_edit())
+        self._send_sysex(ENTER_EDIT)
         time.sleep(0.1)
         self._in_edit_mode = True
 
@@ -225,7 +249,7 @@ class G9Device:
         if not self._in_edit_mode:
             return
 
-        self._send_sysex(build_exit_edit())
+        self._send_sysex(EXIT_EDIT)
         time.sleep(0.1)
         self._in_edit_mode = False
 
@@ -239,7 +263,7 @@ class G9Device:
         if self._in_live_mode:
             return
 
-        self._send_sysex(build_enable_live())
+        self._send_sysex(ENABLE_LIVE)
         time.sleep(0.1)
         self._in_live_mode = True
 
@@ -252,7 +276,7 @@ class G9Device:
         if not self._in_live_mode:
             return
 
-        self._send_sysex(build_disable_live())
+        self._send_sysex(DISABLE_LIVE)
         time.sleep(0.1)
         self._in_live_mode = False
 
@@ -263,7 +287,7 @@ class G9Device:
         Returns:
             Dictionary with manufacturer, model, firmware info
         """
-        self._send_sysex(build_identity_request())
+        self._send_sysex(IDENTITY_REQUEST)
         response = self._receive_sysex(timeout=2.0)
 
         if response:
@@ -282,8 +306,10 @@ class G9Device:
         if not 0 <= patch_num <= 99:
             raise ValueError(f"Patch number must be 0-99, got {patch_num}")
 
-        msg = mido.Message("program_change", program=patch_num)
-        self._outport.send(msg)
+        if not self._connected:
+            raise G9DeviceError("Not connected")
+
+        self._transport.send(bytes([0xC0, patch_num]))
 
     def read_patch(self, patch_num: int) -> Patch:
         """
@@ -296,34 +322,43 @@ class G9Device:
             Patch object with all parameters
 
         Raises:
-            G9DeviceError: If read fails
+            G9DeviceError: If read fails or the checksum does not match
         """
         if not 0 <= patch_num <= 99:
             raise ValueError(f"Patch number must be 0-99, got {patch_num}")
 
-        self._send_sysex(build_read_request(patch_num))
+        self._send_sysex(self._read_msg.fill(patch_num))
         response = self._receive_sysex(timeout=3.0)
 
-        if not response or len(response) != 268:
+        if not response or not isinstance(decode_message(response), ReadResponse):
             raise G9DeviceError(f"Failed to read patch {patch_num}")
 
-        _, decoded = parse_read_response(response)
+        try:
+            _, decoded = parse_read_response(response)
+        except ChecksumError as e:
+            raise G9DeviceError(f"Corrupted transfer reading patch {patch_num}: {e}")
+        self._bank[patch_num] = decoded
         return Patch.from_bytes(decoded)
 
-    def write_patch(self, patch_num: int, patch: Patch):
+    def write_patch(self, patch_num: int, patch: Patch, bulk: bool = False):
         """
-        Write a single patch to the device using bulk write protocol.
+        Write a single patch to the device.
 
-        This method uses the bulk write protocol where:
-        1. Host sends ENTER_EDIT (0x12)
-        2. Pedal (in BULK RX mode) sends READ_REQ (0x11) for each patch
-        3. Host responds with READ_RESP (0x21) containing the patch data
+        By default the patch is written directly to its slot:
+        1. Host sends ENTER_EDIT (0x12) if not already in edit mode
+        2. Host selects the slot (0x31 [patch] 02 02 00)
+        3. Host sends the patch data (0x28, 7-bit encoded)
+        4. Host confirms the write (0x31 [patch] 02 09 00)
+        5. Host sends EXIT_EDIT (0x1F) if it entered edit mode
 
-        IMPORTANT: The pedal must be in BULK RX mode before calling this method.
+        With bulk=True the bulk write protocol is used instead, built from
+        the bank cache (see cached_bank()); only slots not cached yet are
+        read from the device. The pedal must then be in BULK RX mode.
 
         Args:
             patch_num: Patch number (0-99)
             patch: Patch object to write
+            bulk: Use the bulk write protocol instead of a targeted write
 
         Raises:
             G9DeviceError: If write fails
@@ -332,101 +367,290 @@ class G9Device:
         if not 0 <= patch_num <= 99:
             raise ValueError(f"Patch number must be 0-99, got {patch_num}")
 
-        # For single patch write, we need to do a full bulk write
-        # but only modify the requested patch
-        patches = self.read_all()
-        patches[patch_num] = patch
-        self.write_all(patches)
+        data = patch.to_bytes()
+
+        if bulk:
+            bank = self.cached_bank()
+            bank[patch_num] = data
+            self._bulk_write(bank)
+            return
+
+        was_editing = self._in_edit_mode
+        self.enter_edit_mode()
+        try:
+            self._send_sysex(build_patch_select(patch_num, 0x02))
+            time.sleep(0.1)
+            self._send_sysex(build_write_data(data))
+            time.sleep(0.1)
+            self._send_sysex(build_patch_select(patch_num, 0x09))
+            time.sleep(0.1)
+        finally:
+            if not was_editing:
+                self.exit_edit_mode()
+
+        self._bank[patch_num] = data
+
+    def cached_bank(self) -> List[bytes]:
+        """
+        Return the raw 128-byte data of all patches, reading only missing slots.
+
+        Missing slots are read with the same pipelined transfer as
+        read_all(). The cache is filled by read_patch(), read_all(), write_patch() and
+        write_all(). Changes made on the pedal itself are not seen; call
+        invalidate_cache() after editing patches on the hardware.
+
+        Returns:
+            List of 100 byte strings (a copy; the cache is not modified)
+        """
+        missing = [patch_num for patch_num, data in enumerate(self._bank) if data is None]
+        if missing:
+            self._read_raw_all(None, 4, 8, 3.0, 3, missing)
+        return list(self._bank)
 
-    def set_parameter(self, effect: str, param: str, value: int):
+    def invalidate_cache(self):
+        """Forget all cached patch data."""
+        self._bank = [None] * PATCH_COUNT
+
+    def set_parameter(
+        self,
+        effect: str,
+        param: str,
+        value: int,
+        effect_type: Optional[Union[int, str]] = None,
+    ):
         """
         Set an effect parameter in real-time.
 
         NOTE: The device must be in live mode for real-time changes to work.
         This method automatically enables live mode if not already enabled.
 
+        For repeated changes, resolve the parameter once with
+        zoomg9.addressing.resolve() and use set_value().
+
         Args:
             effect: Effect name (amp, delay, reverb, etc.)
             param: Parameter name (gain, time, mix, etc.)
             value: New value
+            effect_type: Current type of the effect (number or name), for
+                         type-specific parameter names and ranges
 
         Raises:
             ValueError: If effect/param not found or value out of range
         """
+        self.set_value(resolve_parameter(effect, param, effect_type), value)
+
+    def set_value(self, handle: ParamHandle, value: int):
+        """
+        Set a real-time parameter through a precomputed handle.
+
+        Args:
+            handle: Handle from zoomg9.addressing.resolve()
+            value: New value
+
+        Raises:
+            ValueError: If value is out of range
+        """
+        handle.check(value)
+        self._send_param(handle.effect_id, handle.param_id, value)
+
+    def _send_param(self, effect_id: int, param_id: int, value: int):
+        """Send a validated 0x31 parameter change, enabling live mode first."""
+        # 14-bit value: VALUE_LO, VALUE_HI
+        self.send_param_message(self._param_msg.fill(effect_id, param_id, value & 0x7F, value >> 7))
+
+    def send_param_message(self, msg: bytes):
+        """
+        Send a prebuilt 0x31 parameter change, enabling live mode first.
+
+        For senders that fill their own message buffer (e.g. a
+        SysexTemplate owned by another thread). The message is not checked.
+
+        Args:
+            msg: Complete 0x31 message (bytes, bytearray or memoryview)
+        """
         # Enable live mode if not already (required for 0x31 commands to work)
         if not self._in_live_mode:
             self.enable_live_mode()
-        # Map effect name to ID
-        effect_map = {
-            "top": 0x00,
-            "cmp": 0x01, "comp": 0x01, "compressor": 0x01,
-            "wah": 0x02,
-            "ext": 0x03,
-            "znr": 0x04,
-            "amp": 0x05,
-            "eq": 0x06,
-            "cab": 0x07,
-            "mod": 0x08,
-            "dly": 0x09, "delay": 0x09,
-            "rev": 0x0A, "reverb": 0x0A,
-        }
 
-        effect_lower = effect.lower()
-        if effect_lower not in effect_map:
-            raise ValueError(f"Unknown effect: {effect}")
-
-        effect_id = effect_map[effect_lower]
-
-        # Map param name to ID
-        param_map = {
-            "on": 0x00, "onoff": 0x00,
-            "type": 0x01,
-            "gain": 0x02, "sense": 0x02, "depth": 0x02, "time": 0x02, "decay": 0x02,
-            "send": 0x02, "band1": 0x02,
-            "tone": 0x03, "attack": 0x03, "rate": 0x03, "feedback": 0x03,
-            "predelay": 0x03, "return": 0x03, "band2": 0x03,
-            "level": 0x04, "resonance": 0x04, "hidamp": 0x04, "dry": 0x04,
-            "band3": 0x04, "mictype": 0x03, "micpos": 0x04,
-            "mix": 0x05, "band4": 0x05,
-            "band5": 0x06, "band6": 0x07,
-        }
+        self._send_sysex(msg)
 
-        param_lower = param.lower()
-        if param_lower not in param_map:
-            raise ValueError(f"Unknown parameter: {param}")
+    def apply_update(self, plan: UpdatePlan, patch_num: Optional[int] = None):
+        """
+        Apply a plan from zoomg9.diff.plan_update().
 
-        param_id = param_map[param_lower]
+        Parameter changes go to the active patch in live mode, like
+        set_parameter(); they are not stored until the patch is saved. A
+        full write stores plan.data in slot patch_num with write_patch().
 
-        # Validate value range
-        if effect_id in PARAM_RANGES and param_id in PARAM_RANGES[effect_id]:
-            min_val, max_val = PARAM_RANGES[effect_id][param_id]
-            if not min_val <= value <= max_val:
-                raise ValueError(f"Value must be {min_val}-{max_val}, got {value}")
+        Args:
+            plan: UpdatePlan to apply
+            patch_num: Slot to write (required for full writes)
 
-        # Handle values > 127 (need special encoding)
-        if value > 127:
-            raise ValueError("Values > 127 require special handling (not yet implemented)")
+        Raises:
+            ValueError: If a full write is planned and patch_num is missing
+        """
+        if plan.full_write:
+            if patch_num is None:
+                raise ValueError("A full write needs patch_num")
+            self.write_patch(patch_num, Patch.from_bytes(plan.data))
+            return
 
-        self._send_sysex(build_param_change(effect_id, param_id, value))
+        if plan.messages and not self._in_live_mode:
+            self.enable_live_mode()
+        for msg in plan.messages:
+            self._send_sysex(msg)
 
-    def read_all(self, progress_callback: Optional[Callable[[int, int], None]] = None) -> List[Patch]:
+    def read_all(
+        self,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        window: int = 4,
+        max_window: int = 8,
+        timeout: float = 3.0,
+        retries: int = 3,
+    ) -> List[Patch]:
         """
         Read all patches from the device.
 
+        Requests are pipelined: up to `window` read requests (0x11) are kept
+        in flight and replies are matched by the patch number in the
+        response. The pedal answers in request order, so a reply for a
+        later patch means earlier unanswered requests were dropped; those
+        are re-sent and the window is halved. After a full window of clean
+        replies the window grows by one, up to max_window. On a timeout the
+        window falls back to 1 (one request at a time).
+
         Args:
             progress_callback: Optional callback(current, total) for progress updates
+            window: Initial number of requests in flight (1 = no pipelining)
+            max_window: Upper bound for the adaptive window
+            timeout: Seconds to wait for a reply before re-sending
+            retries: Extra attempts per patch before giving up (each patch is
+                     requested at most retries + 1 times)
 
         Returns:
             List of 100 Patch objects
+
+        Raises:
+            G9DeviceError: If a patch cannot be read after all retries
+        """
+        raw = self._read_raw_all(progress_callback, window, max_window, timeout, retries)
+        return [Patch.from_bytes(data) for data in raw]
+
+    def read_bank(
+        self,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        window: int = 4,
+        max_window: int = 8,
+        timeout: float = 3.0,
+        retries: int = 3,
+    ) -> PatchBank:
+        """
+        Read all patches into a PatchBank (one 12.8 KB buffer).
+
+        Same transfer as read_all(), without building 100 Patch objects.
+
+        Returns:
+            PatchBank with no dirty slots
+
+        Raises:
+            G9DeviceError: If a patch cannot be read after all retries
+        """
+        raw = self._read_raw_all(progress_callback, window, max_window, timeout, retries)
+        return PatchBank(b"".join(raw))
+
+    def _read_raw_all(
+        self,
+        progress_callback: Optional[Callable[[int, int], None]],
+        window: int,
+        max_window: int,
+        timeout: float,
+        retries: int,
+        patch_nums: Optional[List[int]] = None,
+    ) -> List[bytes]:
+        """
+        Pipelined read of raw 128-byte patch data (see read_all()).
+
+        Reads patch_nums (default: all 100); the other entries of the
+        returned list are None.
         """
-        patches = []
+        if window < 1 or max_window < window:
+            raise ValueError(f"Invalid window {window} (max_window {max_window})")
+
+        if patch_nums is None:
+            patch_nums = range(PATCH_COUNT)
+        patches = [None] * PATCH_COUNT
+        attempts = [0] * PATCH_COUNT
+        to_send = deque(patch_nums)
+        total = len(to_send)
+        in_flight = {}  # patch_num -> None, in send order
+        streak = 0
+        done = 0
+
+        def retry(patch_num: int):
+            attempts[patch_num] += 1
+            if attempts[patch_num] > retries:
+                raise G9DeviceError(f"Failed to read patch {patch_num}")
+            to_send.appendleft(patch_num)
+
+        self._drain_input()
+
+        while done < total:
+            while to_send and len(in_flight) < window:
+                patch_num = to_send.popleft()
+                self._send_sysex(self._read_msg.fill(patch_num))
+                in_flight[patch_num] = None
+
+            response = self._receive_sysex(timeout=timeout)
+
+            if response is None:
+                # Nothing came back: re-send everything, one at a time
+                for patch_num in reversed(list(in_flight)):
+                    retry(patch_num)
+                in_flight.clear()
+                window = 1
+                streak = 0
+                continue
+
+            msg = decode_message(response)
+            if not isinstance(msg, ReadResponse) or msg.patch_num not in in_flight:
+                continue  # Unrelated, late or duplicate message
+
+            patch_num = msg.patch_num
+
+            # Requests sent before this one went unanswered: the pedal dropped them
+            dropped = []
+            for pending in in_flight:
+                if pending == patch_num:
+                    break
+                dropped.append(pending)
+            for pending in reversed(dropped):
+                del in_flight[pending]
+                retry(pending)
+            if dropped:
+                window = max(1, window // 2)
+                streak = 0
+
+            del in_flight[patch_num]
 
-        for i in range(PATCH_COUNT):
-            patch = self.read_patch(i)
-            patches.append(patch)
+            try:
+                _, decoded = parse_read_response(response)
+            except ChecksumError:
+                retry(patch_num)
+                window = max(1, window // 2)
+                streak = 0
+                continue
+
+            self._bank[patch_num] = decoded
+            patches[patch_num] = decoded
+            done += 1
+
+            streak += 1
+            if streak >= window and window < max_window:
+                window += 1
+                streak = 0
 
             if progress_callback:
-                progress_callback(i + 1, PATCH_COUNT)
+                progress_callback(done, total)
 
         return patches
 
@@ -461,11 +685,48 @@ class G9Device:
         if len(patches) != PATCH_COUNT:
             raise ValueError(f"Expected {PATCH_COUNT} patches, got {len(patches)}")
 
-        # Convert patches to raw bytes
-        patches_data = [p.to_bytes() for p in patches]
+        self._bulk_write(
+            [p.to_bytes() for p in patches], progress_callback, timeout,
+            checksums=[p.checksum() for p in patches],
+        )
+
+    def write_bank(
+        self,
+        bank: PatchBank,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        timeout: float = 5.0
+    ):
+        """
+        Write a PatchBank to the device using bulk write protocol.
+
+        The pedal must be in BULK RX mode (see write_all()). On success the
+        bank's dirty slots are cleared.
+
+        Args:
+            bank: PatchBank to write
+            progress_callback: Optional callback(current, total) for progress updates
+            timeout: Timeout in seconds waiting for pedal requests
+
+        Raises:
+            G9DeviceError: If write fails or times out
+        """
+        self._bulk_write(bank.to_list(), progress_callback, timeout)
+        bank.mark_clean()
 
+    def _bulk_write(
+        self,
+        patches_data: List[bytes],
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        timeout: float = 5.0,
+        checksums: Optional[List[bytes]] = None,
+    ):
+        """
+        Run the bulk write protocol with 100 raw 128-byte patches.
+
+        checksums, if given, are the precomputed READ_RESP checksums.
+        """
         # Send ENTER_EDIT to signal we're ready
-        self._send_sysex(build_enter_edit())
+        self._send_sysex(ENTER_EDIT)
 
         count = 0
         consecutive_errors = 0
@@ -485,25 +746,30 @@ class G9Device:
                 continue
 
             consecutive_errors = 0
-            cmd = response[4] if len(response) > 4 else 0
+            msg = decode_message(response)
 
-            if cmd == 0x11:  # READ_REQ - pedal requesting a patch
-                patch_num = response[5]
+            if isinstance(msg, ReadRequest):  # Pedal requesting a patch
+                patch_num = msg.patch_num
                 if 0 <= patch_num < PATCH_COUNT:
                     # Build and send READ_RESP with correct checksum
-                    resp = build_read_response(patch_num, patches_data[patch_num])
+                    resp = build_read_response(
+                        patch_num, patches_data[patch_num],
+                        checksums[patch_num] if checksums else None,
+                    )
                     self._send_sysex(resp)
                     count += 1
 
                     if progress_callback:
                         progress_callback(count, PATCH_COUNT)
 
-            elif cmd == 0x1F:  # EXIT_EDIT - pedal is done
+            elif isinstance(msg, EditExit):  # Pedal is done
                 break
 
         if count != PATCH_COUNT:
             raise G9DeviceError(f"Only wrote {count}/{PATCH_COUNT} patches")
 
+        self._bank = list(patches_data)
+
     def __enter__(self):
         """Context manager entry."""
         self.connect()
@@ -0,0 +1,254 @@
+"""
+Zoom G9.2tt Patch Diff and Update Planner
+
+Field-level differences between two patches or banks, using the same
+BIT_TBL / DIRECT_OFFSETS field map as PatchView, and a planner that picks
+the cheapest way to turn the patch on a live pedal into another one:
+
+    plan = plan_update(current, target)
+    print(plan)                       # UpdatePlan(3 param changes, 30 bytes)
+    device.apply_update(plan, patch_num=5)
+
+A handful of changed knobs becomes a few 10-byte 0x31 parameter changes;
+a different name or unmapped byte, a change on the amp channel that is
+not selected, or simply too many changes, becomes one full patch write.
+
+Channel A/B modules (ZNR, AMP, EQ) are changed live through the channel
+the patch has selected (amp_sel); changes to the other channel need a
+full write.
+"""
+
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from .constants import (
+    PATCH_SIZE_DECODED,
+    PATCH_NAME_LENGTH,
+    DIRECT_OFFSETS,
+)
+from .bank import PatchBank
+from .encoding import PACKED_SIZE
+from .patch import Patch
+from .protocol import build_param_change
+from .view import PatchView, _FIELDS
+
+PatchLike = Union[Patch, PatchView, bytes, bytearray, memoryview]
+
+# Bytes on the wire: one 0x31 parameter change, and a full patch write
+# (slot select 0x31 + 0x28 write data + confirm 0x31)
+PARAM_CHANGE_COST = 10
+FULL_WRITE_COST = 10 + 153 + 10
+
+# Modules that belong to amp channel A or B (amp_sel 0 or 1)
+_CHANNEL = {"znr_a": 0, "amp_a": 0, "eq_a": 0, "znr_b": 1, "amp_b": 1, "eq_b": 1}
+
+
+class FieldChange(NamedTuple):
+    """One field that differs between two patches."""
+
+    field: str                      # "amp_a.gain", "name", "raw[0x40]", ...
+    old: Union[int, bool, str]
+    new: Union[int, bool, str]
+    address: Optional[Tuple[int, int]]  # (effect_id, param_id) of its 0x31 change
+
+
+class UpdatePlan(NamedTuple):
+    """
+    How to turn one patch into another on the pedal.
+
+    If full_write is set, write data as a whole; otherwise send messages
+    (0x31 parameter changes, in order) to the active patch.
+    """
+
+    changes: List[FieldChange]
+    full_write: bool
+    messages: List[bytes]
+    data: bytes  # Target patch, 128 bytes
+
+    @property
+    def cost(self) -> int:
+        """Bytes sent on the MIDI link to apply the plan."""
+        if self.full_write:
+            return FULL_WRITE_COST
+        return sum(len(msg) for msg in self.messages)
+
+    def __repr__(self):
+        if self.full_write:
+            what = "full write"
+        elif self.messages:
+            what = f"{len(self.messages)} param changes"
+        else:
+            what = "no changes"
+        return f"UpdatePlan({what}, {self.cost} bytes)"
+
+
+_NAME_START = DIRECT_OFFSETS["Name"]
+
+
+def _unmapped_offsets() -> Tuple[int, ...]:
+    """Byte offsets no field of the map covers (reserved/unknown bytes)."""
+    mapped = set(range(PACKED_SIZE))
+    mapped.update(DIRECT_OFFSETS.values())
+    mapped.update(range(_NAME_START, _NAME_START + PATCH_NAME_LENGTH))
+    return tuple(i for i in range(PATCH_SIZE_DECODED) if i not in mapped)
+
+
+_UNMAPPED = _unmapped_offsets()
+
+
+def _as_view(patch: PatchLike) -> PatchView:
+    if isinstance(patch, PatchView):
+        return patch
+    if isinstance(patch, Patch):
+        return PatchView(patch.to_bytes())
+    return PatchView(patch)
+
+
+def diff_patches(old: PatchLike, new: PatchLike) -> List[FieldChange]:
+    """
+    Compute the fields that differ between two patches.
+
+    Args:
+        old: Patch, PatchView or 128 bytes of decoded patch data
+        new: Patch, PatchView or 128 bytes of decoded patch data
+
+    Returns:
+        List of FieldChange, in patch layout order (global fields, then
+        modules, then name, pedal assignment and unmapped bytes)
+    """
+    a = _as_view(old)
+    b = _as_view(new)
+    buf_a = a._buf
+    buf_b = b._buf
+    if buf_a == buf_b:
+        return []
+
+    changes = []
+    for field in _FIELDS:
+        value_a = field.__get__(a)
+        value_b = field.__get__(b)
+        if value_a != value_b:
+            changes.append(FieldChange(field.label, value_a, value_b, field.address))
+
+    if a.name != b.name:
+        changes.append(FieldChange("name", a.name, b.name, None))
+    if a.pedal_func != b.pedal_func:
+        for i, (value_a, value_b) in enumerate(zip(a.pedal_func, b.pedal_func)):
+            if value_a != value_b:
+                changes.append(FieldChange(f"pedal_func{i}", value_a, value_b, None))
+
+    for offset in _UNMAPPED:
+        if buf_a[offset] != buf_b[offset]:
+            changes.append(FieldChange(f"raw[0x{offset:02X}]", buf_a[offset], buf_b[offset], None))
+
+    return changes
+
+
+def diff_banks(
+    old: Union[PatchBank, Iterable[PatchLike]],
+    new: Union[PatchBank, Iterable[PatchLike]],
+) -> Dict[int, List[FieldChange]]:
+    """
+    Compute the field differences of every slot of two banks.
+
+    Args:
+        old: PatchBank, or 100 patches (Patch, PatchView or raw bytes)
+        new: PatchBank, or 100 patches
+
+    Returns:
+        Dictionary of patch number -> changes, for changed slots only
+    """
+    old_slots = _bank_slots(old)
+    new_slots = _bank_slots(new)
+    if len(old_slots) != len(new_slots):
+        raise ValueError(f"Banks differ in size: {len(old_slots)} vs {len(new_slots)}")
+
+    result = {}
+    for patch_num, (a, b) in enumerate(zip(old_slots, new_slots)):
+        changes = diff_patches(a, b)
+        if changes:
+            result[patch_num] = changes
+    return result
+
+
+def _bank_slots(bank) -> list:
+    """Slots of a bank as something diff_patches() takes without decoding."""
+    if isinstance(bank, PatchBank):
+        return [bank.raw(patch_num) for patch_num in range(len(bank))]
+    return list(bank)
+
+
+def _is_live(change: FieldChange, amp_sel: int) -> bool:
+    """Whether a change can be sent as a 0x31 parameter change."""
+    if change.address is None:
+        return False
+    channel = _CHANNEL.get(change.field.partition(".")[0])
+    return channel is None or channel == amp_sel
+
+
+def _live_order(change: FieldChange) -> Tuple[int, int, int]:
+    """On/off and type before the parameters they affect, then by address."""
+    effect_id, param_id = change.address
+    return (0 if param_id <= 0x01 else 1, effect_id, param_id)
+
+
+def _retyped_params(changes: List[FieldChange], new: PatchView) -> List[FieldChange]:
+    """Unchanged parameters of the modules whose type changes, at their new values."""
+    retyped = {change.field.partition(".")[0] for change in changes
+               if change.field.endswith(".type")}
+    if not retyped:
+        return []
+    changed = {change.field for change in changes}
+    resend = []
+    for field in _FIELDS:
+        module, _, name = field.label.partition(".")
+        if (module in retyped and name not in ("on", "type")
+                and field.address is not None and field.label not in changed):
+            value = field.__get__(new)
+            resend.append(FieldChange(field.label, value, value, field.address))
+    return resend
+
+
+def plan_update(
+    old: PatchLike,
+    new: PatchLike,
+    max_params: Optional[int] = None,
+) -> UpdatePlan:
+    """
+    Plan the cheapest way to turn the active patch old into new.
+
+    Parameter changes are used when every difference has a 0x31 address
+    and they cost fewer bytes than a full write (up to 17 changes), or up
+    to max_params changes if given. On/off and type changes are sent
+    first. A new type reinterprets the parameters after it, so when a
+    module's type changes all of its parameters are sent, changed or not,
+    and they count towards the limit.
+
+    Args:
+        old: Patch currently loaded on the pedal
+        new: Target patch
+        max_params: Maximum number of parameter changes before falling
+                    back to a full write (default: by byte cost)
+
+    Returns:
+        UpdatePlan
+    """
+    changes = diff_patches(old, new)
+    data = _as_view(new).to_bytes()
+
+    if max_params is None:
+        max_params = (FULL_WRITE_COST - 1) // PARAM_CHANGE_COST
+
+    amp_sel = _as_view(new).amp_sel
+    live = all(_is_live(change, amp_sel) for change in changes)
+    if not live:
+        return UpdatePlan(changes, True, [], data)
+
+    sends = changes + _retyped_params(changes, _as_view(new))
+    if len(sends) > max_params:
+        return UpdatePlan(changes, True, [], data)
+
+    messages = [
+        build_param_change(*change.address, int(change.new))
+        for change in sorted(sends, key=_live_order)
+    ]
+    return UpdatePlan(changes, False, messages, data)
@@ -28,7 +28,16 @@ from .constants import (
 
 
 class EffectModule:
-    """Base class for effect modules."""
+    """
+    Base class for effect modules.
+
+    A module decoded by Patch.from_bytes() remembers the patch data and
+    the Patch attribute it came from (_source, _slot). Every setter clears
+    _source, which tells Patch.to_bytes() to re-serialize this module's
+    fields; unmodified modules are copied from the source as they are.
+    """
+
+    __slots__ = ("_on", "_type", "_source", "_slot")
 
     effect_id = None
     type_names = {}
@@ -36,7 +45,8 @@ class EffectModule:
     def __init__(self):
         self._on = False
         self._type = 0
-        self._params = {}
+        self._source = None
+        self._slot = None
 
     @property
     def on(self) -> bool:
@@ -46,6 +56,7 @@ class EffectModule:
     @on.setter
     def on(self, value: bool):
         self._on = bool(value)
+        self._source = None
 
     @property
     def type(self) -> int:
@@ -61,6 +72,7 @@ class EffectModule:
                 if not min_val <= value <= max_val:
                     raise ValueError(f"Type must be {min_val}-{max_val}, got {value}")
         self._type = value
+        self._source = None
 
     @property
     def type_name(self) -> str:
@@ -86,6 +98,8 @@ class EffectModule:
 class AmpModule(EffectModule):
     """Amplifier/Distortion module (44 types)."""
 
+    __slots__ = ("_gain", "_tone", "_level")
+
     effect_id = EFFECT_AMP
     type_names = AMP_TYPES
 
@@ -104,6 +118,7 @@ class AmpModule(EffectModule):
     def gain(self, value: int):
         self._validate_param(0x02, value)
         self._gain = value
+        self._source = None
 
     @property
     def tone(self) -> int:
@@ -114,6 +129,7 @@ class AmpModule(EffectModule):
     def tone(self, value: int):
         self._validate_param(0x03, value)
         self._tone = value
+        self._source = None
 
     @property
     def level(self) -> int:
@@ -124,6 +140,7 @@ class AmpModule(EffectModule):
     def level(self, value: int):
         self._validate_param(0x04, value)
         self._level = value
+        self._source = None
 
     def __repr__(self):
         status = "ON" if self._on else "OFF"
@@ -133,6 +150,8 @@ class AmpModule(EffectModule):
 class CmpModule(EffectModule):
     """Compressor module (3 types)."""
 
+    __slots__ = ("_sense", "_attack", "_tone", "_level")
+
     effect_id = EFFECT_CMP
     type_names = CMP_TYPES
 
@@ -152,6 +171,7 @@ class CmpModule(EffectModule):
     def sense(self, value: int):
         self._validate_param(0x02, value)
         self._sense = value
+        self._source = None
 
     @property
     def attack(self) -> int:
@@ -162,6 +182,7 @@ class CmpModule(EffectModule):
     def attack(self, value: int):
         self._validate_param(0x03, value)
         self._attack = value
+        self._source = None
 
     @property
     def tone(self) -> int:
@@ -172,6 +193,7 @@ class CmpModule(EffectModule):
     def tone(self, value: int):
         self._validate_param(0x04, value)
         self._tone = value
+        self._source = None
 
     @property
     def level(self) -> int:
@@ -182,11 +204,14 @@ class CmpModule(EffectModule):
     def level(self, value: int):
         self._validate_param(0x05, value)
         self._level = value
+        self._source = None
 
 
 class WahModule(EffectModule):
     """Wah/EFX1 module (17 types)."""
 
+    __slots__ = ("_position", "_sense", "_resonance", "_level")
+
     effect_id = EFFECT_WAH
     type_names = WAH_TYPES
 
@@ -206,6 +231,7 @@ class WahModule(EffectModule):
     def position(self, value: int):
         self._validate_param(0x02, value)
         self._position = value
+        self._source = None
 
     @property
     def sense(self) -> int:
@@ -216,6 +242,7 @@ class WahModule(EffectModule):
     def sense(self, value: int):
         self._validate_param(0x03, value)
         self._sense = value
+        self._source = None
 
     @property
     def resonance(self) -> int:
@@ -226,6 +253,7 @@ class WahModule(EffectModule):
     def resonance(self, value: int):
         self._validate_param(0x04, value)
         self._resonance = value
+        self._source = None
 
     @property
     def level(self) -> int:
@@ -236,11 +264,14 @@ class WahModule(EffectModule):
     def level(self, value: int):
         self._validate_param(0x05, value)
         self._level = value
+        self._source = None
 
 
 class ExtModule(EffectModule):
     """External Loop module."""
 
+    __slots__ = ("_send", "_return", "_dry")
+
     effect_id = EFFECT_EXT
 
     def __init__(self):
@@ -258,6 +289,7 @@ class ExtModule(EffectModule):
     def send(self, value: int):
         self._validate_param(0x02, value)
         self._send = value
+        self._source = None
 
     @property
     def return_(self) -> int:
@@ -268,6 +300,7 @@ class ExtModule(EffectModule):
     def return_(self, value: int):
         self._validate_param(0x03, value)
         self._return = value
+        self._source = None
 
     @property
     def dry(self) -> int:
@@ -278,6 +311,7 @@ class ExtModule(EffectModule):
     def dry(self, value: int):
         self._validate_param(0x04, value)
         self._dry = value
+        self._source = None
 
     def __repr__(self):
         status = "ON" if self._on else "OFF"
@@ -287,6 +321,8 @@ class ExtModule(EffectModule):
 class ZnrModule(EffectModule):
     """Noise Reduction module (3 types)."""
 
+    __slots__ = ("_threshold",)
+
     effect_id = EFFECT_ZNR
     type_names = ZNR_TYPES
 
@@ -303,6 +339,7 @@ class ZnrModule(EffectModule):
     def threshold(self, value: int):
         self._validate_param(0x02, value)
         self._threshold = value
+        self._source = None
 
     def __repr__(self):
         status = "ON" if self._on else "OFF"
@@ -312,6 +349,8 @@ class ZnrModule(EffectModule):
 class EqModule(EffectModule):
     """6-Band Equalizer module."""
 
+    __slots__ = ("_bands",)
+
     effect_id = EFFECT_EQ
 
     def __init__(self):
@@ -332,6 +371,7 @@ class EqModule(EffectModule):
             if not 0 <= v <= 31:
                 raise ValueError(f"Band {i+1} must be 0-31, got {v}")
         self._bands = list(values)
+        self._source = None
 
     def get_band(self, band: int) -> int:
         """Get a specific band value (1-6)."""
@@ -346,6 +386,7 @@ class EqModule(EffectModule):
         if not 0 <= value <= 31:
             raise ValueError("Value must be 0-31")
         self._bands[band - 1] = value
+        self._source = None
 
     def __repr__(self):
         status = "ON" if self._on else "OFF"
@@ -355,6 +396,8 @@ class EqModule(EffectModule):
 class CabModule(EffectModule):
     """Cabinet Simulator module."""
 
+    __slots__ = ("_depth", "_mic_type", "_mic_pos")
+
     effect_id = EFFECT_CAB
 
     DEPTH_NAMES = {0: "Small", 1: "Middle"}
@@ -375,6 +418,7 @@ class CabModule(EffectModule):
     def depth(self, value: int):
         self._validate_param(0x02, value)
         self._depth = value
+        self._source = None
 
     @property
     def depth_name(self) -> str:
@@ -390,6 +434,7 @@ class CabModule(EffectModule):
     def mic_type(self, value: int):
         self._validate_param(0x03, value)
         self._mic_type = value
+        self._source = None
 
     @property
     def mic_type_name(self) -> str:
@@ -405,6 +450,7 @@ class CabModule(EffectModule):
     def mic_pos(self, value: int):
         self._validate_param(0x04, value)
         self._mic_pos = value
+        self._source = None
 
     def __repr__(self):
         status = "ON" if self._on else "OFF"
@@ -414,6 +460,8 @@ class CabModule(EffectModule):
 class ModModule(EffectModule):
     """Modulation/EFX2 module (28 types)."""
 
+    __slots__ = ("_depth", "_rate", "_tone", "_mix")
+
     effect_id = EFFECT_MOD
     type_names = MOD_TYPES
 
@@ -433,6 +481,7 @@ class ModModule(EffectModule):
     def depth(self, value: int):
         self._validate_param(0x02, value)
         self._depth = value
+        self._source = None
 
     @property
     def rate(self) -> int:
@@ -443,6 +492,7 @@ class ModModule(EffectModule):
     def rate(self, value: int):
         self._validate_param(0x03, value)
         self._rate = value
+        self._source = None
 
     @property
     def tone(self) -> int:
@@ -453,6 +503,7 @@ class ModModule(EffectModule):
     def tone(self, value: int):
         self._validate_param(0x04, value)
         self._tone = value
+        self._source = None
 
     @property
     def mix(self) -> int:
@@ -463,11 +514,14 @@ class ModModule(EffectModule):
     def mix(self, value: int):
         self._validate_param(0x05, value)
         self._mix = value
+        self._source = None
 
 
 class DlyModule(EffectModule):
     """Delay module (7 types)."""
 
+    __slots__ = ("_time", "_feedback", "_hidamp", "_mix")
+
     effect_id = EFFECT_DLY
     type_names = DLY_TYPES
 
@@ -487,6 +541,7 @@ class DlyModule(EffectModule):
     def time(self, value: int):
         self._validate_param(0x02, value)
         self._time = value
+        self._source = None
 
     @property
     def feedback(self) -> int:
@@ -497,6 +552,7 @@ class DlyModule(EffectModule):
     def feedback(self, value: int):
         self._validate_param(0x03, value)
         self._feedback = value
+        self._source = None
 
     @property
     def hidamp(self) -> int:
@@ -507,6 +563,7 @@ class DlyModule(EffectModule):
     def hidamp(self, value: int):
         self._validate_param(0x04, value)
         self._hidamp = value
+        self._source = None
 
     @property
     def mix(self) -> int:
@@ -517,11 +574,14 @@ class DlyModule(EffectModule):
     def mix(self, value: int):
         self._validate_param(0x05, value)
         self._mix = value
+        self._source = None
 
 
 class RevModule(EffectModule):
     """Reverb module (15 types)."""
 
+    __slots__ = ("_decay", "_predelay", "_tone", "_mix")
+
     effect_id = EFFECT_REV
     type_names = REV_TYPES
 
@@ -541,6 +601,7 @@ class RevModule(EffectModule):
     def decay(self, value: int):
         self._validate_param(0x02, value)
         self._decay = value
+        self._source = None
 
     @property
     def predelay(self) -> int:
@@ -551,6 +612,7 @@ class RevModule(EffectModule):
     def predelay(self, value: int):
         self._validate_param(0x03, value)
         self._predelay = value
+        self._source = None
 
     @property
     def tone(self) -> int:
@@ -561,6 +623,7 @@ class RevModule(EffectModule):
     def tone(self, value: int):
         self._validate_param(0x04, value)
         self._tone = value
+        self._source = None
 
     @property
     def mix(self) -> int:
@@ -571,3 +634,4 @@ class RevModule(EffectModule):
     def mix(self, value: int):
         self._validate_param(0x05, value)
         self._mix = value
+        self._source = None
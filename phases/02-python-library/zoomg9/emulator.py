@@ -0,0 +1,297 @@
+"""
+Zoom G9.2tt Virtual Pedal
+
+An in-process software pedal implementing the Transport interface, for
+load tests and benchmarks without hardware:
+
+    pedal = VirtualG9(latency=0.005, jitter=0.002, drop_rate=0.01)
+    device = G9Device(transport=pedal)
+    device.connect()
+    patches = device.read_all()
+
+Behaviour follows the captures in phases/01-reverse-engineering:
+    - 0x11 read request      -> 0x21 read response from the in-memory bank
+    - 0x12 / 0x1F            -> enter / exit edit mode
+    - 0x28 write data        -> held until the slot confirm (31 pn 02 09 00)
+    - 0x31 in edit mode      -> slot select (pn 02 02 00) / confirm (pn 02 09 00)
+    - 0x31 otherwise         -> parameter change, stored in `params`
+    - 0x50 / 0x51            -> live mode on / off
+    - Identity request       -> Identity response (Zoom, G9.2tt, "1.08")
+    - Program Change         -> current patch
+
+Bulk write: after bulk_rx() (the user pressing BULK RX on the pedal), the
+next ENTER_EDIT makes the pedal request patches 0-99 one at a time (0x11),
+store each 0x21 answer, and finish with EXIT_EDIT (0x1F).
+
+Replies are delivered in order from a background thread after
+latency + uniform(0, jitter) seconds; each outgoing message is lost with
+probability drop_rate.
+"""
+
+import heapq
+import random
+import threading
+import time
+from typing import Callable, List, Optional
+
+from .constants import (
+    PATCH_COUNT,
+    PATCH_SIZE_DECODED,
+    CMD_READ_RESPONSE,
+    G9TT_MODEL_ID,
+    ZOOM_MANUFACTURER_ID,
+)
+from .messages import (
+    EditEnter,
+    EditExit,
+    IdentityRequest,
+    LiveDisable,
+    LiveEnable,
+    ParamChange,
+    ReadRequest,
+    WriteData,
+    decode_message,
+)
+from .patch import Patch
+from .protocol import (
+    EXIT_EDIT,
+    build_read_request,
+    build_read_response,
+    parse_read_response,
+    ChecksumError,
+)
+from .transport import Transport
+
+IDENTITY_RESPONSE = bytes(
+    [0xF0, 0x7E, 0x00, 0x06, 0x02, ZOOM_MANUFACTURER_ID, G9TT_MODEL_ID,
+     0x00, 0x00, 0x00]
+) + b"1.08" + b"\xF7"
+
+
+class VirtualG9(Transport):
+    """
+    Software G9.2tt holding a 100-patch bank in memory.
+
+    Attributes:
+        bank: List of 100 raw 128-byte patches (bytes)
+        params: Last value per (effect_id, param_id) from 0x31 changes
+        current_patch: Patch selected by Program Change
+        received: Messages received from the host
+        sent: Messages delivered to the host
+        dropped: Messages lost on purpose (drop_rate)
+    """
+
+    def __init__(
+        self,
+        bank: Optional[List[bytes]] = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        drop_rate: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        """
+        Args:
+            bank: Initial 100 raw patches (default: Patch() in every slot)
+            latency: Fixed delay in seconds before each reply
+            jitter: Extra random delay, uniform in [0, jitter] seconds
+            drop_rate: Probability (0-1) that an outgoing message is lost
+            seed: Seed for the random generator (reproducible runs)
+        """
+        if bank is None:
+            bank = [Patch().to_bytes()] * PATCH_COUNT
+        if len(bank) != PATCH_COUNT:
+            raise ValueError(f"Expected {PATCH_COUNT} patches, got {len(bank)}")
+        if not 0.0 <= drop_rate <= 1.0:
+            raise ValueError(f"drop_rate must be 0-1, got {drop_rate}")
+
+        self.bank = [bytes(p) for p in bank]
+        self.params = {}
+        self.current_patch = 0
+        self.latency = latency
+        self.jitter = jitter
+        self.drop_rate = drop_rate
+        self.received = 0
+        self.sent = 0
+        self.dropped = 0
+
+        self.in_edit_mode = False
+        self.in_live_mode = False
+        self._bulk_armed = False
+        self._bulk_next = None  # Patch requested during bulk receive
+        self._selected = None  # Slot selected for a 0x28 write
+        self._pending = None  # Decoded 0x28 data awaiting confirm
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._outbox = []  # heap of (due, seq, message)
+        self._seq = 0
+        self._last_due = 0.0
+        self._callback = None
+        self._thread = None
+
+    # --- Transport interface ---
+
+    def open(self, callback: Callable[[bytes], None]):
+        """Start the delivery thread."""
+        with self._lock:
+            if self._thread is not None:
+                raise RuntimeError("VirtualG9 is already open")
+            self._callback = callback
+            self._outbox = []
+            self._thread = threading.Thread(
+                target=self._deliver, name="VirtualG9", daemon=True
+            )
+        self._thread.start()
+
+    def close(self):
+        """Stop the delivery thread; pending replies are discarded."""
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+            self._callback = None
+            self._wakeup.notify()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def send(self, data: bytes):
+        """Handle one message from the host."""
+        msg = bytes(data)
+        with self._lock:
+            self.received += 1
+            if msg[0] == 0xF0:
+                self._handle_sysex(msg)
+            elif msg[0] & 0xF0 == 0xC0 and len(msg) > 1:
+                self.current_patch = msg[1]
+
+    # --- Pedal controls ---
+
+    def bulk_rx(self):
+        """Arm bulk receive (BULK RX on the pedal): the next ENTER_EDIT starts it."""
+        with self._lock:
+            self._bulk_armed = True
+
+    def set_patch(self, patch_num: int, patch: Patch):
+        """Store a patch in the bank (as if edited on the pedal)."""
+        with self._lock:
+            self.bank[patch_num] = patch.to_bytes()
+
+    def get_patch(self, patch_num: int) -> Patch:
+        """Return a patch from the bank."""
+        return Patch.from_bytes(self.bank[patch_num])
+
+    # --- Internals ---
+
+    def _handle_sysex(self, msg: bytes):
+        """Update state and queue replies (called with the lock held)."""
+        message = decode_message(msg)
+        if message is None:
+            return
+
+        if isinstance(message, IdentityRequest):
+            self._reply(IDENTITY_RESPONSE)
+
+        elif isinstance(message, ReadRequest):
+            patch_num = message.patch_num
+            if patch_num < PATCH_COUNT:
+                self._reply(build_read_response(patch_num, self.bank[patch_num]))
+
+        elif isinstance(message, EditEnter):
+            self.in_edit_mode = True
+            if self._bulk_armed:
+                self._bulk_armed = False
+                self._bulk_next = 0
+                self._reply(build_read_request(0))
+
+        elif isinstance(message, EditExit):
+            self.in_edit_mode = False
+            self._selected = None
+            self._pending = None
+
+        elif message.command == CMD_READ_RESPONSE and self._bulk_next is not None:
+            # Malformed responses too: the pedal requests the patch again
+            self._bulk_receive(msg)
+
+        elif isinstance(message, WriteData) and self.in_edit_mode:
+            self._pending = message.decode()[:PATCH_SIZE_DECODED]
+
+        elif isinstance(message, ParamChange):
+            first, second, value = message.effect_id, message.param_id, message.value
+            if self.in_edit_mode and second == 0x02 and value in (0x02, 0x09):
+                self._slot_command(first, value)
+            else:
+                self.params[(first, second)] = value
+
+        elif isinstance(message, LiveEnable):
+            self.in_live_mode = True
+
+        elif isinstance(message, LiveDisable):
+            self.in_live_mode = False
+
+    def _slot_command(self, patch_num: int, mode: int):
+        """Handle slot select (0x02) and write confirm (0x09)."""
+        if patch_num >= PATCH_COUNT:
+            return
+        if mode == 0x02:
+            self._selected = patch_num
+            self._pending = None
+        elif self._selected == patch_num and self._pending is not None:
+            self.bank[patch_num] = self._pending
+            self._pending = None
+
+    def _bulk_receive(self, msg: bytes):
+        """Store one patch of a bulk write and request the next."""
+        try:
+            patch_num, data = parse_read_response(msg)
+        except (ChecksumError, ValueError):
+            patch_num, data = None, None
+
+        if patch_num == self._bulk_next:
+            self.bank[patch_num] = data
+            self._bulk_next += 1
+
+        if self._bulk_next < PATCH_COUNT:
+            self._reply(build_read_request(self._bulk_next))
+        else:
+            self._bulk_next = None
+            self.in_edit_mode = False
+            self._reply(EXIT_EDIT)
+
+    def _reply(self, msg: bytes):
+        """Queue a message for the host (called with the lock held)."""
+        if self._callback is None:
+            return
+        if self.drop_rate and self._random.random() < self.drop_rate:
+            self.dropped += 1
+            return
+
+        delay = self.latency
+        if self.jitter:
+            delay += self._random.uniform(0.0, self.jitter)
+
+        # Serial link: replies never overtake each other
+        due = max(time.monotonic() + delay, self._last_due)
+        self._last_due = due
+        self._seq += 1
+        heapq.heappush(self._outbox, (due, self._seq, msg))
+        self._wakeup.notify()
+
+    def _deliver(self):
+        """Delivery thread: hand due messages to the callback."""
+        thread = threading.current_thread()
+        while True:
+            with self._lock:
+                while True:
+                    if self._thread is not thread:
+                        return
+                    if self._outbox:
+                        wait = self._outbox[0][0] - time.monotonic()
+                        if wait <= 0:
+                            break
+                        self._wakeup.wait(wait)
+                    else:
+                        self._wakeup.wait()
+                _, _, msg = heapq.heappop(self._outbox)
+                callback = self._callback
+                self.sent += 1
+            callback(msg)
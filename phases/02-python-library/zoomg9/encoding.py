@@ -4,7 +4,19 @@ Zoom G9.2tt Data Encoding/Decoding
 Handles nibble encoding (read responses) and 7-bit encoding (write data).
 """
 
-from .constants import BIT_TBL
+import zlib
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .constants import (
+    BIT_TBL,
+    PATCH_SIZE_DECODED,
+    PATCH_SIZE_NIBBLE,
+    PATCH_SIZE_7BIT,
+)
 
 
 def decode_nibbles(data: bytes) -> bytes:
@@ -80,8 +92,10 @@ def decode_7bit(data: bytes) -> bytes:
     result = bytearray()
 
     for i in range(0, 147, 8):
-        chunk = data[i:i + 7]
-        high_bits = data[i + 7] if i + 7 < 147 else 0
+        # The last group is short: 2 data bytes followed by their high bits
+        group = data[i:i + 8]
+        chunk = group[:-1]
+        high_bits = group[-1]
 
         for j, byte in enumerate(chunk):
             if high_bits & (1 << j):
@@ -142,98 +156,304 @@ def encode_7bit(data: bytes) -> bytes:
     return bytes(result[:147])
 
 
-def unpack_bits(packed_data: bytes) -> list:
+# Translation tables for the pure-Python batch nibble codecs
+_NIBBLE_HIGH = bytes((b >> 4) & 0x0F for b in range(256))
+_NIBBLE_LOW = bytes(b & 0x0F for b in range(256))
+_NIBBLE_SHL4 = bytes((b & 0x0F) << 4 for b in range(256))
+
+# 7-bit layout: 18 full groups (7 data + 1 high-bits byte) and a short tail
+# group of 2 data bytes + 1 high-bits byte (18 * 8 + 3 = 147)
+_7BIT_GROUPS = PATCH_SIZE_DECODED // 7
+_7BIT_FULL = _7BIT_GROUPS * 7
+_7BIT_TAIL = PATCH_SIZE_DECODED - _7BIT_FULL
+
+
+def _as_uint8(data, size: int):
+    """View a batch buffer as an (N, size) uint8 NumPy array without copying."""
+    if isinstance(data, np.ndarray):
+        arr = np.ascontiguousarray(data, dtype=np.uint8).reshape(-1)
+    else:
+        arr = np.frombuffer(data, dtype=np.uint8)
+    return arr.reshape(-1, size)
+
+
+def _check_batch(data, size: int, what: str) -> int:
+    """Validate a batch buffer length and return the number of patches."""
+    length = data.size if np is not None and isinstance(data, np.ndarray) else len(data)
+    if length % size:
+        raise ValueError(f"Expected a multiple of {size} {what}, got {length}")
+    return length // size
+
+
+def decode_nibbles_batch(data) -> bytes:
     """
-    Unpack bit-packed values from patch data using BIT_TBL.
+    Decode N nibble-encoded patches at once.
 
-    The first ~36 bytes of the 128-byte patch are bit-packed according
-    to the widths defined in BIT_TBL. This function extracts the values.
+    Batch version of decode_nibbles() for whole banks. Uses NumPy when
+    available, otherwise byte translation tables.
 
     Args:
-        packed_data: 128 bytes of decoded patch data
+        data: N * 256 bytes of nibble-encoded data (bytes, memoryview
+              or NumPy uint8 array)
 
     Returns:
-        12x8 matrix of extracted values
+        N * 128 bytes of decoded data
     """
-    matrix = [[0] * 8 for _ in range(12)]
-    bit_pos = 0
+    _check_batch(data, PATCH_SIZE_NIBBLE, "nibbles")
 
-    for row in range(12):
-        for col in range(8):
-            num_bits = BIT_TBL[row][col]
-            if num_bits == 0:
-                continue
+    if np is not None:
+        pairs = _as_uint8(data, 2)
+        return (((pairs[:, 0] & 0x0F) << 4) | (pairs[:, 1] & 0x0F)).astype(np.uint8).tobytes()
 
-            byte_idx = bit_pos // 8
-            bit_offset = bit_pos % 8
+    # High and low nibbles never overlap, so OR-ing both halves as big
+    # integers combines every byte in one C-level pass
+    data = bytes(data)
+    high = int.from_bytes(data[0::2].translate(_NIBBLE_SHL4), "big")
+    low = int.from_bytes(data[1::2].translate(_NIBBLE_LOW), "big")
+    return (high | low).to_bytes(len(data) // 2, "big")
 
-            value = 0
-            bits_read = 0
 
-            while bits_read < num_bits:
-                if byte_idx >= len(packed_data):
-                    break
+def encode_nibbles_batch(data) -> bytes:
+    """
+    Encode N patches of raw bytes to nibble format at once.
 
-                byte_val = packed_data[byte_idx]
-                bits_avail = 8 - bit_offset
-                bits_to_read = min(bits_avail, num_bits - bits_read)
+    Batch version of encode_nibbles() for whole banks.
 
-                mask = ((1 << bits_to_read) - 1) << bit_offset
-                extracted = (byte_val & mask) >> bit_offset
+    Args:
+        data: N * 128 bytes of raw data (bytes, memoryview or NumPy uint8 array)
 
-                value |= extracted << bits_read
-                bits_read += bits_to_read
+    Returns:
+        N * 256 bytes of nibble-encoded data
+    """
+    count = _check_batch(data, PATCH_SIZE_DECODED, "bytes")
 
-                byte_idx += 1
-                bit_offset = 0
+    if np is not None:
+        raw = _as_uint8(data, PATCH_SIZE_DECODED).ravel()
+        out = np.empty((raw.size, 2), dtype=np.uint8)
+        out[:, 0] = raw >> 4
+        out[:, 1] = raw & 0x0F
+        return out.tobytes()
 
-            matrix[row][col] = value
-            bit_pos += num_bits
+    data = bytes(data)
+    out = bytearray(count * PATCH_SIZE_NIBBLE)
+    out[0::2] = data.translate(_NIBBLE_HIGH)
+    out[1::2] = data.translate(_NIBBLE_LOW)
+    return bytes(out)
 
-    return matrix
 
+def decode_7bit_batch(data) -> bytes:
+    """
+    Decode N patches of 7-bit MIDI-safe data at once.
 
-def pack_bits(matrix: list) -> bytes:
+    Batch version of decode_7bit() for whole banks. With NumPy, the 18 full
+    groups of each patch are decoded as an (N, 18, 8) array and the short
+    tail group separately.
+
+    Args:
+        data: N * 147 bytes of 7-bit encoded data (bytes, memoryview or
+              NumPy uint8 array)
+
+    Returns:
+        N * 128 bytes of decoded data
     """
-    Pack values back into bit-packed format using BIT_TBL.
+    count = _check_batch(data, PATCH_SIZE_7BIT, "bytes")
+
+    if np is None:
+        view = memoryview(bytes(data))
+        return b"".join(
+            decode_7bit(view[i:i + PATCH_SIZE_7BIT])
+            for i in range(0, count * PATCH_SIZE_7BIT, PATCH_SIZE_7BIT)
+        )
+
+    enc = _as_uint8(data, PATCH_SIZE_7BIT)
+    out = np.empty((count, PATCH_SIZE_DECODED), dtype=np.uint8)
+
+    groups = enc[:, :_7BIT_GROUPS * 8].reshape(count, _7BIT_GROUPS, 8)
+    bits = np.arange(7, dtype=np.uint8)
+    high = ((groups[:, :, 7:8] >> bits) & 1) << 7
+    out[:, :_7BIT_FULL] = ((groups[:, :, :7] & 0x7F) | high).reshape(count, _7BIT_FULL)
+
+    tail = enc[:, _7BIT_GROUPS * 8:]
+    tail_bits = np.arange(_7BIT_TAIL, dtype=np.uint8)
+    tail_high = ((tail[:, _7BIT_TAIL:] >> tail_bits) & 1) << 7
+    out[:, _7BIT_FULL:] = (tail[:, :_7BIT_TAIL] & 0x7F) | tail_high
+
+    return out.tobytes()
+
+
+def encode_7bit_batch(data) -> bytes:
+    """
+    Encode N patches of raw bytes to 7-bit MIDI-safe format at once.
+
+    Batch version of encode_7bit() for whole banks.
 
     Args:
-        matrix: 12x8 matrix of values to pack
+        data: N * 128 bytes of raw data (bytes, memoryview or NumPy uint8 array)
 
     Returns:
-        Bit-packed bytes (first ~36 bytes of patch data)
+        N * 147 bytes of 7-bit encoded data
+    """
+    count = _check_batch(data, PATCH_SIZE_DECODED, "bytes")
+
+    if np is None:
+        view = memoryview(bytes(data))
+        return b"".join(
+            encode_7bit(view[i:i + PATCH_SIZE_DECODED])
+            for i in range(0, count * PATCH_SIZE_DECODED, PATCH_SIZE_DECODED)
+        )
+
+    raw = _as_uint8(data, PATCH_SIZE_DECODED)
+    out = np.empty((count, PATCH_SIZE_7BIT), dtype=np.uint8)
+
+    chunks = raw[:, :_7BIT_FULL].reshape(count, _7BIT_GROUPS, 7)
+    groups = np.empty((count, _7BIT_GROUPS, 8), dtype=np.uint8)
+    weights = (1 << np.arange(7)).astype(np.uint8)
+    groups[:, :, :7] = chunks & 0x7F
+    groups[:, :, 7] = ((chunks >> 7) * weights).sum(axis=2, dtype=np.uint8)
+    out[:, :_7BIT_GROUPS * 8] = groups.reshape(count, _7BIT_GROUPS * 8)
+
+    tail = raw[:, _7BIT_FULL:]
+    out[:, _7BIT_GROUPS * 8:_7BIT_GROUPS * 8 + _7BIT_TAIL] = tail & 0x7F
+    out[:, -1] = ((tail >> 7) * weights[:_7BIT_TAIL]).sum(axis=1, dtype=np.uint8)
+
+    return out.tobytes()
+
+
+def _compile_bit_layout(table: list) -> tuple:
     """
-    total_bits = sum(sum(row) for row in BIT_TBL)
-    total_bytes = (total_bits + 7) // 8
+    Compile BIT_TBL into a flat list of field extraction plans.
 
-    packed = bytearray(total_bytes)
+    Fields are laid out LSB-first, one after another, in row/column order.
+    Each plan entry is (row, col, byte_offset, shift, mask, spill) where
+    shift is the bit offset inside byte_offset and spill is the number of
+    extra bytes the field crosses into.
+
+    Args:
+        table: 12x8 bit-width table
+
+    Returns:
+        Tuple of (plan entries, packed size in bytes)
+    """
+    plan = []
     bit_pos = 0
 
-    for row in range(12):
-        for col in range(8):
-            num_bits = BIT_TBL[row][col]
+    for row in range(len(table)):
+        for col in range(len(table[row])):
+            num_bits = table[row][col]
             if num_bits == 0:
                 continue
 
-            value = matrix[row][col]
-            bits_written = 0
+            byte_offset = bit_pos // 8
+            shift = bit_pos % 8
+            mask = (1 << num_bits) - 1
+            spill = (shift + num_bits - 1) // 8
 
-            while bits_written < num_bits:
-                byte_idx = bit_pos // 8
-                bit_offset = bit_pos % 8
+            plan.append((row, col, byte_offset, shift, mask, spill))
+            bit_pos += num_bits
 
-                bits_avail = 8 - bit_offset
-                bits_to_write = min(bits_avail, num_bits - bits_written)
+    return tuple(plan), (bit_pos + 7) // 8
 
-                mask = (1 << bits_to_write) - 1
-                bits_val = (value >> bits_written) & mask
 
-                packed[byte_idx] |= bits_val << bit_offset
+# Compiled once at import: (row, col, byte_offset, shift, mask, spill) per field
+BIT_FIELDS, PACKED_SIZE = _compile_bit_layout(BIT_TBL)
 
-                bits_written += bits_to_write
-                bit_pos += bits_to_write
+# Absolute bit shift of each field within the packed area (little-endian int)
+_FIELD_SHIFTS = tuple(f[2] * 8 + f[3] for f in BIT_FIELDS)
+_FIELD_MASKS = tuple(f[4] for f in BIT_FIELDS)
+_FIELD_PLAN = tuple(zip(_FIELD_SHIFTS, _FIELD_MASKS))
 
-    return bytes(packed)
+
+def unpack_fields(packed_data: bytes) -> list:
+    """
+    Unpack all bit-packed fields as a flat list in BIT_TBL order.
+
+    The packed area is read as a single little-endian integer and every
+    field is extracted with one precomputed shift and mask.
+
+    Args:
+        packed_data: Decoded patch data (at least the packed area)
+
+    Returns:
+        List of field values, one per non-zero BIT_TBL cell
+    """
+    bits = int.from_bytes(packed_data[:PACKED_SIZE], "little")
+    return [(bits >> shift) & mask for shift, mask in _FIELD_PLAN]
+
+
+def pack_fields(values) -> bytes:
+    """
+    Pack a flat sequence of field values (BIT_TBL order) into bytes.
+
+    Values wider than their field are truncated to the field width.
+
+    Args:
+        values: One value per non-zero BIT_TBL cell
+
+    Returns:
+        Bit-packed bytes (PACKED_SIZE bytes)
+    """
+    if len(values) != len(_FIELD_PLAN):
+        raise ValueError(f"Expected {len(_FIELD_PLAN)} field values, got {len(values)}")
+
+    bits = 0
+    for (shift, mask), value in zip(_FIELD_PLAN, values):
+        bits |= (value & mask) << shift
+    return bits.to_bytes(PACKED_SIZE, "little")
+
+
+def update_fields(data: bytearray, first: int, values):
+    """
+    Overwrite a run of consecutive bit-packed fields in place.
+
+    Only the bits of those fields change; other fields and any unused bits
+    of the packed area are kept.
+
+    Args:
+        data: Decoded patch data (bytearray, at least the packed area)
+        first: Index of the first field (BIT_TBL order, as in unpack_fields())
+        values: New values of fields first, first + 1, ...; None keeps a field
+    """
+    plan = _FIELD_PLAN[first:first + len(values)]
+    if len(plan) != len(values):
+        raise ValueError(f"Fields {first}-{first + len(values) - 1} out of range")
+
+    bits = int.from_bytes(data[:PACKED_SIZE], "little")
+    for (shift, mask), value in zip(plan, values):
+        if value is not None:
+            bits = bits & ~(mask << shift) | (value & mask) << shift
+    data[:PACKED_SIZE] = bits.to_bytes(PACKED_SIZE, "little")
+
+
+def unpack_bits(packed_data: bytes) -> list:
+    """
+    Unpack bit-packed values from patch data using BIT_TBL.
+
+    The first ~36 bytes of the 128-byte patch are bit-packed according
+    to the widths defined in BIT_TBL. This function extracts the values.
+
+    Args:
+        packed_data: 128 bytes of decoded patch data
+
+    Returns:
+        12x8 matrix of extracted values
+    """
+    matrix = [[0] * 8 for _ in range(12)]
+    for (row, col, _, _, _, _), value in zip(BIT_FIELDS, unpack_fields(packed_data)):
+        matrix[row][col] = value
+    return matrix
+
+
+def pack_bits(matrix: list) -> bytes:
+    """
+    Pack values back into bit-packed format using BIT_TBL.
+
+    Args:
+        matrix: 12x8 matrix of values to pack
+
+    Returns:
+        Bit-packed bytes (first ~36 bytes of patch data)
+    """
+    return pack_fields([matrix[row][col] for row, col, _, _, _, _ in BIT_FIELDS])
 
 
 def calculate_checksum(data: bytes) -> bytes:
@@ -259,27 +479,18 @@ def calculate_checksum(data: bytes) -> bytes:
     return _encode_crc_7bit(crc)
 
 
-# CRC-32 implementation (standard polynomial 0xEDB88320)
-_CRC32_TABLE = None
-
+def verify_checksum(data: bytes, checksum: bytes) -> bool:
+    """
+    Check a 5-byte READ_RESP checksum against 128 bytes of patch data.
 
-def _init_crc32_table():
-    """Initialize the CRC-32 lookup table."""
-    global _CRC32_TABLE
-    if _CRC32_TABLE is not None:
-        return
+    Args:
+        data: 128 bytes of decoded patch data
+        checksum: 5 bytes of 7-bit encoded CRC-32
 
-    poly = 0xEDB88320
-    table = []
-    for i in range(256):
-        crc = i
-        for _ in range(8):
-            if crc & 1:
-                crc = (crc >> 1) ^ poly
-            else:
-                crc >>= 1
-        table.append(crc)
-    _CRC32_TABLE = table
+    Returns:
+        True if the checksum matches
+    """
+    return _decode_crc_7bit(checksum) == _calculate_crc32(data)
 
 
 def _calculate_crc32(data: bytes, init: int = 0xFFFFFFFF) -> int:
@@ -289,6 +500,10 @@ def _calculate_crc32(data: bytes, init: int = 0xFFFFFFFF) -> int:
     Uses standard CRC-32 algorithm with polynomial 0xEDB88320
     and initial value 0xFFFFFFFF (as in G9ED.exe).
 
+    G9ED does not apply the final XOR that zlib does, so the zlib result
+    is XOR-ed back (and the initial value converted to zlib's convention).
+    Verified against the captured READ_RESP checksums.
+
     Args:
         data: Bytes to calculate CRC over
         init: Initial CRC value (default 0xFFFFFFFF)
@@ -296,11 +511,7 @@ def _calculate_crc32(data: bytes, init: int = 0xFFFFFFFF) -> int:
     Returns:
         32-bit CRC value
     """
-    _init_crc32_table()
-    crc = init
-    for byte in data:
-        crc = _CRC32_TABLE[(crc ^ byte) & 0xFF] ^ ((crc >> 8) & 0x00FFFFFF)
-    return crc
+    return zlib.crc32(data, init ^ 0xFFFFFFFF) ^ 0xFFFFFFFF
 
 
 def _encode_crc_7bit(crc: int) -> bytes:
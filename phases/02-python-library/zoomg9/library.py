@@ -0,0 +1,332 @@
+"""
+Zoom G9.2tt SQLite Patch Library
+
+PatchLibrary keeps patches in a SQLite database (standard library sqlite3):
+the raw 128-byte blob of each patch, plus one column per field of the
+BIT_TBL / DIRECT_OFFSETS map, decoded once at insert time. Names, levels,
+tempos and every module's on/off and type are indexed, so searches over
+tens of thousands of patches are index lookups instead of decoding every
+patch:
+
+    lib = PatchLibrary("patches.db")
+    lib.import_dir("captures/")                    # every .syx below it
+    fender = [t for t, name in AMP_TYPES.items() if "Fender" in name]
+    for entry in lib.find(amp_type=fender, delay_on=True):
+        print(entry.name, entry.source)
+
+Column names are the PatchView field names with "_" for "." ("amp_a_gain",
+"delay_time"). "amp_*", "znr_*" and "eq_*" hold the channel selected by
+amp_sel, like Patch.amp. Patches are deduplicated by content key; the first
+source a patch was imported from is kept.
+"""
+
+import sqlite3
+from pathlib import Path
+from typing import Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from .constants import PATCH_SIZE_DECODED
+from .patch import Patch
+from .protocol import iter_patches
+from .store import patch_key
+from .view import PatchView, _FIELDS, _MODULE_VIEWS
+
+# Selected-channel columns: prefix -> (channel A module, channel B module)
+_SELECTED = {"amp": ("amp_a", "amp_b"), "znr": ("znr_a", "znr_b"), "eq": ("eq_a", "eq_b")}
+
+
+def _build_columns():
+    """Field columns, and for each selected-channel column its A/B sources."""
+    fields = [(field.label.replace(".", "_"), field) for field in _FIELDS]
+    index = {label: i for i, (label, _) in enumerate(fields)}
+    selected = []
+    for prefix, (a, b) in _SELECTED.items():
+        for attr in _MODULE_VIEWS[a].fields:
+            selected.append((f"{prefix}_{attr}", index[f"{a}_{attr}"], index[f"{b}_{attr}"]))
+    return tuple(fields), tuple(selected)
+
+
+_FIELD_COLUMNS, _SELECTED_COLUMNS = _build_columns()
+
+COLUMNS = ("name",) + tuple(c for c, _ in _FIELD_COLUMNS) + tuple(c for c, _, _ in _SELECTED_COLUMNS)
+
+INDEXED = ("name", "level", "tempo") + tuple(
+    column for column in COLUMNS[1:] if column.endswith(("_on", "_type"))
+)
+
+_SCHEMA = [
+    "CREATE TABLE IF NOT EXISTS patches ("
+    "id INTEGER PRIMARY KEY, "
+    "key TEXT NOT NULL UNIQUE, "
+    "data BLOB NOT NULL, "
+    "source TEXT, "
+    "slot INTEGER, "
+    "name TEXT NOT NULL, "
+    + ", ".join(f"{column} INTEGER NOT NULL" for column in COLUMNS[1:])
+    + ")"
+] + [f"CREATE INDEX IF NOT EXISTS idx_{column} ON patches ({column})" for column in INDEXED]
+
+_INSERT = (
+    f"INSERT OR IGNORE INTO patches (key, data, source, slot, {', '.join(COLUMNS)}) "
+    f"VALUES ({', '.join('?' * (len(COLUMNS) + 4))})"
+)
+
+
+class LibraryEntry(NamedTuple):
+    """One search result."""
+
+    id: int
+    name: str
+    source: Optional[str]  # File the patch was imported from
+    slot: Optional[int]    # Patch number in that file / on the pedal
+
+
+class PatchLibrary:
+    """
+    Searchable patch database.
+
+    Example usage:
+        with PatchLibrary("patches.db") as lib:
+            lib.add_bank(device.read_bank(), source="pedal-1")
+            hits = lib.find(amp_type=[0, 5], delay_on=True, tempo=120)
+            patch = lib.get(hits[0].id)
+            lib.find("reverb_mix > ? AND name LIKE ?", (50, "Lead%"))
+    """
+
+    def __init__(self, path: Union[str, Path] = ":memory:"):
+        """
+        Open (or create) a library.
+
+        Args:
+            path: Database file, or ":memory:" for a temporary library
+        """
+        self._conn = sqlite3.connect(str(path))
+        with self._conn:
+            for statement in _SCHEMA:
+                self._conn.execute(statement)
+
+    def close(self):
+        """Close the database."""
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM patches").fetchone()[0]
+
+    @staticmethod
+    def row(data: bytes, source: Optional[str] = None, slot: Optional[int] = None) -> tuple:
+        """
+        Decode one patch into an insert row for insert_rows().
+
+        Needs no connection, so rows can be built in other processes.
+
+        Args:
+            data: 128 bytes of decoded patch data
+            source: Where the patch came from
+            slot: Patch number
+
+        Returns:
+            Row tuple (key, data, source, slot, name, field columns...)
+
+        Raises:
+            ValueError: If data is not 128 bytes
+        """
+        if len(data) != PATCH_SIZE_DECODED:
+            raise ValueError(f"Expected {PATCH_SIZE_DECODED} bytes, got {len(data)}")
+        view = PatchView(data)
+        values = [int(field.__get__(view)) for _, field in _FIELD_COLUMNS]
+        amp_sel = view.amp_sel
+        selected = [values[b if amp_sel else a] for _, a, b in _SELECTED_COLUMNS]
+        return (patch_key(data), data, source, slot, view.name, *values, *selected)
+
+    def insert_rows(self, rows: Iterable[tuple]):
+        """
+        Insert rows from row() in one transaction (existing patches are skipped).
+
+        Args:
+            rows: Row tuples
+        """
+        with self._conn:
+            self._conn.executemany(_INSERT, rows)
+
+    def add(
+        self,
+        patch: Union[Patch, PatchView, bytes],
+        source: Optional[str] = None,
+        slot: Optional[int] = None,
+    ) -> int:
+        """
+        Add one patch (a no-op if the same bytes are already stored).
+
+        Args:
+            patch: Patch, PatchView or 128 bytes of decoded patch data
+            source: Where the patch came from (file, pedal, ...)
+            slot: Patch number
+
+        Returns:
+            Row id of the patch
+        """
+        data = patch.to_bytes() if isinstance(patch, (Patch, PatchView)) else bytes(patch)
+        row = self.row(data, source, slot)
+        with self._conn:
+            self._conn.execute(_INSERT, row)
+        return self._conn.execute("SELECT id FROM patches WHERE key = ?", (row[0],)).fetchone()[0]
+
+    def add_many(
+        self,
+        patches: Iterable[Tuple[Optional[int], bytes]],
+        source: Optional[str] = None,
+        batch_size: int = 1000,
+    ) -> int:
+        """
+        Add (slot, data) pairs, batch_size rows per transaction.
+
+        Args:
+            patches: Iterable of (slot, 128 bytes), e.g. from iter_patches()
+            source: Source recorded for every patch
+            batch_size: Rows per transaction
+
+        Returns:
+            Number of new patches
+        """
+        before = len(self)
+        batch = []
+        for slot, data in patches:
+            batch.append(self.row(bytes(data), source, slot))
+            if len(batch) >= batch_size:
+                self.insert_rows(batch)
+                batch = []
+        if batch:
+            self.insert_rows(batch)
+        return len(self) - before
+
+    def add_bank(self, bank, source: Optional[str] = None) -> int:
+        """
+        Add the 100 patches of a PatchBank (slot = patch number).
+
+        Returns:
+            Number of new patches
+        """
+        return self.add_many(enumerate(bank.to_list()), source)
+
+    def import_syx(self, path: Union[str, Path], batch_size: int = 1000) -> int:
+        """
+        Import every patch of a .syx file (0x21 read responses).
+
+        Args:
+            path: .syx file (bulk dump or single-message capture)
+            batch_size: Rows per transaction
+
+        Returns:
+            Number of new patches
+        """
+        with open(path, "rb") as f:
+            return self.add_many(iter_patches(f), str(path), batch_size)
+
+    def import_dir(
+        self,
+        directory: Union[str, Path],
+        pattern: str = "*.syx",
+        batch_size: int = 1000,
+    ) -> int:
+        """
+        Import every .syx file below a directory (e.g. a capture directory).
+
+        Args:
+            directory: Directory searched recursively
+            pattern: File name pattern
+            batch_size: Rows per transaction
+
+        Returns:
+            Number of new patches
+        """
+        return sum(
+            self.import_syx(path, batch_size)
+            for path in sorted(Path(directory).rglob(pattern))
+        )
+
+    def find(
+        self,
+        where: Optional[str] = None,
+        params: Iterable = (),
+        limit: Optional[int] = None,
+        **equals,
+    ) -> List[LibraryEntry]:
+        """
+        Search the library.
+
+        Keyword arguments match a column exactly (a list or tuple matches
+        any of its values); where adds a raw SQL condition with ?
+        placeholders. All conditions must hold.
+
+        Args:
+            where: SQL condition, e.g. "delay_time > ?"
+            params: Parameters for where
+            limit: Maximum number of results
+            **equals: Column filters, e.g. amp_type=[0, 5], delay_on=True
+
+        Returns:
+            Matching entries, by id
+
+        Raises:
+            ValueError: If a keyword is not a column
+        """
+        clause, values = self._where(where, params, equals)
+        sql = f"SELECT id, name, source, slot FROM patches{clause} ORDER BY id"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        return [LibraryEntry(*row) for row in self._conn.execute(sql, values)]
+
+    def count(self, where: Optional[str] = None, params: Iterable = (), **equals) -> int:
+        """Number of patches matching the same filters as find()."""
+        clause, values = self._where(where, params, equals)
+        return self._conn.execute(f"SELECT COUNT(*) FROM patches{clause}", values).fetchone()[0]
+
+    @staticmethod
+    def _where(where, params, equals) -> Tuple[str, list]:
+        conditions = []
+        values = []
+        for column, value in equals.items():
+            if column not in COLUMNS:
+                raise ValueError(f"Unknown column: {column}")
+            if isinstance(value, (list, tuple, set, frozenset)):
+                value = list(value)
+                conditions.append(f"{column} IN ({', '.join('?' * len(value))})")
+                values.extend(int(v) if isinstance(v, bool) else v for v in value)
+            else:
+                conditions.append(f"{column} = ?")
+                values.append(int(value) if isinstance(value, bool) else value)
+        if where:
+            conditions.append(f"({where})")
+            values.extend(params)
+        if not conditions:
+            return "", values
+        return " WHERE " + " AND ".join(conditions), values
+
+    def raw(self, patch_id: int) -> bytes:
+        """
+        Return the 128 bytes of a patch.
+
+        Raises:
+            KeyError: If there is no patch with that id
+        """
+        row = self._conn.execute("SELECT data FROM patches WHERE id = ?", (patch_id,)).fetchone()
+        if row is None:
+            raise KeyError(patch_id)
+        return row[0]
+
+    def get(self, patch_id: int) -> Patch:
+        """Decode a patch by id."""
+        return Patch.from_bytes(self.raw(patch_id))
+
+    def view(self, patch_id: int) -> PatchView:
+        """Read-only PatchView of a patch by id."""
+        return PatchView(self.raw(patch_id))
+
+    def __repr__(self):
+        return f"PatchLibrary({len(self)} patches)"
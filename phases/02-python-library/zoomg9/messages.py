@@ -0,0 +1,297 @@
+"""
+Zoom G9.2tt Typed SysEx Messages
+
+Lightweight message objects decoded from raw SysEx buffers. Each object
+holds a single reference to the original buffer (bytes or memoryview, e.g.
+from SysexFramer) and decodes its fields only when they are accessed, so
+decoding millions of captured messages does not build a dict per message.
+
+Example:
+    for raw in iter_sysex(stream):
+        msg = decode_message(raw)
+        if isinstance(msg, ReadResponse) and msg.verify():
+            patch = Patch.from_bytes(msg.decode())
+"""
+
+from .constants import (
+    ZOOM_MANUFACTURER_ID,
+    G9TT_MODEL_ID,
+    CMD_READ_PATCH,
+    CMD_ENTER_EDIT,
+    CMD_EXIT_EDIT,
+    CMD_READ_RESPONSE,
+    CMD_WRITE_PATCH,
+    CMD_PARAM_CHANGE,
+    CMD_ENABLE_LIVE,
+    CMD_DISABLE_LIVE,
+)
+from .encoding import decode_nibbles, decode_7bit, _calculate_crc32, _decode_crc_7bit
+
+
+class G9Message:
+    """Base class for G9.2tt SysEx messages (F0 52 00 42 CMD ... F7)."""
+
+    __slots__ = ("raw",)
+
+    command = None
+    size = None  # Expected total message size, None if variable
+
+    def __init__(self, raw):
+        self.raw = raw
+
+    @property
+    def device(self) -> int:
+        """Device ID byte."""
+        return self.raw[2]
+
+    @property
+    def payload(self) -> memoryview:
+        """Data bytes between the command byte and F7 (no copy)."""
+        return memoryview(self.raw)[5:-1]
+
+    def _fields(self) -> str:
+        return f"{len(self.raw)} bytes"
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._fields()})"
+
+
+class UnknownMessage(G9Message):
+    """G9.2tt message with an unknown command or unexpected size."""
+
+    __slots__ = ()
+
+    @property
+    def command(self) -> int:
+        return self.raw[4]
+
+    def _fields(self) -> str:
+        return f"cmd=0x{self.raw[4]:02X}, {len(self.raw)} bytes"
+
+
+class ReadRequest(G9Message):
+    """0x11 - Patch read request (host or pedal in BULK RX)."""
+
+    __slots__ = ()
+    command = CMD_READ_PATCH
+    size = 7
+
+    @property
+    def patch_num(self) -> int:
+        return self.raw[5]
+
+    def _fields(self) -> str:
+        return f"patch={self.raw[5]}"
+
+
+class EditEnter(G9Message):
+    """0x12 - Enter edit mode."""
+
+    __slots__ = ()
+    command = CMD_ENTER_EDIT
+    size = 6
+
+    def _fields(self) -> str:
+        return ""
+
+
+class EditExit(G9Message):
+    """0x1F - Exit edit mode (sent by the pedal when a bulk write ends)."""
+
+    __slots__ = ()
+    command = CMD_EXIT_EDIT
+    size = 6
+
+    def _fields(self) -> str:
+        return ""
+
+
+class ReadResponse(G9Message):
+    """0x21 - Patch data: patch number, 256 nibbles and 5-byte checksum."""
+
+    __slots__ = ()
+    command = CMD_READ_RESPONSE
+    size = 268
+
+    @property
+    def patch_num(self) -> int:
+        return self.raw[5]
+
+    @property
+    def nibbles(self) -> memoryview:
+        """256 nibble-encoded data bytes (no copy)."""
+        return memoryview(self.raw)[6:262]
+
+    @property
+    def checksum(self) -> memoryview:
+        """5-byte 7-bit encoded CRC-32 (no copy)."""
+        return memoryview(self.raw)[262:267]
+
+    @property
+    def crc(self) -> int:
+        """Received CRC-32 value."""
+        return _decode_crc_7bit(self.checksum)
+
+    def decode(self) -> bytes:
+        """Decode the 128 bytes of patch data."""
+        return decode_nibbles(self.nibbles)
+
+    def verify(self) -> bool:
+        """Whether the checksum matches the patch data."""
+        return _calculate_crc32(self.decode()) == self.crc
+
+    def _fields(self) -> str:
+        return f"patch={self.raw[5]}"
+
+
+class WriteData(G9Message):
+    """0x28 - Patch data for preview/write (147 bytes, 7-bit encoded)."""
+
+    __slots__ = ()
+    command = CMD_WRITE_PATCH
+    size = 153
+
+    def decode(self) -> bytes:
+        """Decode the 128 bytes of patch data."""
+        return decode_7bit(self.payload)
+
+    def _fields(self) -> str:
+        return ""
+
+
+class ParamChange(G9Message):
+    """
+    0x31 - Real-time parameter change.
+
+    Also used for patch select/store, where effect_id holds the patch number.
+    """
+
+    __slots__ = ()
+    command = CMD_PARAM_CHANGE
+    size = 10
+
+    @property
+    def effect_id(self) -> int:
+        return self.raw[5]
+
+    @property
+    def param_id(self) -> int:
+        return self.raw[6]
+
+    @property
+    def value(self) -> int:
+        """Parameter value (VALUE_LO | VALUE_HI << 7)."""
+        return self.raw[7] | (self.raw[8] << 7)
+
+    def _fields(self) -> str:
+        return f"effect=0x{self.raw[5]:02X}, param=0x{self.raw[6]:02X}, value={self.value}"
+
+
+class LiveEnable(G9Message):
+    """0x50 - Enable live/real-time mode ("Online")."""
+
+    __slots__ = ()
+    command = CMD_ENABLE_LIVE
+    size = 6
+
+    def _fields(self) -> str:
+        return ""
+
+
+class LiveDisable(G9Message):
+    """0x51 - Disable live/real-time mode ("Offline")."""
+
+    __slots__ = ()
+    command = CMD_DISABLE_LIVE
+    size = 6
+
+    def _fields(self) -> str:
+        return ""
+
+
+class IdentityRequest(G9Message):
+    """Universal Identity Request (F0 7E 7F 06 01 F7)."""
+
+    __slots__ = ()
+
+    def _fields(self) -> str:
+        return ""
+
+
+class Identity(G9Message):
+    """Universal Identity Response (F0 7E dev 06 02 MFR MODEL ... F7)."""
+
+    __slots__ = ()
+
+    @property
+    def manufacturer(self) -> int:
+        return self.raw[5]
+
+    @property
+    def model(self) -> int:
+        return self.raw[6]
+
+    @property
+    def firmware(self) -> str:
+        """Firmware version string (e.g. "1.08"), empty if not present."""
+        if len(self.raw) < 15:
+            return ""
+        return bytes(self.raw[10:14]).decode("ascii", errors="replace")
+
+    @property
+    def valid(self) -> bool:
+        """Whether this is a Zoom device."""
+        return self.raw[5] == ZOOM_MANUFACTURER_ID
+
+    def _fields(self) -> str:
+        return f"manufacturer=0x{self.raw[5]:02X}, model=0x{self.raw[6]:02X}"
+
+
+# Command byte -> message class
+MESSAGE_TYPES = {
+    cls.command: cls
+    for cls in (
+        ReadRequest,
+        EditEnter,
+        EditExit,
+        ReadResponse,
+        WriteData,
+        ParamChange,
+        LiveEnable,
+        LiveDisable,
+    )
+}
+
+
+def decode_message(buf):
+    """
+    Decode a complete SysEx message into a typed message object.
+
+    The returned object references buf directly; nothing is copied.
+
+    Args:
+        buf: Complete SysEx message including F0 and F7
+             (bytes, bytearray or memoryview)
+
+    Returns:
+        A G9Message subclass instance, or None if buf is not a G9.2tt
+        or Universal Identity message
+    """
+    if len(buf) < 6 or buf[0] != 0xF0 or buf[-1] != 0xF7:
+        return None
+
+    if buf[1] == ZOOM_MANUFACTURER_ID:
+        if buf[3] != G9TT_MODEL_ID:
+            return None
+        cls = MESSAGE_TYPES.get(buf[4], UnknownMessage)
+        if cls.size is not None and len(buf) != cls.size:
+            cls = UnknownMessage
+        return cls(buf)
+
+    if buf[1] == 0x7E and buf[3] == 0x06:
+        if buf[4] == 0x02 and len(buf) >= 10:
+            return Identity(buf)
+        if buf[4] == 0x01:
+            return IdentityRequest(buf)
+
+    return None
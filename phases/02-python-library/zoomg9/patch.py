@@ -2,6 +2,11 @@
 Zoom G9.2tt Patch Data Model
 
 Represents a complete patch with all effect modules and serialization.
+
+A patch decoded with from_bytes() keeps its source data. to_bytes() then
+starts from a copy of it and re-serializes only the modules and global
+fields that were modified, so unknown and reserved bytes survive a round
+trip and an unmodified patch is returned without any packing.
 """
 
 from .constants import (
@@ -10,7 +15,7 @@ from .constants import (
     PATCH_NAME_OFFSET,
     DIRECT_OFFSETS,
 )
-from .encoding import unpack_bits, pack_bits
+from .encoding import BIT_FIELDS, unpack_fields, pack_fields, update_fields, calculate_checksum
 from .effects import (
     AmpModule,
     CmpModule,
@@ -24,6 +29,49 @@ from .effects import (
     RevModule,
 )
 
+# Patch._dirty bits for the fields stored in the Patch itself
+_DIRTY_LEVEL = 0x01
+_DIRTY_GLOBALS = 0x02  # amp_sel, tempo
+_DIRTY_NAME = 0x04
+
+
+def _row_first(row: int) -> int:
+    """Index of the first BIT_FIELDS entry of a BIT_TBL row."""
+    return next(i for i, field in enumerate(BIT_FIELDS) if field[0] == row)
+
+
+# Bit-packed modules (Channel A): attribute, first field, field values.
+# None leaves a field as it is in the source (AMP high bit extension).
+_PACKED_MODULES = tuple(
+    (name, _row_first(row), values) for name, row, values in (
+        ("comp", 1, lambda m: (int(m._on), m._type, m._sense, m._attack, m._tone, m._level)),
+        ("wah", 2, lambda m: (int(m._on), m._type, m._position, m._sense, m._resonance, m._level)),
+        ("ext", 3, lambda m: (int(m._on), m._send, m._return, m._dry)),
+        ("znr_a", 4, lambda m: (int(m._on), m._type, m._threshold)),
+        ("amp_a", 5, lambda m: (int(m._on), m._type, m._gain, m._tone, m._level, None)),
+        ("eq_a", 6, lambda m: (int(m._on), *m._bands)),
+        ("cab", 7, lambda m: (int(m._on), m._depth, m._mic_type, m._mic_pos)),
+        ("mod", 8, lambda m: (int(m._on), m._type, m._depth, m._rate, m._tone, m._mix)),
+        ("delay", 9, lambda m: (int(m._on), m._type, m._time, m._feedback, m._hidamp, m._mix)),
+        ("reverb", 10, lambda m: (int(m._on), m._type, m._decay, m._predelay, m._tone, m._mix)),
+    )
+)
+
+# Direct offset modules (Channel B): attribute, byte offsets, field values
+_DIRECT_MODULES = tuple(
+    (name, tuple(DIRECT_OFFSETS[key] for key in keys), values) for name, keys, values in (
+        ("znr_b", ("ZnrB_onoff", "ZnrB_type", "ZnrB_parm1"),
+         lambda m: (int(m._on), m._type, m._threshold)),
+        ("amp_b", ("AmpB_onoff", "AmpB_type", "AmpB_parm1", "AmpB_parm2", "AmpB_parm3"),
+         lambda m: (int(m._on), m._type, m._gain, m._tone, m._level)),
+        ("eq_b", ("EqB_onoff", "EqB_parm1", "EqB_parm2", "EqB_parm3",
+                  "EqB_parm4", "EqB_parm5", "EqB_parm6"),
+         lambda m: (int(m._on), *m._bands)),
+    )
+)
+
+_MODULE_NAMES = tuple(entry[0] for entry in _PACKED_MODULES + _DIRECT_MODULES)
+
 
 class Patch:
     """
@@ -33,6 +81,13 @@ class Patch:
     to/from the device's 128-byte format.
     """
 
+    __slots__ = (
+        "_name", "_level", "_tempo", "_amp_sel", "_pedal_func",
+        "comp", "wah", "ext", "znr_a", "amp_a", "eq_a", "cab", "mod", "delay", "reverb",
+        "znr_b", "amp_b", "eq_b",
+        "_source", "_dirty", "_checksum",
+    )
+
     def __init__(self, name: str = "NewPatch"):
         """
         Create a new patch with default settings.
@@ -63,6 +118,12 @@ class Patch:
         self.amp_b = AmpModule()
         self.eq_b = EqModule()
 
+        # Serialized data of the unmodified patch (None: not serialized yet),
+        # _DIRTY_* bits of modified patch fields, cached checksum of _source
+        self._source = None
+        self._dirty = 0
+        self._checksum = None
+
     @property
     def name(self) -> str:
         """Patch name (max 10 characters)."""
@@ -71,6 +132,7 @@ class Patch:
     @name.setter
     def name(self, value: str):
         self._name = value[:PATCH_NAME_LENGTH].ljust(PATCH_NAME_LENGTH)
+        self._dirty |= _DIRTY_NAME
 
     @property
     def level(self) -> int:
@@ -82,6 +144,7 @@ class Patch:
         if not 0 <= value <= 100:
             raise ValueError("Level must be 0-100")
         self._level = value
+        self._dirty |= _DIRTY_LEVEL
 
     @property
     def tempo(self) -> int:
@@ -93,6 +156,7 @@ class Patch:
         if not 40 <= value <= 250:
             raise ValueError("Tempo must be 40-250")
         self._tempo = value
+        self._dirty |= _DIRTY_GLOBALS
 
     @property
     def amp_sel(self) -> int:
@@ -104,6 +168,7 @@ class Patch:
         if value not in (0, 1):
             raise ValueError("amp_sel must be 0 (A) or 1 (B)")
         self._amp_sel = value
+        self._dirty |= _DIRTY_GLOBALS
 
     @property
     def amp(self) -> AmpModule:
@@ -125,6 +190,8 @@ class Patch:
         """
         Deserialize a patch from 128 bytes of decoded data.
 
+        The data is kept as the patch's source for to_bytes().
+
         Args:
             data: 128 bytes of decoded patch data
 
@@ -134,87 +201,41 @@ class Patch:
         if len(data) != PATCH_SIZE_DECODED:
             raise ValueError(f"Expected {PATCH_SIZE_DECODED} bytes, got {len(data)}")
 
+        data = bytes(data)
         patch = cls()
 
-        # Unpack bit-packed matrix
-        matrix = unpack_bits(data)
-
-        # Global (row 0)
-        patch._level = matrix[0][5]
-
-        # CMP (row 1)
-        patch.comp._on = bool(matrix[1][0])
-        patch.comp._type = matrix[1][1]
-        patch.comp._sense = matrix[1][2]
-        patch.comp._attack = matrix[1][3]
-        patch.comp._tone = matrix[1][4]
-        patch.comp._level = matrix[1][5]
-
-        # WAH (row 2)
-        patch.wah._on = bool(matrix[2][0])
-        patch.wah._type = matrix[2][1]
-        patch.wah._position = matrix[2][2]
-        patch.wah._sense = matrix[2][3]
-        patch.wah._resonance = matrix[2][4]
-        patch.wah._level = matrix[2][5]
-
-        # EXT (row 3)
-        patch.ext._on = bool(matrix[3][0])
-        patch.ext._send = matrix[3][2]
-        patch.ext._return = matrix[3][3]
-        patch.ext._dry = matrix[3][4]
-
-        # ZNR-A (row 4)
-        patch.znr_a._on = bool(matrix[4][0])
-        patch.znr_a._type = matrix[4][1]
-        patch.znr_a._threshold = matrix[4][2]
-
-        # AMP-A (row 5)
-        patch.amp_a._on = bool(matrix[5][0])
-        patch.amp_a._type = matrix[5][1]
-        patch.amp_a._gain = matrix[5][2]
-        patch.amp_a._tone = matrix[5][3]
-        patch.amp_a._level = matrix[5][4]
-        # matrix[5][5] is the high bit extension (1 bit)
-
-        # EQ-A (row 6)
-        patch.eq_a._on = bool(matrix[6][0])
-        patch.eq_a._bands[0] = matrix[6][2]
-        patch.eq_a._bands[1] = matrix[6][3]
-        patch.eq_a._bands[2] = matrix[6][4]
-        patch.eq_a._bands[3] = matrix[6][5]
-        patch.eq_a._bands[4] = matrix[6][6]
-        patch.eq_a._bands[5] = matrix[6][7]
-
-        # CAB (row 7)
-        patch.cab._on = bool(matrix[7][0])
-        patch.cab._depth = matrix[7][2]
-        patch.cab._mic_type = matrix[7][3]
-        patch.cab._mic_pos = matrix[7][4]
-
-        # MOD (row 8)
-        patch.mod._on = bool(matrix[8][0])
-        patch.mod._type = matrix[8][1]
-        patch.mod._depth = matrix[8][2]
-        patch.mod._rate = matrix[8][3]
-        patch.mod._tone = matrix[8][4]
-        patch.mod._mix = matrix[8][5]
-
-        # DLY (row 9)
-        patch.delay._on = bool(matrix[9][0])
-        patch.delay._type = matrix[9][1]
-        patch.delay._time = matrix[9][2]
-        patch.delay._feedback = matrix[9][3]
-        patch.delay._hidamp = matrix[9][4]
-        patch.delay._mix = matrix[9][5]
-
-        # REV (row 10)
-        patch.reverb._on = bool(matrix[10][0])
-        patch.reverb._type = matrix[10][1]
-        patch.reverb._decay = matrix[10][2]
-        patch.reverb._predelay = matrix[10][3]
-        patch.reverb._tone = matrix[10][4]
-        patch.reverb._mix = matrix[10][5]
+        # Unpack bit-packed fields (flat, BIT_TBL row/column order)
+        (
+            patch._level,
+            cmp_on, patch.comp._type, patch.comp._sense, patch.comp._attack,
+            patch.comp._tone, patch.comp._level,
+            wah_on, patch.wah._type, patch.wah._position, patch.wah._sense,
+            patch.wah._resonance, patch.wah._level,
+            ext_on, patch.ext._send, patch.ext._return, patch.ext._dry,
+            znr_on, patch.znr_a._type, patch.znr_a._threshold,
+            amp_on, patch.amp_a._type, patch.amp_a._gain, patch.amp_a._tone,
+            patch.amp_a._level, _amp_ext,  # high bit extension (1 bit)
+            eq_on, eq_1, eq_2, eq_3, eq_4, eq_5, eq_6,
+            cab_on, patch.cab._depth, patch.cab._mic_type, patch.cab._mic_pos,
+            mod_on, patch.mod._type, patch.mod._depth, patch.mod._rate,
+            patch.mod._tone, patch.mod._mix,
+            dly_on, patch.delay._type, patch.delay._time, patch.delay._feedback,
+            patch.delay._hidamp, patch.delay._mix,
+            rev_on, patch.reverb._type, patch.reverb._decay, patch.reverb._predelay,
+            patch.reverb._tone, patch.reverb._mix,
+        ) = unpack_fields(data)
+
+        patch.comp._on = bool(cmp_on)
+        patch.wah._on = bool(wah_on)
+        patch.ext._on = bool(ext_on)
+        patch.znr_a._on = bool(znr_on)
+        patch.amp_a._on = bool(amp_on)
+        patch.eq_a._on = bool(eq_on)
+        patch.eq_a._bands = [eq_1, eq_2, eq_3, eq_4, eq_5, eq_6]
+        patch.cab._on = bool(cab_on)
+        patch.mod._on = bool(mod_on)
+        patch.delay._on = bool(dly_on)
+        patch.reverb._on = bool(rev_on)
 
         # Direct offset fields (non-bit-packed)
 
@@ -248,100 +269,129 @@ class Patch:
         name_start = DIRECT_OFFSETS["Name"]
         patch._name = data[name_start:name_start + PATCH_NAME_LENGTH].decode("ascii", errors="replace")
 
+        patch._set_source(data)
         return patch
 
+    @property
+    def modified(self) -> bool:
+        """Whether any field was set since decoding or the last to_bytes()."""
+        source = self._source
+        if source is None or self._dirty:
+            return True
+        for name in _MODULE_NAMES:
+            module = getattr(self, name)
+            if module._source is not source or module._slot != name:
+                return True
+        return False
+
     def to_bytes(self) -> bytes:
         """
         Serialize the patch to 128 bytes.
 
+        A patch decoded with from_bytes() is serialized incrementally: the
+        source data is copied and only modified modules and fields are
+        written over it, so bytes this library does not model are kept.
+        The result becomes the new source.
+
         Returns:
             128 bytes of patch data ready for encoding
         """
+        source = self._source
+        if source is None:
+            data = self._pack()
+        else:
+            data = self._update(source)
+            if data is source:
+                return source
+        self._set_source(data)
+        return data
+
+    def checksum(self) -> bytes:
+        """
+        5-byte READ_RESP checksum (CRC-32) of to_bytes().
+
+        Computed once and reused until the patch is modified.
+        """
+        data = self.to_bytes()
+        if self._checksum is None:
+            self._checksum = calculate_checksum(data)
+        return self._checksum
+
+    def _set_source(self, data: bytes):
+        """Mark the patch and all its modules as unmodified copies of data."""
+        self._source = data
+        self._dirty = 0
+        self._checksum = None
+        for name in _MODULE_NAMES:
+            module = getattr(self, name)
+            module._source = data
+            module._slot = name
+
+    def _update(self, source: bytes) -> bytes:
+        """Write modified fields over a copy of source (source if none)."""
+        dirty = self._dirty
+        packed = [
+            (first, values, module)
+            for name, first, values in _PACKED_MODULES
+            for module in (getattr(self, name),)
+            if module._source is not source or module._slot != name
+        ]
+        direct = [
+            (offsets, values, module)
+            for name, offsets, values in _DIRECT_MODULES
+            for module in (getattr(self, name),)
+            if module._source is not source or module._slot != name
+        ]
+        if not (dirty or packed or direct):
+            return source
+
+        data = bytearray(source)
+
+        if dirty & _DIRTY_LEVEL:
+            update_fields(data, 0, (self._level,))
+        for first, values, module in packed:
+            update_fields(data, first, values(module))
+        for offsets, values, module in direct:
+            for offset, value in zip(offsets, values(module)):
+                data[offset] = value
+
+        if dirty & _DIRTY_GLOBALS:
+            data[DIRECT_OFFSETS["AmpSel"]] = self._amp_sel
+            data[DIRECT_OFFSETS["Tempo_raw"]] = self._tempo - 40
+        if dirty & _DIRTY_NAME:
+            self._write_name(data)
+
+        return bytes(data)
+
+    def _write_name(self, data: bytearray):
+        name_bytes = self._name.encode("ascii", errors="replace")[:PATCH_NAME_LENGTH]
+        name_bytes = name_bytes.ljust(PATCH_NAME_LENGTH, b"\x00")
+        name_start = DIRECT_OFFSETS["Name"]
+        data[name_start:name_start + PATCH_NAME_LENGTH] = name_bytes
+
+    def _pack(self) -> bytes:
+        """Serialize every field into a zero-filled buffer."""
         # Start with a zero-filled buffer
         data = bytearray(PATCH_SIZE_DECODED)
 
-        # Build the bit-packed matrix
-        matrix = [[0] * 8 for _ in range(12)]
-
-        # Global (row 0)
-        matrix[0][5] = self._level
-
-        # CMP (row 1)
-        matrix[1][0] = int(self.comp._on)
-        matrix[1][1] = self.comp._type
-        matrix[1][2] = self.comp._sense
-        matrix[1][3] = self.comp._attack
-        matrix[1][4] = self.comp._tone
-        matrix[1][5] = self.comp._level
-
-        # WAH (row 2)
-        matrix[2][0] = int(self.wah._on)
-        matrix[2][1] = self.wah._type
-        matrix[2][2] = self.wah._position
-        matrix[2][3] = self.wah._sense
-        matrix[2][4] = self.wah._resonance
-        matrix[2][5] = self.wah._level
-
-        # EXT (row 3)
-        matrix[3][0] = int(self.ext._on)
-        matrix[3][2] = self.ext._send
-        matrix[3][3] = self.ext._return
-        matrix[3][4] = self.ext._dry
-
-        # ZNR-A (row 4)
-        matrix[4][0] = int(self.znr_a._on)
-        matrix[4][1] = self.znr_a._type
-        matrix[4][2] = self.znr_a._threshold
-
-        # AMP-A (row 5)
-        matrix[5][0] = int(self.amp_a._on)
-        matrix[5][1] = self.amp_a._type
-        matrix[5][2] = self.amp_a._gain
-        matrix[5][3] = self.amp_a._tone
-        matrix[5][4] = self.amp_a._level
-        matrix[5][5] = 0  # High bit extension
-
-        # EQ-A (row 6)
-        matrix[6][0] = int(self.eq_a._on)
-        matrix[6][2] = self.eq_a._bands[0]
-        matrix[6][3] = self.eq_a._bands[1]
-        matrix[6][4] = self.eq_a._bands[2]
-        matrix[6][5] = self.eq_a._bands[3]
-        matrix[6][6] = self.eq_a._bands[4]
-        matrix[6][7] = self.eq_a._bands[5]
-
-        # CAB (row 7)
-        matrix[7][0] = int(self.cab._on)
-        matrix[7][2] = self.cab._depth
-        matrix[7][3] = self.cab._mic_type
-        matrix[7][4] = self.cab._mic_pos
-
-        # MOD (row 8)
-        matrix[8][0] = int(self.mod._on)
-        matrix[8][1] = self.mod._type
-        matrix[8][2] = self.mod._depth
-        matrix[8][3] = self.mod._rate
-        matrix[8][4] = self.mod._tone
-        matrix[8][5] = self.mod._mix
-
-        # DLY (row 9)
-        matrix[9][0] = int(self.delay._on)
-        matrix[9][1] = self.delay._type
-        matrix[9][2] = self.delay._time
-        matrix[9][3] = self.delay._feedback
-        matrix[9][4] = self.delay._hidamp
-        matrix[9][5] = self.delay._mix
-
-        # REV (row 10)
-        matrix[10][0] = int(self.reverb._on)
-        matrix[10][1] = self.reverb._type
-        matrix[10][2] = self.reverb._decay
-        matrix[10][3] = self.reverb._predelay
-        matrix[10][4] = self.reverb._tone
-        matrix[10][5] = self.reverb._mix
-
-        # Pack the bit matrix into the first ~36 bytes
-        packed = pack_bits(matrix)
+        # Pack the bit-packed fields (flat, BIT_TBL row/column order)
+        comp, wah, ext, znr, amp, eq = (
+            self.comp, self.wah, self.ext, self.znr_a, self.amp_a, self.eq_a
+        )
+        cab, mod, dly, rev = self.cab, self.mod, self.delay, self.reverb
+        packed = pack_fields((
+            self._level,
+            int(comp._on), comp._type, comp._sense, comp._attack, comp._tone, comp._level,
+            int(wah._on), wah._type, wah._position, wah._sense, wah._resonance, wah._level,
+            int(ext._on), ext._send, ext._return, ext._dry,
+            int(znr._on), znr._type, znr._threshold,
+            int(amp._on), amp._type, amp._gain, amp._tone, amp._level, 0,  # high bit ext.
+            int(eq._on), *eq._bands,
+            int(cab._on), cab._depth, cab._mic_type, cab._mic_pos,
+            int(mod._on), mod._type, mod._depth, mod._rate, mod._tone, mod._mix,
+            int(dly._on), dly._type, dly._time, dly._feedback, dly._hidamp, dly._mix,
+            int(rev._on), rev._type, rev._decay, rev._predelay, rev._tone, rev._mix,
+        ))
         data[:len(packed)] = packed
 
         # Direct offset fields
@@ -374,10 +424,7 @@ class Patch:
         data[DIRECT_OFFSETS["PedalFunc1"]] = self._pedal_func[1]
 
         # Name
-        name_bytes = self._name.encode("ascii", errors="replace")[:PATCH_NAME_LENGTH]
-        name_bytes = name_bytes.ljust(PATCH_NAME_LENGTH, b"\x00")
-        name_start = DIRECT_OFFSETS["Name"]
-        data[name_start:name_start + PATCH_NAME_LENGTH] = name_bytes
+        self._write_name(data)
 
         return bytes(data)
 
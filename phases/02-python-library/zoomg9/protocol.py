@@ -4,6 +4,9 @@ Zoom G9.2tt SysEx Protocol
 Low-level SysEx message building and parsing functions.
 """
 
+import re
+from typing import Optional
+
 from .constants import (
     ZOOM_MANUFACTURER_ID,
     G9TT_MODEL_ID,
@@ -17,8 +20,18 @@ from .constants import (
     CMD_ENABLE_LIVE,
     CMD_DISABLE_LIVE,
     PATCH_SIZE_NIBBLE,
+    PATCH_SIZE_DECODED,
+)
+from .encoding import (
+    decode_nibbles,
+    encode_nibbles,
+    encode_7bit,
+    decode_7bit,
+    decode_nibbles_batch,
+    _calculate_crc32,
+    _decode_crc_7bit,
 )
-from .encoding import decode_nibbles, encode_nibbles, encode_7bit, decode_7bit
+from .messages import ReadResponse, decode_message
 
 
 def _build_sysex(cmd: int, data: bytes = b"") -> bytes:
@@ -43,6 +56,55 @@ def _build_sysex(cmd: int, data: bytes = b"") -> bytes:
     ]) + data + bytes([0xF7])
 
 
+class SysexTemplate:
+    """
+    Preallocated SysEx message refilled in place.
+
+    The header (F0 52 00 42 CMD) and F7 are written once; fill() only
+    overwrites the data bytes of the same bytearray, so hot paths such as
+    real-time parameter changes do not allocate per message.
+
+    Not thread-safe: use one template per sending thread. The returned
+    buffer is reused by the next fill(), so send it (or copy it) first.
+
+    Example:
+        param = SysexTemplate(CMD_PARAM_CHANGE, 4)
+        port.send(param.fill(0x05, 0x02, 80, 0x00))
+    """
+
+    __slots__ = ("buffer", "_data")
+
+    def __init__(self, cmd: int, data_size: int):
+        """
+        Args:
+            cmd: Command byte
+            data_size: Number of data bytes between the command and F7
+        """
+        self.buffer = bytearray(_build_sysex(cmd, bytes(data_size)))
+        self._data = slice(5, 5 + data_size)
+
+    def fill(self, *data: int) -> bytearray:
+        """
+        Write data bytes into the template (no validation).
+
+        Args:
+            *data: Exactly data_size values, each 0-127
+
+        Returns:
+            The filled message buffer (F0 ... F7)
+        """
+        self.buffer[self._data] = data
+        return self.buffer
+
+
+# Constant messages, built once
+ENTER_EDIT = _build_sysex(CMD_ENTER_EDIT)
+EXIT_EDIT = _build_sysex(CMD_EXIT_EDIT)
+ENABLE_LIVE = _build_sysex(CMD_ENABLE_LIVE)
+DISABLE_LIVE = _build_sysex(CMD_DISABLE_LIVE)
+IDENTITY_REQUEST = bytes([0xF0, 0x7E, 0x7F, 0x06, 0x01, 0xF7])
+
+
 def build_read_request(patch_num: int) -> bytes:
     """
     Build a read patch request message.
@@ -69,7 +131,7 @@ def build_enter_edit() -> bytes:
     Returns:
         6-byte SysEx message
     """
-    return _build_sysex(CMD_ENTER_EDIT)
+    return ENTER_EDIT
 
 
 def build_exit_edit() -> bytes:
@@ -81,7 +143,7 @@ def build_exit_edit() -> bytes:
     Returns:
         6-byte SysEx message
     """
-    return _build_sysex(CMD_EXIT_EDIT)
+    return EXIT_EDIT
 
 
 def build_enable_live() -> bytes:
@@ -95,7 +157,7 @@ def build_enable_live() -> bytes:
     Returns:
         6-byte SysEx message: F0 52 00 42 50 F7
     """
-    return _build_sysex(CMD_ENABLE_LIVE)
+    return ENABLE_LIVE
 
 
 def build_disable_live() -> bytes:
@@ -108,7 +170,7 @@ def build_disable_live() -> bytes:
     Returns:
         6-byte SysEx message: F0 52 00 42 51 F7
     """
-    return _build_sysex(CMD_DISABLE_LIVE)
+    return DISABLE_LIVE
 
 
 def build_write_data(patch_data: bytes) -> bytes:
@@ -143,19 +205,20 @@ def build_param_change(effect_id: int, param_id: int, value: int) -> bytes:
     Args:
         effect_id: Effect module ID (0x00-0x0B)
         param_id: Parameter ID within the effect
-        value: New value (0-127 for single byte, may use 2 bytes for larger)
+        value: New value (0-16383), sent as VALUE_LO = value & 0x7F,
+               VALUE_HI = value >> 7 (14-bit, see MAPPING_CHECKLIST.md)
 
     Returns:
-        10-byte SysEx message
+        10-byte SysEx message: F0 52 00 42 31 EFFECT PARAM LO HI F7
     """
     if not 0x00 <= effect_id <= 0x0B:
         raise ValueError(f"Effect ID must be 0x00-0x0B, got 0x{effect_id:02X}")
     if not 0 <= param_id <= 0x07:
         raise ValueError(f"Param ID must be 0x00-0x07, got 0x{param_id:02X}")
-    if not 0 <= value <= 127:
-        raise ValueError(f"Value must be 0-127, got {value}")
+    if not 0 <= value <= 0x3FFF:
+        raise ValueError(f"Value must be 0-16383, got {value}")
 
-    return _build_sysex(CMD_PARAM_CHANGE, bytes([effect_id, param_id, value, 0x00]))
+    return _build_sysex(CMD_PARAM_CHANGE, bytes([effect_id, param_id, value & 0x7F, value >> 7]))
 
 
 def build_patch_select(patch_num: int, mode: int = 0x02) -> bytes:
@@ -177,7 +240,7 @@ def build_patch_select(patch_num: int, mode: int = 0x02) -> bytes:
     return _build_sysex(CMD_PARAM_CHANGE, bytes([patch_num, 0x02, mode, 0x00]))
 
 
-def build_read_response(patch_num: int, patch_data: bytes) -> bytes:
+def build_read_response(patch_num: int, patch_data: bytes, checksum: Optional[bytes] = None) -> bytes:
     """
     Build a read response message (for bulk write to device).
 
@@ -190,6 +253,8 @@ def build_read_response(patch_num: int, patch_data: bytes) -> bytes:
     Args:
         patch_num: Patch number (0-99)
         patch_data: 128 bytes raw patch data
+        checksum: Precomputed 5-byte checksum of patch_data (e.g.
+                  Patch.checksum()); calculated if None
 
     Returns:
         268-byte SysEx message
@@ -202,7 +267,8 @@ def build_read_response(patch_num: int, patch_data: bytes) -> bytes:
         raise ValueError(f"Patch data must be 128 bytes, got {len(patch_data)}")
 
     nibbles = encode_nibbles(patch_data)
-    checksum = calculate_checksum(patch_data)
+    if checksum is None:
+        checksum = calculate_checksum(patch_data)
 
     return _build_sysex(CMD_READ_RESPONSE, bytes([patch_num]) + nibbles + checksum)
 
@@ -214,7 +280,7 @@ def build_identity_request() -> bytes:
     Returns:
         6-byte SysEx message
     """
-    return bytes([0xF0, 0x7E, 0x7F, 0x06, 0x01, 0xF7])
+    return IDENTITY_REQUEST
 
 
 def parse_sysex(data: bytes) -> dict:
@@ -231,7 +297,7 @@ def parse_sysex(data: bytes) -> dict:
         - 'device': int - Device ID
         - 'model': int - Model ID
         - 'command': int - Command byte
-        - 'data': bytes - Payload data
+        - 'data': bytes - Payload data (a zero-copy slice if data is a memoryview)
     """
     result = {
         "valid": False,
@@ -260,18 +326,33 @@ def parse_sysex(data: bytes) -> dict:
     return result
 
 
-def parse_read_response(data: bytes) -> tuple:
+class ChecksumError(ValueError):
+    """Raised when a READ_RESP checksum does not match its patch data."""
+
+    def __init__(self, patch_num: int, expected: int, received: int):
+        self.patch_num = patch_num
+        self.expected = expected
+        self.received = received
+        super().__init__(
+            f"Checksum mismatch for patch {patch_num}: "
+            f"expected 0x{expected:08X}, got 0x{received:08X}"
+        )
+
+
+def parse_read_response(data: bytes, verify: bool = True) -> tuple:
     """
     Parse a read patch response (0x21).
 
     Args:
         data: Complete 268-byte SysEx message
+        verify: Validate the 5-byte CRC-32 checksum (default True)
 
     Returns:
         Tuple of (patch_num, decoded_data) or (None, None) on error
 
     Raises:
         ValueError: If message format is invalid
+        ChecksumError: If verify is set and the checksum does not match
     """
     if len(data) != 268:
         raise ValueError(f"Expected 268 bytes, got {len(data)}")
@@ -286,12 +367,54 @@ def parse_read_response(data: bytes) -> tuple:
     payload = parsed["data"]
     patch_num = payload[0]
     nibbles = payload[1:257]  # 256 nibbles
-    # checksum = payload[257:262]  # 5 bytes checksum (ignored for now)
+    checksum = payload[257:262]  # 5 bytes checksum
 
     decoded = decode_nibbles(nibbles)
+
+    if verify:
+        expected = _calculate_crc32(decoded)
+        received = _decode_crc_7bit(checksum)
+        if expected != received:
+            raise ChecksumError(patch_num, expected, received)
+
     return patch_num, decoded
 
 
+def verify_bank(messages) -> list:
+    """
+    Verify the checksums of a whole bank of read responses in one call.
+
+    All nibble payloads are decoded together with decode_nibbles_batch()
+    and each patch CRC is computed with zlib, so verifying 100 patches
+    costs well under a millisecond.
+
+    Args:
+        messages: Sequence of 268-byte READ_RESP (0x21) messages,
+                  e.g. the responses collected by a full bank read
+
+    Returns:
+        List of indices into messages that are corrupt (bad checksum,
+        wrong length or not a READ_RESP). Empty if the bank is intact.
+    """
+    corrupt = []
+    valid = []
+
+    for index, msg in enumerate(messages):
+        if not isinstance(decode_message(msg), ReadResponse):
+            corrupt.append(index)
+        else:
+            valid.append((index, msg))
+
+    decoded = decode_nibbles_batch(b"".join(msg[6:262] for _, msg in valid))
+
+    for i, (index, msg) in enumerate(valid):
+        patch = decoded[i * PATCH_SIZE_DECODED:(i + 1) * PATCH_SIZE_DECODED]
+        if _decode_crc_7bit(msg[262:267]) != _calculate_crc32(patch):
+            corrupt.append(index)
+
+    return sorted(corrupt)
+
+
 def parse_identity_response(data: bytes) -> dict:
     """
     Parse a Universal Identity Response message.
@@ -330,3 +453,233 @@ def parse_identity_response(data: bytes) -> dict:
             result["valid"] = True
 
     return result
+
+
+# System real-time bytes (0xF8-0xFF) may be interleaved anywhere, even in SysEx
+_REALTIME_BYTES = bytes(range(0xF8, 0x100))
+
+# In-place searches for memoryview chunks, which lack find() and isascii()
+_SEARCH = {0xF0: re.compile(rb"\xF0").search, 0xF7: re.compile(rb"\xF7").search}
+_SEVEN_BIT = re.compile(rb"[\x00-\x7F]*")
+
+
+def _find_in(buf):
+    """buf.find(byte, start) for buffers without a find() method (memoryview)."""
+    def find(byte: int, start: int = 0) -> int:
+        match = _SEARCH[byte](buf, start)
+        return -1 if match is None else match.start()
+    return find
+
+
+class SysexFramer:
+    """
+    Incremental SysEx framer for chunked byte streams.
+
+    Accepts arbitrary chunks (file reads, pipes, MIDI callbacks) and returns
+    complete F0...F7 messages. Partial messages are kept across chunk
+    boundaries. Boundaries are located with bytes.find() (a compiled
+    regular expression for memoryview chunks), so framing runs at C speed
+    instead of a per-byte Python loop.
+
+    Messages fully contained in one chunk are returned as memoryview slices
+    of that chunk (no copy, memoryview chunks included); header fields such
+    as view[4] (command) are only read when accessed. Messages spanning
+    chunks, or containing interleaved real-time bytes that have to be
+    stripped, are copied once.
+
+    Messages interrupted by a new F0 or another status byte, or longer than
+    max_size, are dropped and counted in `truncated`.
+
+    Example:
+        framer = SysexFramer()
+        for chunk in chunks:
+            for msg in framer.feed(chunk):
+                if msg[4] == 0x21:
+                    patch_num, data = parse_read_response(msg)
+
+    Note:
+        Views reference the chunk passed to feed(). Do not modify a
+        bytearray chunk while its messages are still in use.
+    """
+
+    def __init__(self, max_size: int = 65536):
+        """
+        Args:
+            max_size: Maximum message size, F0 and F7 included. Longer
+                      messages are dropped as truncated.
+        """
+        self.max_size = max_size
+        self.messages = 0
+        self.truncated = 0
+        self._pending = None  # List of byte pieces of an unfinished message
+        self._pending_size = 0
+
+    def reset(self):
+        """Discard any partial message."""
+        self._pending = None
+        self._pending_size = 0
+
+    def feed(self, chunk) -> list:
+        """
+        Feed a chunk of raw MIDI bytes.
+
+        Args:
+            chunk: bytes, bytearray or memoryview
+
+        Returns:
+            List of SysEx messages (memoryview) completed by this chunk
+        """
+        # memoryview chunks are searched in place rather than copied
+        in_place = isinstance(chunk, memoryview)
+        if in_place:
+            view = chunk.cast("B") if chunk.format != "B" else chunk
+            find = _find_in(view)
+        else:
+            view = memoryview(chunk)
+            find = chunk.find
+
+        found = []
+        pos = 0
+        size = len(view)
+        max_size = self.max_size
+
+        if self._pending is not None:
+            pos = self._continue_pending(view, find, found)
+
+        while pos < size:
+            start = find(0xF0, pos)
+            if start == -1:
+                break
+
+            end = find(0xF7, start + 1)
+            if end == -1:
+                self._keep_tail(bytes(view[start:]))
+                break
+
+            # SysEx bodies are 7-bit; checked at C speed either way
+            if in_place:
+                seven_bit = _SEVEN_BIT.fullmatch(view, start + 1, end) is not None
+            else:
+                seven_bit = chunk[start + 1:end].isascii()
+
+            if not seven_bit:
+                self._emit_slow(bytes(view[start:end + 1]), found)
+            elif end + 1 - start > max_size:
+                self.truncated += 1
+            else:
+                found.append(view[start:end + 1])
+            pos = end + 1
+
+        self.messages += len(found)
+        return found
+
+    def _keep_tail(self, tail: bytes):
+        """Start a pending message from the unterminated end of a chunk."""
+        restart = tail.rfind(0xF0, 1)
+        if restart != -1:
+            # A new message started before this one was terminated
+            self.truncated += 1
+            tail = tail[restart:]
+        self._pending = [tail]
+        self._pending_size = len(tail)
+        self._check_pending_size()
+
+    def _continue_pending(self, view: memoryview, find, found: list) -> int:
+        """Extend the pending message with a chunk; return where to resume."""
+        size = len(view)
+        end = find(0xF7)
+        stop = size if end == -1 else end + 1
+
+        if self._pending_size + stop > self.max_size:
+            # Too long either way; resume at the next message, if any
+            restart = find(0xF0)
+            self.truncated += 1
+            self.reset()
+            return size if restart == -1 else restart
+
+        head = bytes(view[:stop])
+        restart = head.rfind(0xF0)
+        if restart != -1:
+            self.truncated += 1
+            self.reset()
+            return restart
+
+        self._pending.append(head)
+        self._pending_size += stop
+        if end == -1:
+            return size
+
+        message = b"".join(self._pending)
+        self.reset()
+        if message[1:-1].isascii():
+            found.append(memoryview(message))
+        else:
+            self._emit_slow(message, found)
+        return stop
+
+    def _check_pending_size(self):
+        """Drop a partial message that exceeds max_size."""
+        if self._pending_size > self.max_size:
+            self.truncated += 1
+            self.reset()
+
+    def _emit_slow(self, message: bytes, found: list):
+        """Handle a message whose body contains status bytes."""
+        restart = message.rfind(0xF0, 1, len(message) - 1)
+        if restart != -1:
+            # A new message started before this one was terminated
+            self.truncated += 1
+            message = message[restart:]
+
+        message = message.translate(None, _REALTIME_BYTES)
+        if not message[1:-1].isascii():
+            # Interrupted by a non-real-time status byte
+            self.truncated += 1
+            return
+        if len(message) > self.max_size:
+            self.truncated += 1
+            return
+
+        found.append(memoryview(message))
+
+
+def iter_sysex(stream, chunk_size: int = 1 << 20):
+    """
+    Iterate over the SysEx messages in a binary stream.
+
+    Args:
+        stream: Binary file-like object (file, pipe, socket.makefile("rb"))
+        chunk_size: Bytes to read per call
+
+    Yields:
+        Complete SysEx messages as memoryview slices
+    """
+    framer = SysexFramer()
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        yield from framer.feed(chunk)
+
+
+def iter_patches(stream, verify: bool = True, chunk_size: int = 1 << 20):
+    """
+    Iterate over the patches in a binary stream of SysEx messages.
+
+    Only 0x21 read responses are decoded (bulk dumps, read_all() backups,
+    single-message capture files); every other message is skipped.
+
+    Args:
+        stream: Binary file-like object
+        verify: Validate each checksum (default True)
+        chunk_size: Bytes to read per call
+
+    Yields:
+        Tuples of (patch_num, decoded_data)
+
+    Raises:
+        ChecksumError: If verify is set and a checksum does not match
+    """
+    for message in iter_sysex(stream, chunk_size):
+        if isinstance(decode_message(message), ReadResponse):
+            yield parse_read_response(message, verify)
@@ -0,0 +1,325 @@
+"""
+Zoom G9.2tt Content-Addressed Patch Store
+
+Every distinct 128-byte patch is stored once, keyed by a hash of its
+bytes. A bank is stored as the list of its 100 patch keys (and is itself
+keyed by the hash of that list), and a tag is a named, timestamped pointer
+to a bank. Everything lives in one append-only file:
+
+    store = PatchStore("backups.g9s")
+    store.put_bank(device.read_bank(), tag="pedal-1")   # nightly backup
+    bank = store.get_bank("pedal-1")                     # latest backup
+
+Backing up an unchanged bank adds one tag record (about 40 bytes); a bank
+with one edited patch adds that patch and a new key list.
+
+File format: the magic b"G9ST\\x01", then records of a one-byte type and
+a payload:
+
+    b"P"  128 bytes of decoded patch data
+    b"B"  100 x 16-byte patch keys
+    b"T"  16-byte bank key, timestamp (float64 LE), name length (1 byte), name (UTF-8)
+
+Keys are not stored for P and B records; they are recomputed on load.
+
+Several PatchStore objects, in one process or several, may append to the
+same file: each append holds an exclusive flock() and first reads the
+records the others added. Without fcntl (Windows) there is no lock, and
+only one writer per file is supported.
+"""
+
+import hashlib
+import struct
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Union
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from .constants import PATCH_COUNT, PATCH_SIZE_DECODED
+from .bank import PatchBank
+from .patch import Patch
+from .protocol import iter_patches
+from .view import PatchView
+
+MAGIC = b"G9ST\x01"
+KEY_SIZE = 16
+
+_PATCH = b"P"
+_BANK = b"B"
+_TAG = b"T"
+_BANK_SIZE = PATCH_COUNT * KEY_SIZE
+_TAG_HEAD = struct.Struct(f"<{KEY_SIZE}sdB")
+
+
+def patch_key(data: bytes) -> str:
+    """
+    Content key of a decoded patch: BLAKE2b-128 of its 128 bytes, as hex.
+
+    Args:
+        data: 128 bytes of decoded patch data
+
+    Returns:
+        32-character hex string
+    """
+    return hashlib.blake2b(data, digest_size=KEY_SIZE).hexdigest()
+
+
+class Backup(NamedTuple):
+    """One tag record: which bank a name pointed to, and when."""
+
+    tag: str
+    timestamp: float
+    bank: str  # Bank key
+
+
+class PatchStore:
+    """
+    Deduplicated store of patches and banks in a single file.
+
+    Example usage:
+        store = PatchStore("backups.g9s")
+        key = store.put(patch)              # Same key for the same bytes
+        store.get(key).name
+
+        store.put_bank(bank, tag="pedal-1")
+        store.history("pedal-1")            # [Backup(...), ...] oldest first
+        store.get_bank("pedal-1")           # PatchBank of the latest backup
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Open a store, creating the file if it does not exist.
+
+        Args:
+            path: Store file path
+
+        Raises:
+            ValueError: If the file is not a patch store or is corrupt
+        """
+        self.path = Path(path)
+        self._patches: Dict[str, bytes] = {}
+        self._banks: Dict[str, List[str]] = {}
+        self._backups: List[Backup] = []
+        self._size = len(MAGIC)
+
+        with self._locked() as f:
+            data = f.read()
+            if not data:
+                f.write(MAGIC)
+            elif not data.startswith(MAGIC):
+                raise ValueError(f"{self.path}: not a patch store")
+            else:
+                self._load(data[len(MAGIC):], len(MAGIC))
+
+    @contextmanager
+    def _locked(self):
+        """Open the file for reading and appending, holding an exclusive lock."""
+        with open(self.path, "a+b") as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)  # Released when the file is closed
+            f.seek(0)
+            yield f
+
+    def _load(self, data: bytes, offset: int):
+        """Read the records of data, which starts at file offset offset."""
+        pos = 0
+        end = len(data)
+        while pos < end:
+            kind = data[pos:pos + 1]
+            start = pos + 1
+            if kind == _PATCH:
+                pos = start + PATCH_SIZE_DECODED
+                if pos > end:
+                    break
+                chunk = data[start:pos]
+                self._patches[patch_key(chunk)] = chunk
+            elif kind == _BANK:
+                pos = start + _BANK_SIZE
+                if pos > end:
+                    break
+                chunk = data[start:pos]
+                self._banks[patch_key(chunk)] = [
+                    chunk[i:i + KEY_SIZE].hex() for i in range(0, _BANK_SIZE, KEY_SIZE)
+                ]
+            elif kind == _TAG:
+                if start + _TAG_HEAD.size > end:
+                    break
+                bank, timestamp, length = _TAG_HEAD.unpack_from(data, start)
+                pos = start + _TAG_HEAD.size + length
+                if pos > end:
+                    break
+                tag = data[pos - length:pos].decode("utf-8")
+                self._backups.append(Backup(tag, timestamp, bank.hex()))
+            else:
+                raise ValueError(
+                    f"{self.path}: unknown record type {kind!r} at offset {offset + pos}"
+                )
+            self._size = offset + pos
+        # Anything after _size is a record cut short by an interrupted
+        # write; the next append overwrites it.
+
+    def _append(self, records: Iterable[bytes]):
+        with self._locked() as f:
+            f.seek(self._size)
+            self._load(f.read(), self._size)  # Records other writers added
+            f.truncate(self._size)
+            for record in records:
+                f.write(record)
+            self._size = f.tell()
+
+    def __len__(self) -> int:
+        """Number of distinct patches."""
+        return len(self._patches)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._patches
+
+    def keys(self) -> List[str]:
+        """Keys of all distinct patches, in insertion order."""
+        return list(self._patches)
+
+    def put(self, patch: Union[Patch, PatchView, bytes]) -> str:
+        """
+        Store a patch (a no-op if the same bytes are already stored).
+
+        Args:
+            patch: Patch, PatchView or 128 bytes of decoded patch data
+
+        Returns:
+            Patch key
+        """
+        return self.put_many([patch])[0]
+
+    def put_many(self, patches: Iterable[Union[Patch, PatchView, bytes]]) -> List[str]:
+        """
+        Store several patches with one file append.
+
+        Returns:
+            Patch keys, in order
+        """
+        keys = []
+        records = []
+        new = {}
+        for patch in patches:
+            data = self._patch_bytes(patch)
+            key = patch_key(data)
+            if key not in self._patches and key not in new:
+                new[key] = data
+                records.append(_PATCH + data)
+            keys.append(key)
+        if records:
+            self._append(records)
+            self._patches.update(new)
+        return keys
+
+    @staticmethod
+    def _patch_bytes(patch) -> bytes:
+        data = patch.to_bytes() if isinstance(patch, (Patch, PatchView)) else bytes(patch)
+        if len(data) != PATCH_SIZE_DECODED:
+            raise ValueError(f"Expected {PATCH_SIZE_DECODED} bytes, got {len(data)}")
+        return data
+
+    def raw(self, key: str) -> bytes:
+        """
+        Return the 128 bytes stored under a key.
+
+        Raises:
+            KeyError: If no patch has that key
+        """
+        return self._patches[key]
+
+    def get(self, key: str) -> Patch:
+        """Decode the patch stored under a key."""
+        return Patch.from_bytes(self.raw(key))
+
+    def put_bank(
+        self,
+        bank: Union[PatchBank, Iterable[Union[Patch, PatchView, bytes]]],
+        tag: Optional[str] = None,
+        timestamp: Optional[float] = None,
+    ) -> str:
+        """
+        Store a bank: its new patches, its key list, and optionally a tag.
+
+        Args:
+            bank: PatchBank, or 100 patches
+            tag: Name to record this backup under (e.g. "pedal-1")
+            timestamp: Backup time (default: now)
+
+        Returns:
+            Bank key
+        """
+        slots = bank.to_list() if isinstance(bank, PatchBank) else list(bank)
+        if len(slots) != PATCH_COUNT:
+            raise ValueError(f"Expected {PATCH_COUNT} patches, got {len(slots)}")
+
+        keys = self.put_many(slots)
+        key_list = b"".join(bytes.fromhex(key) for key in keys)
+        bank_key = patch_key(key_list)
+
+        records = []
+        if bank_key not in self._banks:
+            records.append(_BANK + key_list)
+        if tag is not None:
+            name = tag.encode("utf-8")
+            if len(name) > 0xFF:
+                raise ValueError(f"Tag too long ({len(name)} bytes, max 255)")
+            backup = Backup(tag, time.time() if timestamp is None else timestamp, bank_key)
+            records.append(_TAG + _TAG_HEAD.pack(bytes.fromhex(bank_key), backup.timestamp, len(name)) + name)
+        if records:
+            self._append(records)
+            self._banks[bank_key] = keys
+            if tag is not None:
+                self._backups.append(backup)
+        return bank_key
+
+    def get_bank(self, key: str) -> PatchBank:
+        """
+        Rebuild a bank from its bank key or a tag (latest backup).
+
+        Raises:
+            KeyError: If no bank or tag matches
+        """
+        if key not in self._banks:
+            history = self.history(key)
+            if not history:
+                raise KeyError(key)
+            key = history[-1].bank
+        return PatchBank(b"".join(self._patches[k] for k in self._banks[key]))
+
+    def bank_keys(self, key: str) -> List[str]:
+        """The 100 patch keys of a bank."""
+        return list(self._banks[key])
+
+    def tags(self) -> Dict[str, Backup]:
+        """Latest backup of every tag."""
+        return {backup.tag: backup for backup in self._backups}
+
+    def history(self, tag: Optional[str] = None) -> List[Backup]:
+        """All backups (of one tag, if given), oldest first."""
+        return [b for b in self._backups if tag is None or b.tag == tag]
+
+    def import_syx(self, path: Union[str, Path]) -> List[str]:
+        """
+        Store every patch found in a .syx file (0x21 read responses).
+
+        Works on bulk dumps and on single-message capture files alike;
+        messages that are not read responses are skipped.
+
+        Args:
+            path: .syx file
+
+        Returns:
+            Patch keys, in file order
+        """
+        with open(path, "rb") as f:
+            return self.put_many(data for _, data in iter_patches(f))
+
+    def __repr__(self):
+        return (f"PatchStore({str(self.path)!r}, {len(self._patches)} patches, "
+                f"{len(self._banks)} banks, {len(self._backups)} backups)")
@@ -0,0 +1,287 @@
+"""
+Zoom G9.2tt Real-Time Parameter Stream
+
+Rate-limited, coalescing sender for 0x31 parameter changes. A UI slider or
+an expression-pedal automation can call set() as often as it likes; only
+the latest value per (effect_id, param_id) is kept, and a background
+thread sends at most max_rate messages per second so the 31.25 kbaud DIN
+link (about 3.2 ms per 10-byte message) never backs up.
+
+Example usage:
+    with ParameterStream(device, max_rate=100) as stream:
+        for value in range(0, 101):
+            stream.set("amp", "gain", value)   # Never blocks
+        stream.set("dly", "on", 0)             # Sent before pending knobs
+    print(stream.stats())
+"""
+
+import threading
+import time
+from typing import Optional, Tuple, Union
+
+from .addressing import ParamHandle, resolve_parameter
+from .constants import CMD_PARAM_CHANGE
+from .device import G9Device
+from .protocol import SysexTemplate
+
+# On/off parameter ID; toggles are sent before continuous parameters
+PARAM_ON = 0x00
+
+
+class ParameterStream:
+    """
+    Coalescing, rate-limited stream of real-time parameter changes.
+
+    Pending changes are sent oldest first, except that on/off toggles
+    always go before continuous parameters. A newer value for a parameter
+    that is still pending replaces the old one in place (coalesced); a value
+    equal to the last one sent, or being sent, is not sent again (dropped).
+    Use select_patch() to change patches while streaming, and call
+    invalidate() after changing parameters any other way (set_parameter(),
+    the knobs on the pedal) so that values sent before are sent again.
+
+    The stream fills its own 0x31 message buffer and sends it through the
+    device from its own thread; avoid switching device modes while it is
+    running.
+
+    Attributes:
+        submitted: Values passed to set()
+        sent: 0x31 messages sent
+        coalesced: Pending values replaced by a newer value
+        dropped: Values discarded because they were already sent
+    """
+
+    def __init__(self, device: G9Device, max_rate: float = 100.0):
+        """
+        Args:
+            device: Connected G9Device
+            max_rate: Maximum messages per second (the DIN link tops out
+                      at about 300 messages/s)
+        """
+        if max_rate <= 0:
+            raise ValueError(f"max_rate must be positive, got {max_rate}")
+
+        self.device = device
+        self.max_rate = max_rate
+        self.submitted = 0
+        self.sent = 0
+        self.coalesced = 0
+        self.dropped = 0
+
+        self._pending = {}  # (effect_id, param_id) -> value, oldest first
+        self._last_sent = {}  # Value sent, or being sent, per key
+        self._param_msg = SysexTemplate(CMD_PARAM_CHANGE, 4)  # Sender thread only
+        self._sending = False  # A popped value is being sent
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._thread = None
+        self._running = False
+        self._error = None
+
+    @property
+    def pending(self) -> int:
+        """Number of parameters waiting to be sent."""
+        return len(self._pending)
+
+    def start(self):
+        """Start the sender thread."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._running = True
+            self._error = None
+            self._thread = threading.Thread(
+                target=self._run, name="ParameterStream", daemon=True
+            )
+        self._thread.start()
+
+    def stop(self, flush: bool = True, timeout: Optional[float] = None):
+        """
+        Stop the sender thread.
+
+        Args:
+            flush: Send pending changes first (still rate-limited)
+            timeout: Maximum seconds to wait for the flush
+        """
+        if flush:
+            self.flush(timeout)
+
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+            self._running = False
+            self._wakeup.notify_all()
+        if thread is not None:
+            thread.join()
+
+    def set(
+        self,
+        effect: str,
+        param: str,
+        value: int,
+        effect_type: Optional[Union[int, str]] = None,
+    ):
+        """
+        Queue a parameter change (returns immediately).
+
+        Args:
+            effect: Effect name (amp, delay, reverb, etc.)
+            param: Parameter name (gain, time, mix, etc.)
+            value: New value
+            effect_type: Current type of the effect (number or name)
+
+        Raises:
+            ValueError: If effect/param not found or value out of range
+        """
+        self.set_value(resolve_parameter(effect, param, effect_type), value)
+
+    def set_value(self, handle: ParamHandle, value: int):
+        """
+        Queue a parameter change through a precomputed handle.
+
+        Raises:
+            ValueError: If value is out of range
+        """
+        handle.check(value)
+        self.set_raw(handle.effect_id, handle.param_id, value)
+
+    def set_raw(self, effect_id: int, param_id: int, value: int):
+        """Queue a parameter change by ID (no validation)."""
+        key = (effect_id, param_id)
+        with self._lock:
+            if self._error is not None:
+                raise self._error
+            self.submitted += 1
+            if key in self._pending:
+                self.coalesced += 1
+                if self._last_sent.get(key) == value:
+                    # Back to the value the pedal already has
+                    del self._pending[key]
+                    self._wakeup.notify_all()
+                else:
+                    self._pending[key] = value
+            elif self._last_sent.get(key) == value:
+                self.dropped += 1
+            else:
+                self._pending[key] = value
+                self._wakeup.notify_all()
+
+    def invalidate(self, key: Optional[Tuple[int, int]] = None):
+        """
+        Forget the values sent so far, so the next set() of each is sent.
+
+        Args:
+            key: (effect_id, param_id) to forget (default: all parameters)
+        """
+        with self._lock:
+            if key is None:
+                self._last_sent.clear()
+            else:
+                self._last_sent.pop(key, None)
+
+    def select_patch(self, patch_num: int):
+        """
+        Select a patch on the device (Program Change).
+
+        Changes still pending are discarded, since they were meant for the
+        previous patch, and the values sent so far are forgotten.
+
+        Args:
+            patch_num: Patch number (0-99)
+        """
+        with self._lock:
+            self.device.select_patch(patch_num)
+            self._pending.clear()
+            self._last_sent.clear()
+            self._wakeup.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until all pending changes have been sent.
+
+        Args:
+            timeout: Maximum seconds to wait (None = no limit)
+
+        Returns:
+            True if nothing is pending anymore
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            while (self._pending or self._sending) and self._running and self._error is None:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    break
+                self._wakeup.wait(remaining)
+            if self._error is not None:
+                raise self._error
+            return not self._pending
+
+    def stats(self) -> dict:
+        """Return the counters as a dictionary."""
+        with self._lock:
+            return {
+                "submitted": self.submitted,
+                "sent": self.sent,
+                "coalesced": self.coalesced,
+                "dropped": self.dropped,
+                "pending": len(self._pending),
+            }
+
+    def _next_key(self):
+        """Oldest pending toggle, else oldest pending parameter (lock held)."""
+        for key in self._pending:
+            if key[1] == PARAM_ON:
+                return key
+        return next(iter(self._pending))
+
+    def _run(self):
+        """Sender thread: one message per 1/max_rate seconds at most."""
+        next_time = 0.0
+        while True:
+            with self._lock:
+                while self._running and not self._pending:
+                    self._wakeup.wait()
+                if not self._running:
+                    return
+
+            # Wait for the next slot outside the lock so set() never blocks
+            delay = next_time - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+            with self._lock:
+                if not self._running or not self._pending:
+                    continue
+                key = self._next_key()
+                value = self._pending.pop(key)
+                # Set before sending so set() drops repeats of the value in flight
+                self._last_sent[key] = value
+                self._sending = True
+
+            try:
+                self.device.send_param_message(
+                    self._param_msg.fill(key[0], key[1], value & 0x7F, value >> 7)
+                )
+            except Exception as e:
+                with self._lock:
+                    self._sending = False
+                    self._error = e
+                    self._running = False
+                    self._wakeup.notify_all()
+                return
+
+            next_time = time.monotonic() + 1.0 / self.max_rate
+            with self._lock:
+                self.sent += 1
+                self._sending = False
+                self._wakeup.notify_all()
+
+    def __enter__(self):
+        """Context manager entry: start the sender thread."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit: flush and stop."""
+        self.stop(flush=exc_type is None)
+        return False
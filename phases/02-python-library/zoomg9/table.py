@@ -0,0 +1,222 @@
+"""
+Zoom G9.2tt Columnar Patch Table
+
+PatchTable holds any number of patches as a NumPy structured array: one
+row per patch, one column per BIT_TBL / DIRECT_OFFSETS field, named like
+the PatchView fields ("level", "amp_a.gain", "delay.time", ...). The table
+is built by unpacking every field for all rows at once from a stacked
+(N, 128) buffer, so queries over thousands of patches are boolean masks
+instead of Python loops:
+
+    table = PatchTable.from_banks(bank_a, bank_b)
+    hits = table.where((table["amp.type"] == 12) & (table["amp.gain"] > 80))
+    print(hits.names())
+    print(table.stats("delay.time"))
+
+"amp.", "znr." and "eq." columns follow each patch's amp_sel, like
+Patch.amp. Requires NumPy (pip install zoomg9[fast]).
+"""
+
+from typing import Dict, Iterable, List, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .constants import PATCH_SIZE_DECODED, PATCH_NAME_LENGTH, DIRECT_OFFSETS
+from .patch import Patch
+from .view import PatchView, _FIELDS, _BitField, _BitFlag, _ByteFlag
+
+_NAME_START = DIRECT_OFFSETS["Name"]
+
+# Selected-channel columns: prefix -> (channel A module, channel B module)
+_SELECTED = {"amp": ("amp_a", "amp_b"), "znr": ("znr_a", "znr_b"), "eq": ("eq_a", "eq_b")}
+
+
+def _dtype():
+    """Row type: one column per field, plus the 10-byte name."""
+    columns = []
+    for field in _FIELDS:
+        # On/off flags are bool like in PatchView, bit or whole byte alike.
+        # Others are sized by what the stored bits can hold, not the
+        # nominal range: captured patches do carry out-of-range values
+        widest = field.mask if isinstance(field, _BitField) else 0xFF + field.bias
+        if isinstance(field, (_BitFlag, _ByteFlag)):
+            kind = np.bool_
+        elif widest <= 0xFF:
+            kind = np.uint8
+        else:
+            kind = np.uint16
+        columns.append((field.label, kind))
+    columns.append(("name", f"S{PATCH_NAME_LENGTH}"))
+    return np.dtype(columns)
+
+
+def _unpack(raw) -> "np.ndarray":
+    """Unpack every field of an (N, 128) uint8 array into structured rows."""
+    rows = np.empty(len(raw), dtype=_dtype())
+    for field in _FIELDS:
+        if isinstance(field, _BitField):
+            # Little-endian word over the 1-3 bytes the field spans
+            word = raw[:, field.start].astype(np.uint32)
+            for i in range(1, field.end - field.start):
+                word |= raw[:, field.start + i].astype(np.uint32) << (8 * i)
+            values = (word >> field.shift) & field.mask
+        else:
+            values = raw[:, field.offset].astype(np.uint16) + field.bias
+        rows[field.label] = values
+    rows["name"] = raw[:, _NAME_START:_NAME_START + PATCH_NAME_LENGTH].copy().view(
+        f"S{PATCH_NAME_LENGTH}"
+    ).ravel()
+    return rows
+
+
+class PatchTable:
+    """
+    Columnar table of decoded patch parameters.
+
+    Attributes:
+        rows: Structured array, one row per patch (see columns)
+        raw: (N, 128) uint8 array of the patch data
+    """
+
+    def __init__(self, data):
+        """
+        Build a table from stacked patch data.
+
+        Args:
+            data: N * 128 bytes of decoded patches (bytes, memoryview or a
+                  uint8 NumPy array of N * 128 or (N, 128))
+
+        Raises:
+            ImportError: If NumPy is not installed
+            ValueError: If the data is not a whole number of patches
+        """
+        if np is None:
+            raise ImportError("PatchTable requires NumPy (pip install zoomg9[fast])")
+
+        if isinstance(data, np.ndarray):
+            raw = np.ascontiguousarray(data, dtype=np.uint8).reshape(-1)
+        else:
+            raw = np.frombuffer(data, dtype=np.uint8)
+        if raw.size % PATCH_SIZE_DECODED:
+            raise ValueError(f"Expected a multiple of {PATCH_SIZE_DECODED} bytes, got {raw.size}")
+
+        self.raw = raw.reshape(-1, PATCH_SIZE_DECODED)
+        self.rows = _unpack(self.raw)
+
+    @classmethod
+    def from_patches(cls, patches: Iterable[Union[Patch, PatchView, bytes]]) -> "PatchTable":
+        """Build a table from Patch objects, PatchViews or raw 128-byte patches."""
+        return cls(b"".join(
+            p.to_bytes() if isinstance(p, (Patch, PatchView)) else bytes(p) for p in patches
+        ))
+
+    @classmethod
+    def from_banks(cls, *banks) -> "PatchTable":
+        """
+        Build a table from PatchBanks (100 rows each, in order).
+
+        Row i is patch i % 100 of bank i // 100.
+        """
+        return cls(b"".join(bank.to_bytes() for bank in banks))
+
+    @property
+    def columns(self) -> List[str]:
+        """Column names."""
+        return list(self.rows.dtype.names)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __getitem__(self, column: str) -> "np.ndarray":
+        """
+        Return one column as an array.
+
+        "amp.<field>", "znr.<field>" and "eq.<field>" pick channel A or B
+        per row from amp_sel.
+        """
+        prefix, sep, field = column.partition(".")
+        if sep and prefix in _SELECTED:
+            a, b = _SELECTED[prefix]
+            return np.where(self.rows["amp_sel"] == 0, self.rows[f"{a}.{field}"],
+                            self.rows[f"{b}.{field}"])
+        return self.rows[column]
+
+    def where(self, mask) -> "PatchTable":
+        """
+        Return the rows selected by a boolean mask (or index array).
+
+        Example:
+            table.where(table["delay.on"] & (table["delay.time"] > 1000))
+        """
+        subset = PatchTable.__new__(PatchTable)
+        subset.raw = self.raw[mask]
+        subset.rows = self.rows[mask]
+        return subset
+
+    def indices(self, mask) -> "np.ndarray":
+        """Row numbers where a boolean mask is set."""
+        return np.flatnonzero(mask)
+
+    def names(self) -> List[str]:
+        """Patch names of all rows."""
+        return [
+            name.decode("ascii", errors="replace").rstrip(" \x00")
+            for name in self.rows["name"].tolist()
+        ]
+
+    def view(self, row: int) -> PatchView:
+        """Read-only PatchView of one row."""
+        return PatchView(memoryview(self.raw[row]).toreadonly())
+
+    def patch(self, row: int) -> Patch:
+        """Decode one row into a Patch."""
+        return Patch.from_bytes(self.raw[row].tobytes())
+
+    def stats(self, column: str, mask=None) -> Dict[str, float]:
+        """
+        Aggregate statistics of one column.
+
+        Args:
+            column: Column name (see __getitem__)
+            mask: Optional boolean mask of the rows to include
+
+        Returns:
+            Dictionary with count, min, max, mean and std
+        """
+        values = self[column]
+        if mask is not None:
+            values = values[mask]
+        if not len(values):
+            return {"count": 0, "min": None, "max": None, "mean": None, "std": None}
+        values = values.astype(np.float64)
+        return {
+            "count": int(values.size),
+            "min": float(values.min()),
+            "max": float(values.max()),
+            "mean": float(values.mean()),
+            "std": float(values.std()),
+        }
+
+    def value_counts(self, column: str, mask=None) -> Dict[int, int]:
+        """
+        Number of rows per distinct value of a column, most common first.
+
+        Args:
+            column: Column name (e.g. "amp.type")
+            mask: Optional boolean mask of the rows to include
+
+        Returns:
+            Dictionary of value -> count
+        """
+        values = self[column]
+        if mask is not None:
+            values = values[mask]
+        unique, counts = np.unique(values, return_counts=True)
+        order = np.argsort(-counts, kind="stable")
+        return {unique[i].item(): int(counts[i]) for i in order}
+
+    def __repr__(self):
+        return f"PatchTable({len(self)} patches, {len(self.rows.dtype.names)} columns)"
@@ -0,0 +1,125 @@
+"""
+Zoom G9.2tt MIDI Transports
+
+A transport is the byte-level link between a device class (G9Device,
+AsyncG9Device) and a pedal: it sends complete MIDI messages and reports
+every SysEx message received through a callback. MidoTransport talks to a
+real MIDI port; zoomg9.emulator.VirtualG9 is an in-process pedal.
+"""
+
+from typing import Callable, Optional
+
+try:
+    import mido
+except ImportError:
+    mido = None
+
+
+class Transport:
+    """
+    Base class for MIDI transports.
+
+    Subclasses implement open(), close() and send(). The callback given to
+    open() is called with each received SysEx message as bytes (F0...F7),
+    possibly from another thread.
+    """
+
+    def open(self, callback: Callable[[bytes], None]):
+        """
+        Open the link and start delivering SysEx messages to callback.
+
+        Args:
+            callback: Called with each received SysEx message (bytes)
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """Close the link. No callbacks are made after this returns."""
+        raise NotImplementedError
+
+    def send(self, data: bytes):
+        """
+        Send one complete MIDI message.
+
+        Args:
+            data: Message bytes (bytes, bytearray or memoryview), e.g.
+                  F0 ... F7 for SysEx or C0 nn for Program Change
+        """
+        raise NotImplementedError
+
+
+class MidoTransport(Transport):
+    """Transport over a mido MIDI port pair (input and output with one name)."""
+
+    def __init__(self, port_name: str):
+        """
+        Args:
+            port_name: MIDI port name (same name for input and output)
+        """
+        if mido is None:
+            raise ImportError(
+                "mido is required for MIDI communication. "
+                "Install with: pip install mido python-rtmidi"
+            )
+
+        self.port_name = port_name
+        self._inport = None
+        self._outport = None
+        self._raw_send = None
+        self._callback = None
+
+    def open(self, callback: Callable[[bytes], None]):
+        """Open the output and input ports."""
+        self._callback = callback
+        self._outport = mido.open_output(self.port_name)
+        try:
+            self._inport = mido.open_input(self.port_name, callback=self._on_message)
+        except Exception:
+            self._outport.close()
+            self._outport = None
+            raise
+        self._raw_send = self._find_raw_send(self._outport)
+
+    def close(self):
+        """Close both ports."""
+        if self._outport:
+            self._outport.close()
+            self._outport = None
+        self._raw_send = None
+
+        if self._inport:
+            self._inport.close()
+            self._inport = None
+
+    @staticmethod
+    def _find_raw_send(port) -> Optional[Callable]:
+        """
+        Return the backend's raw send function for a mido output port.
+
+        With the python-rtmidi backend, complete messages (F0...F7) can be
+        handed to rtmidi as bytes, skipping mido.Message construction.
+        Returns None for other backends.
+        """
+        return getattr(getattr(port, "_rt", None), "send_message", None)
+
+    def send(self, data: bytes):
+        """Send a message, straight to rtmidi when available."""
+        if self._raw_send is not None:
+            self._raw_send(data)
+            return
+
+        if data[0] != 0xF0:
+            self._outport.send(mido.Message.from_bytes(bytes(data)))
+            return
+
+        # mido expects data without F0/F7
+        view = memoryview(data)[1:]
+        if view[-1] == 0xF7:
+            view = view[:-1]
+
+        self._outport.send(mido.Message("sysex", data=view))
+
+    def _on_message(self, msg):
+        """Input callback (runs on the MIDI backend thread)."""
+        if msg.type == "sysex":
+            self._callback(bytes(msg.bin()))
@@ -0,0 +1,442 @@
+"""
+Zoom G9.2tt Lazy Patch Views
+
+PatchView reads and writes a patch directly in its 128-byte buffer instead
+of decoding it into a Patch. Every field is a descriptor generated from
+BIT_TBL (via the compiled BIT_FIELDS) or DIRECT_OFFSETS that touches only
+the one to three bytes holding that field, so listing names or searching a
+bank for an amp type decodes a few bytes per patch, not the whole layout.
+
+The attribute names mirror Patch and the effect modules:
+
+    view = PatchView(data)          # bytearray: writes go into data
+    view.name                       # 10 bytes decoded, nothing else
+    view.amp_a.gain = 80            # Read-modify-write of one packed field
+    view.delay.time                 # 13-bit field spanning two bytes
+"""
+
+from typing import Dict, List, Tuple, Union
+
+from .constants import (
+    PATCH_SIZE_DECODED,
+    PATCH_NAME_LENGTH,
+    DIRECT_OFFSETS,
+    EFFECT_TOP,
+    PARAM_RANGES,
+)
+from .encoding import BIT_FIELDS
+from .effects import (
+    AmpModule,
+    CmpModule,
+    WahModule,
+    ExtModule,
+    ZnrModule,
+    EqModule,
+    CabModule,
+    ModModule,
+    DlyModule,
+    RevModule,
+)
+from .patch import Patch
+
+# Attribute of each BIT_TBL field, in BIT_FIELDS order:
+# (module, attribute, 0x31 param ID for the range check or None)
+_PACKED_NAMES = (
+    ("patch", "level", 0x05),
+    ("comp", "on", 0x00), ("comp", "type", 0x01), ("comp", "sense", 0x02),
+    ("comp", "attack", 0x03), ("comp", "tone", 0x04), ("comp", "level", 0x05),
+    ("wah", "on", 0x00), ("wah", "type", 0x01), ("wah", "position", 0x02),
+    ("wah", "sense", 0x03), ("wah", "resonance", 0x04), ("wah", "level", 0x05),
+    ("ext", "on", 0x00), ("ext", "send", 0x02), ("ext", "return_", 0x03),
+    ("ext", "dry", 0x04),
+    ("znr_a", "on", 0x00), ("znr_a", "type", 0x01), ("znr_a", "threshold", 0x02),
+    ("amp_a", "on", 0x00), ("amp_a", "type", 0x01), ("amp_a", "gain", 0x02),
+    ("amp_a", "tone", 0x03), ("amp_a", "level", 0x04), ("amp_a", "ext", None),
+    ("eq_a", "on", 0x00), ("eq_a", "band1", 0x02), ("eq_a", "band2", 0x03),
+    ("eq_a", "band3", 0x04), ("eq_a", "band4", 0x05), ("eq_a", "band5", 0x06),
+    ("eq_a", "band6", 0x07),
+    ("cab", "on", 0x00), ("cab", "depth", 0x02), ("cab", "mic_type", 0x03),
+    ("cab", "mic_pos", 0x04),
+    ("mod", "on", 0x00), ("mod", "type", 0x01), ("mod", "depth", 0x02),
+    ("mod", "rate", 0x03), ("mod", "tone", 0x04), ("mod", "mix", 0x05),
+    ("delay", "on", 0x00), ("delay", "type", 0x01), ("delay", "time", 0x02),
+    ("delay", "feedback", 0x03), ("delay", "hidamp", 0x04), ("delay", "mix", 0x05),
+    ("reverb", "on", 0x00), ("reverb", "type", 0x01), ("reverb", "decay", 0x02),
+    ("reverb", "predelay", 0x03), ("reverb", "tone", 0x04), ("reverb", "mix", 0x05),
+)
+
+# Attribute of each single-byte DIRECT_OFFSETS field (Channel B modules)
+_DIRECT_NAMES = {
+    "ZnrB_onoff": ("znr_b", "on", 0x00),
+    "ZnrB_type": ("znr_b", "type", 0x01),
+    "ZnrB_parm1": ("znr_b", "threshold", 0x02),
+    "AmpB_onoff": ("amp_b", "on", 0x00),
+    "AmpB_type": ("amp_b", "type", 0x01),
+    "AmpB_parm1": ("amp_b", "gain", 0x02),
+    "AmpB_parm2": ("amp_b", "tone", 0x03),
+    "AmpB_parm3": ("amp_b", "level", 0x04),
+    "AmpB_parm4": ("amp_b", "ext", None),
+    "EqB_onoff": ("eq_b", "on", 0x00),
+    "EqB_parm1": ("eq_b", "band1", 0x02),
+    "EqB_parm2": ("eq_b", "band2", 0x03),
+    "EqB_parm3": ("eq_b", "band3", 0x04),
+    "EqB_parm4": ("eq_b", "band4", 0x05),
+    "EqB_parm5": ("eq_b", "band5", 0x06),
+    "EqB_parm6": ("eq_b", "band6", 0x07),
+}
+
+# Effect module class of each module view (effect ID and type names)
+_MODULE_CLASSES = {
+    "comp": CmpModule,
+    "wah": WahModule,
+    "ext": ExtModule,
+    "znr_a": ZnrModule,
+    "znr_b": ZnrModule,
+    "amp_a": AmpModule,
+    "amp_b": AmpModule,
+    "eq_a": EqModule,
+    "eq_b": EqModule,
+    "cab": CabModule,
+    "mod": ModModule,
+    "delay": DlyModule,
+    "reverb": RevModule,
+}
+
+_NAME_START = DIRECT_OFFSETS["Name"]
+_TEMPO_OFFSET = DIRECT_OFFSETS["Tempo_raw"]
+
+
+class _Field:
+    """
+    Descriptor for one integer field stored in the view's buffer.
+
+    address is the (effect_id, param_id) of the 0x31 parameter change
+    that sets the field live, or None if there is none.
+    """
+
+    __slots__ = ("label", "min_val", "max_val", "address")
+
+    def __init__(self, label: str, min_val: int, max_val: int, address=None):
+        self.label = label
+        self.min_val = min_val
+        self.max_val = max_val
+        self.address = address
+
+    def check(self, value: int):
+        if not self.min_val <= value <= self.max_val:
+            raise ValueError(
+                f"{self.label} must be {self.min_val}-{self.max_val}, got {value}"
+            )
+
+
+class _BitField(_Field):
+    """A BIT_TBL field: shift and mask over the 1-3 bytes it spans."""
+
+    __slots__ = ("start", "end", "shift", "mask")
+
+    def __init__(self, label, min_val, max_val, byte_offset, shift, mask, spill):
+        super().__init__(label, min_val, min(max_val, mask))
+        self.start = byte_offset
+        self.end = byte_offset + spill + 1
+        self.shift = shift
+        self.mask = mask
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        return int.from_bytes(obj._buf[self.start:self.end], "little") >> self.shift & self.mask
+
+    def __set__(self, obj, value: int):
+        self.check(value)
+        buf = obj._buf
+        word = int.from_bytes(buf[self.start:self.end], "little")
+        word = word & ~(self.mask << self.shift) | value << self.shift
+        buf[self.start:self.end] = word.to_bytes(self.end - self.start, "little")
+
+
+class _BitFlag(_BitField):
+    """A 1-bit on/off BIT_TBL field, as bool."""
+
+    __slots__ = ()
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        return bool(obj._buf[self.start] >> self.shift & 1)
+
+    def __set__(self, obj, value):
+        super().__set__(obj, int(bool(value)))
+
+
+class _ByteField(_Field):
+    """A DIRECT_OFFSETS field stored as one byte, plus a display bias."""
+
+    __slots__ = ("offset", "bias")
+
+    def __init__(self, label, min_val, max_val, offset, bias=0):
+        super().__init__(label, min_val, max_val)
+        self.offset = offset
+        self.bias = bias
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        return obj._buf[self.offset] + self.bias
+
+    def __set__(self, obj, value: int):
+        self.check(value)
+        obj._buf[self.offset] = value - self.bias
+
+
+class _ByteFlag(_ByteField):
+    """An on/off DIRECT_OFFSETS byte, as bool."""
+
+    __slots__ = ()
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        return bool(obj._buf[self.offset])
+
+    def __set__(self, obj, value):
+        super().__set__(obj, int(bool(value)))
+
+
+class _ModuleField:
+    """Descriptor returning a module view over the same buffer."""
+
+    __slots__ = ("view_class",)
+
+    def __init__(self, view_class: type):
+        self.view_class = view_class
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        return self.view_class(obj._buf)
+
+
+def _range(effect_id: int, param_id, mask: int) -> Tuple[int, int]:
+    """Valid range of a field: PARAM_RANGES if known, else what fits."""
+    return PARAM_RANGES.get(effect_id, {}).get(param_id, (0, mask))
+
+
+class ModuleView:
+    """
+    One effect module of a PatchView.
+
+    Fields are read from and written to the patch buffer on access.
+    """
+
+    __slots__ = ("_buf",)
+
+    effect_id = None
+    type_names = {}
+    type = 0
+    fields: Tuple[str, ...] = ()
+
+    def __init__(self, buf: memoryview):
+        self._buf = buf
+
+    @property
+    def type_name(self) -> str:
+        """Human-readable name of the current type."""
+        return self.type_names.get(self.type, f"Unknown ({self.type})")
+
+    def to_dict(self) -> Dict[str, int]:
+        """All fields of the module."""
+        return {name: getattr(self, name) for name in self.fields}
+
+    def __repr__(self):
+        values = ", ".join(f"{name}={getattr(self, name)}" for name in self.fields)
+        return f"{self.__class__.__name__}({values})"
+
+
+class EqView(ModuleView):
+    """EQ module view, with the six bands also available as a list."""
+
+    __slots__ = ()
+
+    @property
+    def bands(self) -> List[int]:
+        """Band values 1-6 (0-31 each)."""
+        return [getattr(self, f"band{band}") for band in range(1, 7)]
+
+    @bands.setter
+    def bands(self, values: List[int]):
+        if len(values) != 6:
+            raise ValueError("EQ requires exactly 6 band values")
+        for band, value in enumerate(values, 1):
+            setattr(self, f"band{band}", value)
+
+
+def _build_module_views() -> Dict[str, type]:
+    """Generate one ModuleView subclass per module from the layout tables."""
+    if len(_PACKED_NAMES) != len(BIT_FIELDS):
+        raise RuntimeError("_PACKED_NAMES does not match BIT_TBL")
+
+    fields: Dict[str, Dict[str, _Field]] = {module: {} for module in _MODULE_CLASSES}
+
+    for (module, attr, param_id), (_, _, byte_offset, shift, mask, spill) in zip(
+        _PACKED_NAMES, BIT_FIELDS
+    ):
+        if module == "patch":
+            continue
+        effect_id = _MODULE_CLASSES[module].effect_id
+        min_val, max_val = _range(effect_id, param_id, mask)
+        cls = _BitFlag if attr == "on" else _BitField
+        field = cls(f"{module}.{attr}", min_val, max_val, byte_offset, shift, mask, spill)
+        if param_id is not None:
+            field.address = (effect_id, param_id)
+        fields[module][attr] = field
+
+    for key, (module, attr, param_id) in _DIRECT_NAMES.items():
+        effect_id = _MODULE_CLASSES[module].effect_id
+        min_val, max_val = _range(effect_id, param_id, 0xFF)
+        cls = _ByteFlag if attr == "on" else _ByteField
+        field = cls(f"{module}.{attr}", min_val, max_val, DIRECT_OFFSETS[key])
+        if param_id is not None:
+            field.address = (effect_id, param_id)
+        fields[module][attr] = field
+
+    views = {}
+    for module, module_fields in fields.items():
+        module_class = _MODULE_CLASSES[module]
+        base = EqView if module_class is EqModule else ModuleView
+        namespace = dict(module_fields)
+        namespace.update(
+            __slots__=(),
+            effect_id=module_class.effect_id,
+            type_names=module_class.type_names,
+            fields=tuple(module_fields),
+        )
+        name = module_class.__name__.replace("Module", "View")
+        views[module] = type(name, (base,), namespace)
+    return views
+
+
+_MODULE_VIEWS = _build_module_views()
+
+
+def _patch_level_field() -> _BitField:
+    index = next(i for i, entry in enumerate(_PACKED_NAMES) if entry[0] == "patch")
+    _, _, byte_offset, shift, mask, spill = BIT_FIELDS[index]
+    param_id = _PACKED_NAMES[index][2]
+    min_val, max_val = _range(EFFECT_TOP, param_id, mask)
+    field = _BitField("level", min_val, max_val, byte_offset, shift, mask, spill)
+    field.address = (EFFECT_TOP, param_id)
+    return field
+
+
+class PatchView:
+    """
+    Lazy, in-place view of a 128-byte patch buffer.
+
+    Nothing is decoded up front: each attribute access decodes only the
+    bytes of that field, and each assignment writes them back into the
+    buffer. Views over bytes (or a read-only memoryview) are read-only;
+    assignments raise TypeError.
+
+    Example usage:
+        data = bytearray(device.read_patch(0).to_bytes())
+        view = PatchView(data)
+        if view.amp_a.type_name == "MS Drive":
+            view.amp_a.gain = 90        # data is modified in place
+        device.write_patch(0, view.to_patch())
+    """
+
+    __slots__ = ("_buf",)
+
+    level = _patch_level_field()
+    amp_sel = _ByteField("amp_sel", 0, 1, DIRECT_OFFSETS["AmpSel"])
+    tempo = _ByteField("tempo", 40, 250, _TEMPO_OFFSET, bias=40)
+
+    # Effect modules - Channel A (bit-packed) and Channel B (direct offsets)
+    comp = _ModuleField(_MODULE_VIEWS["comp"])
+    wah = _ModuleField(_MODULE_VIEWS["wah"])
+    ext = _ModuleField(_MODULE_VIEWS["ext"])
+    znr_a = _ModuleField(_MODULE_VIEWS["znr_a"])
+    amp_a = _ModuleField(_MODULE_VIEWS["amp_a"])
+    eq_a = _ModuleField(_MODULE_VIEWS["eq_a"])
+    cab = _ModuleField(_MODULE_VIEWS["cab"])
+    mod = _ModuleField(_MODULE_VIEWS["mod"])
+    delay = _ModuleField(_MODULE_VIEWS["delay"])
+    reverb = _ModuleField(_MODULE_VIEWS["reverb"])
+    znr_b = _ModuleField(_MODULE_VIEWS["znr_b"])
+    amp_b = _ModuleField(_MODULE_VIEWS["amp_b"])
+    eq_b = _ModuleField(_MODULE_VIEWS["eq_b"])
+
+    def __init__(self, data: Union[bytes, bytearray, memoryview]):
+        """
+        Create a view over existing patch data (not copied).
+
+        Args:
+            data: 128 bytes of decoded patch data. Pass a bytearray (or a
+                  writable memoryview, e.g. a slice of a larger buffer) to
+                  allow writes.
+        """
+        buf = memoryview(data).cast("B")
+        if len(buf) != PATCH_SIZE_DECODED:
+            raise ValueError(f"Expected {PATCH_SIZE_DECODED} bytes, got {len(buf)}")
+        self._buf = buf
+
+    @property
+    def readonly(self) -> bool:
+        """Whether the underlying buffer is read-only."""
+        return self._buf.readonly
+
+    @property
+    def name(self) -> str:
+        """Patch name (max 10 characters)."""
+        raw = bytes(self._buf[_NAME_START:_NAME_START + PATCH_NAME_LENGTH])
+        return raw.decode("ascii", errors="replace").rstrip(" \x00")
+
+    @name.setter
+    def name(self, value: str):
+        padded = value[:PATCH_NAME_LENGTH].ljust(PATCH_NAME_LENGTH)
+        self._buf[_NAME_START:_NAME_START + PATCH_NAME_LENGTH] = padded.encode(
+            "ascii", errors="replace"
+        )
+
+    @property
+    def pedal_func(self) -> Tuple[int, int]:
+        """Raw expression pedal assignment bytes."""
+        return (self._buf[DIRECT_OFFSETS["PedalFunc0"]], self._buf[DIRECT_OFFSETS["PedalFunc1"]])
+
+    @property
+    def amp(self) -> ModuleView:
+        """Currently selected amp module (A or B)."""
+        return self.amp_a if self.amp_sel == 0 else self.amp_b
+
+    @property
+    def znr(self) -> ModuleView:
+        """Currently selected ZNR module (A or B)."""
+        return self.znr_a if self.amp_sel == 0 else self.znr_b
+
+    @property
+    def eq(self) -> EqView:
+        """Currently selected EQ module (A or B)."""
+        return self.eq_a if self.amp_sel == 0 else self.eq_b
+
+    def to_bytes(self) -> bytes:
+        """Copy of the 128-byte buffer (unknown bytes included)."""
+        return self._buf.tobytes()
+
+    def to_patch(self) -> Patch:
+        """Decode the whole patch into a Patch."""
+        return Patch.from_bytes(self._buf.tobytes())
+
+    def __repr__(self):
+        return (
+            f"PatchView(name='{self.name}', level={self.level}, tempo={self.tempo}, "
+            f"amp_sel={'A' if self.amp_sel == 0 else 'B'})"
+        )
+
+
+# Integer field descriptors: global fields, then every module field in
+# layout order. They only read obj._buf, so they work on a PatchView.
+_FIELDS = (PatchView.level, PatchView.amp_sel, PatchView.tempo) + tuple(
+    getattr(view_class, attr)
+    for view_class in _MODULE_VIEWS.values()
+    for attr in view_class.fields
+)
@@ -6,10 +6,13 @@ Captura tráfico en AMBAS direcciones:
 - G9ED → Pedal (comandos)
 - Pedal → G9ED (respuestas)
 
-Usa ALSA sequencer para conectarse a múltiples puertos.
+Usa ALSA sequencer para conectarse a múltiples puertos. Los mensajes
+SysEx van a un único log de captura (.g9cap, ver zoomg9.capture), con la
+dirección de cada uno; con --split-files, un archivo .syx por mensaje.
 
 Uso:
     python capture_bidirectional.py --output ~/bulk_capture
+    python capture_bidirectional.py --output ~/bulk_capture --split-files
 
 Requisitos:
     pip install mido python-rtmidi
@@ -34,6 +37,8 @@ except ImportError:
     print("Instalar con: pip install mido python-rtmidi")
     sys.exit(1)
 
+from capture_log import open_capture, port_direction
+
 # Constantes
 ZOOM_MANUFACTURER = 0x52
 G9TT_MODEL = 0x42
@@ -100,11 +105,13 @@ def decode_zoom_sysex(data):
 
 
 class BidirectionalCapture:
-    def __init__(self, output_dir):
+    def __init__(self, output_dir, split_files=False):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
         self.log_file = None
+        self.split_files = split_files
+        self.capture = None
         self.start_time = None
         self.message_count = 0
         self.sysex_count = 0
@@ -166,6 +173,11 @@ class BidirectionalCapture:
         self.log_file = open(log_path, 'w')
         print(f"\nLog: {log_path}")
 
+        self.capture = open_capture(self.output_dir / f"bidirectional_{timestamp}.g9cap",
+                                    self.split_files)
+        if self.capture:
+            print(f"Captura: {self.capture.path}")
+
         return True
 
     def disconnect(self):
@@ -177,6 +189,8 @@ class BidirectionalCapture:
                 pass
         if self.log_file:
             self.log_file.close()
+        if self.capture:
+            self.capture.close()
 
     def log(self, text):
         """Escribe al log y consola (thread-safe)."""
@@ -186,12 +200,16 @@ class BidirectionalCapture:
                 self.log_file.write(text + "\n")
                 self.log_file.flush()
 
-    def save_sysex(self, data, direction, info):
-        """Guarda mensaje SysEx a archivo."""
+    def save_sysex(self, data, port_name, direction, info):
+        """Guarda mensaje SysEx en el log de captura (o a archivo)."""
         with self.lock:
             self.sysex_count += 1
             count = self.sysex_count
 
+        if self.capture:
+            self.capture.write(data, port_direction(port_name), port_name)
+            return f"{self.capture.path.name} #{count}"
+
         cmd_name = info.get("cmd_name", "unknown") if info else "raw"
         patch = info.get("patch", "") if info else ""
         patch_str = f"_p{patch:02d}" if patch != "" else ""
@@ -226,7 +244,7 @@ class BidirectionalCapture:
             info = decode_zoom_sysex(data)
 
             # Guardar archivo
-            filename = self.save_sysex(data, direction, info)
+            filename = self.save_sysex(data, port_name, direction, info)
 
             # Log
             if info:
@@ -289,7 +307,7 @@ class BidirectionalCapture:
             self.log(f"Captura finalizada: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
             self.log(f"  Duración: {time.time() - self.start_time:.1f} segundos")
             self.log(f"  Mensajes: {self.message_count}")
-            self.log(f"  Archivos SysEx: {self.sysex_count}")
+            self.log(f"  Mensajes SysEx: {self.sysex_count}")
             self.log(f"{'='*60}")
 
 
@@ -302,6 +320,8 @@ def main():
                        help="Directorio de salida")
     parser.add_argument("--list", "-l", action="store_true",
                        help="Listar puertos y conexiones ALSA")
+    parser.add_argument("--split-files", action="store_true",
+                       help="Guardar un archivo .syx por mensaje en vez del log de captura")
 
     args = parser.parse_args()
 
@@ -317,7 +337,7 @@ def main():
         print(get_alsa_connections())
         return
 
-    capture = BidirectionalCapture(args.output)
+    capture = BidirectionalCapture(args.output, split_files=args.split_files)
 
     if capture.connect():
         try:
@@ -0,0 +1,55 @@
+"""
+Log de captura (.g9cap) para las herramientas de captura.
+
+Usa zoomg9.capture de la librería (phases/02-python-library). Si la
+librería no se puede importar, open_capture() avisa por stderr,
+devuelve None y las herramientas guardan un archivo .syx por mensaje,
+igual que con --split-files.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "phases" / "02-python-library"))
+try:
+    from zoomg9.capture import CaptureWriter, DIR_RX, DIR_TX, DIR_UNKNOWN
+    _import_error = None
+except ImportError as e:
+    CaptureWriter = None
+    DIR_RX = DIR_TX = DIR_UNKNOWN = None  # Sin log de captura no se usan
+    _import_error = e
+
+
+def open_capture(path, split_files=False):
+    """
+    Crea un log de captura.
+
+    Args:
+        path: Archivo .g9cap
+        split_files: Guardar un .syx por mensaje en lugar del log
+
+    Returns:
+        CaptureWriter, o None si se guardan archivos .syx sueltos
+    """
+    if split_files:
+        return None
+    if CaptureWriter is None:
+        print(f"AVISO: no se pudo cargar zoomg9.capture ({_import_error}); "
+              f"se guarda un archivo .syx por mensaje", file=sys.stderr)
+        return None
+    return CaptureWriter(path)
+
+
+def port_direction(port_name):
+    """
+    Dirección de los mensajes que llegan por un puerto de entrada.
+
+    UM-ONE es la interfaz del pedal (pedal → computador); Wine y VirMIDI
+    son el lado de G9ED (G9ED → pedal).
+    """
+    lower = port_name.lower()
+    if "um-one" in lower:
+        return DIR_RX
+    if "wine" in lower or "virmidi" in lower:
+        return DIR_TX
+    return DIR_UNKNOWN
@@ -3,12 +3,14 @@
 Captura completa de sesión MIDI G9.2tt
 
 Captura TODO el tráfico SysEx sin truncar, ideal para analizar bulk loads.
-Guarda cada mensaje SysEx como archivo individual + log completo.
+Guarda los mensajes SysEx en un único log de captura (.g9cap, ver
+zoomg9.capture) + log de texto; con --split-files, un archivo .syx por mensaje.
 
 Uso:
     python capture_session.py                     # Captura interactiva
     python capture_session.py --port "UM-ONE"    # Puerto específico
     python capture_session.py --all-ports        # Todos los puertos
+    python capture_session.py --split-files      # Un archivo .syx por mensaje
 
 Requisitos:
     pip install mido python-rtmidi
@@ -28,6 +30,8 @@ except ImportError:
     print("Instalar con: pip install mido python-rtmidi")
     sys.exit(1)
 
+from capture_log import open_capture, port_direction
+
 # Constantes
 ZOOM_MANUFACTURER = 0x52
 G9TT_MODEL = 0x42
@@ -101,13 +105,15 @@ def format_hex(data, max_bytes=40):
 
 
 class SessionCapture:
-    def __init__(self, output_dir, ports=None):
+    def __init__(self, output_dir, ports=None, split_files=False):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
         self.ports = ports or []
         self.inputs = []
         self.log_file = None
+        self.split_files = split_files
+        self.capture = None
         self.start_time = None
         self.message_count = 0
         self.sysex_count = 0
@@ -171,6 +177,10 @@ class SessionCapture:
         self.log_file = open(log_path, 'w')
         print(f"\nLog: {log_path}")
 
+        self.capture = open_capture(self.output_dir / f"session_{timestamp}.g9cap", self.split_files)
+        if self.capture:
+            print(f"Captura: {self.capture.path}")
+
         return True
 
     def disconnect(self):
@@ -184,10 +194,17 @@ class SessionCapture:
         if self.log_file:
             self.log_file.close()
 
+        if self.capture:
+            self.capture.close()
+
     def save_sysex(self, data, port_name, info):
-        """Guarda un mensaje SysEx a archivo."""
+        """Guarda un mensaje SysEx en el log de captura (o a archivo)."""
         self.sysex_count += 1
 
+        if self.capture:
+            self.capture.write(data, port_direction(port_name), port_name)
+            return f"{self.capture.path.name} #{self.sysex_count}"
+
         # Nombre descriptivo
         cmd_name = info.get("cmd_name", "unknown") if info else "raw"
         patch = info.get("patch", "") if info else ""
@@ -265,7 +282,7 @@ class SessionCapture:
         self.log(f"Captura finalizada: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         self.log(f"  Duración: {time.time() - self.start_time:.1f} segundos")
         self.log(f"  Mensajes totales: {self.message_count}")
-        self.log(f"  Archivos SysEx: {self.sysex_count}")
+        self.log(f"  Mensajes SysEx: {self.sysex_count}")
         self.log(f"{'='*60}")
 
 
@@ -293,6 +310,8 @@ def main():
     parser.add_argument("--output", "-o", metavar="DIR",
                        default=f"/tmp/g9tt_capture_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
                        help="Directorio de salida")
+    parser.add_argument("--split-files", action="store_true",
+                       help="Guardar un archivo .syx por mensaje en vez del log de captura")
 
     args = parser.parse_args()
 
@@ -302,7 +321,7 @@ def main():
 
     ports = args.ports if not args.all_ports else None
 
-    capture = SessionCapture(args.output, ports)
+    capture = SessionCapture(args.output, ports, split_files=args.split_files)
 
     if capture.connect():
         try:
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Importación masiva de capturas .syx y .g9cap del Zoom G9.2tt
+
+Recorre archivos y directorios (recursivo), decodifica las respuestas 0x21
+en procesos paralelos (uno por núcleo por defecto) y guarda los patches en
+un PatchStore (.g9s) o una PatchLibrary SQLite (.db). Los errores (archivo
+ilegible, checksum incorrecto) se reportan por archivo sin detener el resto.
+
+Uso:
+    python g9tt_bulk_import.py <destino.g9s|destino.db> <ruta> [<ruta> ...]
+    python g9tt_bulk_import.py patches.db ../phases/01-reverse-engineering --workers 8
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "phases" / "02-python-library"))
+from zoomg9 import PatchLibrary, PatchStore, import_syx  # noqa: E402
+
+
+def progress_bar(current, total, width=40):
+    """Muestra una barra de progreso."""
+    pct = current / total
+    filled = int(width * pct)
+    bar = "=" * filled + "-" * (width - filled)
+    print(f"\r[{bar}] {current}/{total} ({pct*100:.0f}%)", end="", flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Importa capturas .syx del Zoom G9.2tt")
+    parser.add_argument("dest", help="Destino: .g9s (PatchStore) o .db (PatchLibrary)")
+    parser.add_argument("paths", nargs="+", help="Archivos .syx / .g9cap o directorios")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Procesos en paralelo (por defecto: uno por núcleo)")
+    parser.add_argument("--no-verify", action="store_true",
+                        help="No verificar los checksums")
+    args = parser.parse_args()
+
+    if args.dest.endswith(".g9s"):
+        dest = PatchStore(args.dest)
+    else:
+        dest = PatchLibrary(args.dest)
+
+    report = import_syx(args.paths, dest, workers=args.workers, verify=not args.no_verify,
+                        progress_callback=progress_bar)
+    print()
+
+    print(f"Archivos:        {report.files}")
+    print(f"Patches leídos:  {report.patches}")
+    print(f"Patches nuevos:  {report.new}")
+    print(f"Tiempo:          {report.elapsed:.2f} s")
+    if report.errors:
+        print(f"\nErrores en {len(report.errors)} archivos:")
+        for path, errors in report.errors.items():
+            for error in errors:
+                print(f"  {path}: {error}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
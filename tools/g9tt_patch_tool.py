@@ -13,6 +13,13 @@ import sys
 import argparse
 from pathlib import Path
 
+# Diff por campos con la librería zoomg9 (phases/02-python-library), si está disponible
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "phases" / "02-python-library"))
+try:
+    from zoomg9.diff import diff_patches, plan_update
+except ImportError:
+    diff_patches = plan_update = None
+
 
 # Constantes del protocolo G9.2tt
 ZOOM_MANUFACTURER = 0x52
@@ -184,6 +191,16 @@ def compare_patches(file1: str, file2: str):
     print(f"  A: {patch1['special_bytes'].hex()}")
     print(f"  B: {patch2['special_bytes'].hex()}")
 
+    if diff_patches is not None and len(decoded1) == len(decoded2) == DECODED_DATA_SIZE:
+        print("\n[Diferencias por campo]")
+        changes = diff_patches(decoded1, decoded2)
+        for change in changes:
+            live = "0x31" if change.address else "-"
+            print(f"  {change.field:<20} {change.old!s:>10} -> {change.new!s:<10} {live}")
+        if not changes:
+            print("  (idénticos)")
+        print(f"\n  Plan A -> B: {plan_update(decoded1, decoded2)}")
+
 
 def set_patch_name(input_file: str, new_name: str, output_file: str):
     """Cambia el nombre de un patch."""
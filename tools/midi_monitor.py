@@ -11,7 +11,8 @@ Uso:
     python midi_monitor.py                    # Monitor interactivo
     python midi_monitor.py --output log.txt   # Guardar a archivo
     python midi_monitor.py --sysex-only       # Solo mensajes SysEx
-    python midi_monitor.py --save-sysex dir/  # Guardar SysEx a archivos .syx
+    python midi_monitor.py --save-sysex dir/  # Guardar SysEx en dir/ (log de captura .g9cap)
+    python midi_monitor.py --save-sysex dir/ --split-files  # Un archivo .syx por mensaje
 """
 
 import argparse
@@ -28,6 +29,8 @@ except ImportError:
     print("Instalar con: pip install mido python-rtmidi")
     sys.exit(1)
 
+from capture_log import open_capture, port_direction
+
 
 def format_sysex(data: list) -> str:
     """Formatea datos SysEx para mostrar."""
@@ -129,7 +132,8 @@ def save_sysex_file(data: list, output_dir: str, counter: int) -> str:
 def monitor(port_name: str = None,
             sysex_only: bool = False,
             output_file: str = None,
-            save_sysex_dir: str = None):
+            save_sysex_dir: str = None,
+            split_files: bool = False):
     """Monitorea tráfico MIDI en tiempo real."""
 
     input_port = find_input_port(port_name)
@@ -152,6 +156,13 @@ def monitor(port_name: str = None,
     print(f"{'='*60}\n")
 
     log_file = open(output_file, 'w') if output_file else None
+    capture = None
+    if save_sysex_dir:
+        Path(save_sysex_dir).mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        capture = open_capture(Path(save_sysex_dir) / f"sysex_{timestamp}.g9cap", split_files)
+        if capture:
+            print(f"Captura: {capture.path}\n")
     sysex_counter = 0
     start_time = time.time()
     message_count = 0
@@ -174,8 +185,11 @@ def monitor(port_name: str = None,
                     log_file.write(formatted + "\n")
                     log_file.flush()
 
-                # Guardar SysEx a archivo individual
-                if save_sysex_dir and msg.type == 'sysex':
+                # Guardar SysEx al log de captura o a archivo individual
+                if capture and msg.type == 'sysex':
+                    sysex_counter += 1
+                    capture.write(msg.data, port_direction(input_port), input_port)
+                elif save_sysex_dir and msg.type == 'sysex':
                     sysex_counter += 1
                     filepath = save_sysex_file(list(msg.data), save_sysex_dir, sysex_counter)
                     print(f"         -> Guardado: {filepath}")
@@ -185,13 +199,15 @@ def monitor(port_name: str = None,
         print(f"Monitor detenido")
         print(f"Mensajes capturados: {message_count}")
         if sysex_counter > 0:
-            print(f"Archivos SysEx guardados: {sysex_counter}")
+            print(f"Mensajes SysEx guardados: {sysex_counter}")
         print(f"Duración: {time.time() - start_time:.1f} segundos")
         print(f"{'='*60}")
 
     finally:
         if log_file:
             log_file.close()
+        if capture:
+            capture.close()
 
 
 def main():
@@ -207,7 +223,9 @@ def main():
     parser.add_argument("-o", "--output", metavar="FILE",
                        help="Guardar log a archivo")
     parser.add_argument("--save-sysex", metavar="DIR",
-                       help="Guardar cada mensaje SysEx a un archivo .syx en el directorio especificado")
+                       help="Guardar los mensajes SysEx en el directorio especificado (log de captura .g9cap)")
+    parser.add_argument("--split-files", action="store_true",
+                       help="Con --save-sysex, guardar un archivo .syx por mensaje")
 
     args = parser.parse_args()
 
@@ -219,7 +237,8 @@ def main():
         port_name=args.port,
         sysex_only=args.sysex_only,
         output_file=args.output,
-        save_sysex_dir=args.save_sysex
+        save_sysex_dir=args.save_sysex,
+        split_files=args.split_files
     )
 
 
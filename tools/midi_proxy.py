@@ -13,6 +13,7 @@ Uso:
     python midi_proxy.py --list                    # Ver puertos disponibles
     python midi_proxy.py --app VirMIDI --hw UM-ONE # Iniciar proxy
     python midi_proxy.py --app VirMIDI --hw UM-ONE --output capture.log
+    python midi_proxy.py --app VirMIDI --hw UM-ONE --save-sysex dir/  # Log de captura .g9cap
 
 Requisitos:
     pip install mido python-rtmidi
@@ -34,6 +35,8 @@ except ImportError:
     print("Instalar con: pip install mido python-rtmidi")
     sys.exit(1)
 
+from capture_log import DIR_RX, DIR_TX, open_capture
+
 
 # Constantes del protocolo Zoom
 ZOOM_MANUFACTURER = 0x52
@@ -51,11 +54,14 @@ CMD_NAMES = {
 
 
 class MidiProxy:
-    def __init__(self, app_port_name, hw_port_name, output_file=None, save_sysex_dir=None):
+    def __init__(self, app_port_name, hw_port_name, output_file=None, save_sysex_dir=None,
+                 split_files=False):
         self.app_port_name = app_port_name
         self.hw_port_name = hw_port_name
         self.output_file = output_file
         self.save_sysex_dir = save_sysex_dir
+        self.split_files = split_files
+        self.capture = None
 
         self.app_in = None
         self.app_out = None
@@ -133,6 +139,11 @@ class MidiProxy:
         if self.save_sysex_dir:
             Path(self.save_sysex_dir).mkdir(parents=True, exist_ok=True)
             print(f"SysEx dir: {self.save_sysex_dir}/")
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            self.capture = open_capture(Path(self.save_sysex_dir) / f"proxy_{timestamp}.g9cap",
+                                        self.split_files)
+            if self.capture:
+                print(f"Captura: {self.capture.path}")
 
         return True
 
@@ -147,6 +158,8 @@ class MidiProxy:
 
         if self.log_file:
             self.log_file.close()
+        if self.capture:
+            self.capture.close()
 
     def format_sysex(self, data, direction):
         """Formatea un mensaje SysEx para el log."""
@@ -201,8 +214,15 @@ class MidiProxy:
         self.message_count += 1
 
     def save_sysex_file(self, data, direction):
-        """Guarda un mensaje SysEx a archivo."""
+        """Guarda un mensaje SysEx en el log de captura (o a archivo)."""
         self.sysex_counter += 1
+
+        if self.capture:
+            if direction == "APP→HW":
+                self.capture.write(data, DIR_TX, self.hw_port_name)
+            else:
+                self.capture.write(data, DIR_RX, self.hw_port_name)
+            return
         timestamp = datetime.now().strftime("%H%M%S_%f")[:-3]
 
         # Determinar nombre del comando
@@ -270,7 +290,7 @@ class MidiProxy:
             print(f"  Mensajes capturados: {self.message_count}")
             print(f"  Duración: {time.time() - self.start_time:.1f}s")
             if self.sysex_counter > 0:
-                print(f"  Archivos SysEx: {self.sysex_counter}")
+                print(f"  Mensajes SysEx: {self.sysex_counter}")
             print(f"{'='*60}")
 
 
@@ -301,7 +321,9 @@ def main():
     parser.add_argument("--output", "-o", metavar="FILE",
                        help="Archivo de log de salida")
     parser.add_argument("--save-sysex", "-s", metavar="DIR",
-                       help="Guardar cada SysEx a un archivo en el directorio")
+                       help="Guardar los SysEx en el directorio (log de captura .g9cap)")
+    parser.add_argument("--split-files", action="store_true",
+                       help="Con --save-sysex, guardar un archivo .syx por mensaje")
 
     args = parser.parse_args()
 
@@ -319,7 +341,8 @@ def main():
         app_port_name=args.app,
         hw_port_name=args.hw,
         output_file=args.output,
-        save_sysex_dir=args.save_sysex
+        save_sysex_dir=args.save_sysex,
+        split_files=args.split_files
     )
 
     if proxy.connect():